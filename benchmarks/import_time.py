@@ -0,0 +1,57 @@
+"""Guard the cold `import mlb` time
+
+Runs `import mlb` in fresh interpreters and fails (exit code 1) when the
+median wall time goes over the budget.
+
+Usage:
+------
+    python benchmarks/import_time.py [--runs N] [--budget SECONDS] [--module NAME]
+
+The budget can also be set with the `MLB_IMPORT_BUDGET` environment variable.
+"""
+import os
+import sys
+import argparse
+import statistics
+import subprocess
+
+DEFAULT_BUDGET = 0.15
+
+_SNIPPET = (
+    "import time;"
+    "t = time.perf_counter();"
+    "import {module};"
+    "print(time.perf_counter() - t)"
+)
+
+def time_import(module:str='mlb',runs:int=7) -> list[float]:
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(p for p in (root,env.get('PYTHONPATH')) if p)
+    timings = []
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable,'-c',_SNIPPET.format(module=module)],
+            env=env,capture_output=True,text=True,check=True)
+        timings.append(float(out.stdout.strip().splitlines()[-1]))
+    return timings
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs',type=int,default=7)
+    parser.add_argument('--budget',type=float,default=float(os.environ.get('MLB_IMPORT_BUDGET',DEFAULT_BUDGET)))
+    parser.add_argument('--module',default='mlb')
+    args = parser.parse_args(argv)
+
+    timings = time_import(args.module,args.runs)
+    median = statistics.median(timings)
+    print(f"import {args.module}: median {median*1000:.1f}ms "
+          f"(min {min(timings)*1000:.1f}ms, max {max(timings)*1000:.1f}ms, runs {len(timings)}) "
+          f"budget {args.budget*1000:.0f}ms")
+    if median > args.budget:
+        print(f"import {args.module} is over budget",file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -52,102 +52,136 @@ Highlights
 - License: https://raw.githubusercontent.com/joerex1418/simplestats-mlb/master/LICENSE
 
 """
-
-from .classes import Person
-from .classes import Franchise
-from .classes import Team
-from .game import Game
-from .classes import api
-franchise = Franchise
-person = Person
-team = Team
-game = Game
-
-
-from .functions import play_search
-from .functions import pitch_search
-from .functions import game_search
-# from .functions import get_matchup_stats
-from .functions import last_game
-from .functions import next_game
-from .functions import find_team
-from .functions import find_venue
-from .functions import schedule
-from .functions import scores
-from .functions import games_today
-from .functions import free_agents
-from .functions import player_bio
-from .functions import player_stats
-from .functions import player_game_logs
-from .functions import player_date_range
-from .functions import player_date_range_advanced
-from .functions import player_splits
-from .functions import player_splits_advanced
-from .functions import team_roster
-from .functions import team_game_logs
-from .functions import team_appearances
-from .functions import team_stats
-from .functions import league_stats
-from .functions import league_leaders
-from .functions import season_standings
-from .functions import game_highlights
-from .functions import get_video_link
-from .functions import league
-
-from .utils import keys
-from .utils import timeutils
-from .utils import default_season
-from .utils import metadata
-from .utils import COLS_HIT
-
-from .mlbdata import get_teams_df as teams
-from .mlbdata import get_people_df as people
-from .mlbdata import get_venues_df as venues
-from .mlbdata import get_leagues_df as leagues
-from .mlbdata import get_seasons_df as seasons
-from .mlbdata import get_standings_df as standings
-from .mlbdata import get_yby_records as yby_records
-from .mlbdata import get_hall_of_fame as hall_of_fame
-from .mlbdata import get_broadcasts_df as broadcasts
-from .mlbdata import get_pitch_types_df as pitch_types
-from .mlbdata import get_pitch_codes_df as pitch_codes
-from .mlbdata import get_bbref_data as bbref_data
-from .mlbdata import get_event_types_df as event_types
-from .mlbdata import get_bbref_hitting_war_df as bbref_war_hit
-from .mlbdata import get_bbref_pitching_war_df as bbref_war_pitch
-from .mlbdata import get_teams_from_register_df as chadwick_teams
-from .mlbdata import get_coaches as coaches
-legends = hall_of_fame
-
-from .updatedb import update_hof
-from .updatedb import update_people
-from .updatedb import update_venues
-from .updatedb import update_seasons
-from .updatedb import update_leagues
-from .updatedb import update_yby_records
-from .updatedb import update_bbref_data
-from .updatedb import update_bbref_hitting_war
-from .updatedb import update_bbref_pitching_war
-from .updatedb import update_pitch_types
-from .updatedb import update_pitch_codes
-from .updatedb import update_event_types
-from .updatedb import update_coaches
-from .updatedb import update_standings
-update_legends = update_hof
-update_bbref_batting_war = update_bbref_hitting_war
-
-from .async_mlb import fetch
-from .async_mlb import fetch_text
+import sys
+import types
+import importlib
 
 from .paths import *
 
-from . import constants
-from .mlb_dataclasses import Leagues
-
-from .objects import MlbWrapper
-from .objects import MlbDate
-from .objects import MlbDatetime
-from .objects import league_ref
-    
-    
-    
+# Public names are resolved on first access (PEP 562) so that `import mlb`
+# doesn't pull in pandas, aiohttp, bs4 or read any reference tables until
+# something actually needs them.
+#   name -> (submodule, attribute). An attribute of None means the submodule
+#   itself; a dotted attribute is looked up one part at a time
+_LAZY_ATTRS = {
+    'Person':                     ('classes', 'Person'),
+    'Franchise':                  ('classes', 'Franchise'),
+    'Team':                       ('classes', 'Team'),
+    'Game':                       ('game', 'Game'),
+    'LiveTracker':                ('live', 'LiveTracker'),
+    'api':                        ('classes', 'api'),
+    'play_search':                ('functions', 'play_search'),
+    'pitch_search':               ('functions', 'pitch_search'),
+    'game_search':                ('functions', 'game_search'),
+    'last_game':                  ('functions', 'last_game'),
+    'next_game':                  ('functions', 'next_game'),
+    'find_team':                  ('functions', 'find_team'),
+    'find_venue':                 ('functions', 'find_venue'),
+    'schedule':                   ('functions', 'schedule'),
+    'scores':                     ('functions', 'scores'),
+    'games_today':                ('functions', 'games_today'),
+    'free_agents':                ('functions', 'free_agents'),
+    'player_bio':                 ('functions', 'player_bio'),
+    'player_stats':               ('functions', 'player_stats'),
+    'player_game_logs':           ('functions', 'player_game_logs'),
+    'player_date_range':          ('functions', 'player_date_range'),
+    'player_date_range_advanced': ('functions', 'player_date_range_advanced'),
+    'player_splits':              ('functions', 'player_splits'),
+    'player_splits_advanced':     ('functions', 'player_splits_advanced'),
+    'team_roster':                ('functions', 'team_roster'),
+    'team_game_logs':             ('functions', 'team_game_logs'),
+    'team_appearances':           ('functions', 'team_appearances'),
+    'team_stats':                 ('functions', 'team_stats'),
+    'league_stats':               ('functions', 'league_stats'),
+    'league_leaders':             ('functions', 'league_leaders'),
+    'season_standings':           ('functions', 'season_standings'),
+    'game_highlights':            ('functions', 'game_highlights'),
+    'get_video_link':             ('functions', 'get_video_link'),
+    'league':                     ('functions', 'league'),
+    'search':                     ('searchindex', 'search'),
+    'keys':                       ('utils', 'keys'),
+    'timeutils':                  ('utils', 'timeutils'),
+    'default_season':             ('utils', 'default_season'),
+    'metadata':                   ('utils', 'metadata'),
+    'COLS_HIT':                   ('utils', 'COLS_HIT'),
+    'teams':                      ('mlbdata', 'get_teams_df'),
+    'people':                     ('mlbdata', 'get_people_df'),
+    'venues':                     ('mlbdata', 'get_venues_df'),
+    'leagues':                    ('mlbdata', 'get_leagues_df'),
+    'seasons':                    ('mlbdata', 'get_seasons_df'),
+    'standings':                  ('mlbdata', 'get_standings_df'),
+    'yby_records':                ('mlbdata', 'get_yby_records'),
+    'hall_of_fame':               ('mlbdata', 'get_hall_of_fame'),
+    'broadcasts':                 ('mlbdata', 'get_broadcasts_df'),
+    'pitch_types':                ('mlbdata', 'get_pitch_types_df'),
+    'pitch_codes':                ('mlbdata', 'get_pitch_codes_df'),
+    'bbref_data':                 ('mlbdata', 'get_bbref_data'),
+    'event_types':                ('mlbdata', 'get_event_types_df'),
+    'bbref_war_hit':              ('mlbdata', 'get_bbref_hitting_war_df'),
+    'bbref_war_pitch':            ('mlbdata', 'get_bbref_pitching_war_df'),
+    'chadwick_teams':             ('mlbdata', 'get_teams_from_register_df'),
+    'coaches':                    ('mlbdata', 'get_coaches'),
+    'memory_report':              ('mlbdata', 'memory_report'),
+    'update_hof':                 ('updatedb', 'update_hof'),
+    'update_people':              ('updatedb', 'update_people'),
+    'update_venues':              ('updatedb', 'update_venues'),
+    'update_seasons':             ('updatedb', 'update_seasons'),
+    'update_leagues':             ('updatedb', 'update_leagues'),
+    'update_yby_records':         ('updatedb', 'update_yby_records'),
+    'update_bbref_data':          ('updatedb', 'update_bbref_data'),
+    'update_bbref_hitting_war':   ('updatedb', 'update_bbref_hitting_war'),
+    'update_bbref_pitching_war':  ('updatedb', 'update_bbref_pitching_war'),
+    'update_pitch_types':         ('updatedb', 'update_pitch_types'),
+    'update_pitch_codes':         ('updatedb', 'update_pitch_codes'),
+    'update_event_types':         ('updatedb', 'update_event_types'),
+    'update_coaches':             ('updatedb', 'update_coaches'),
+    'update_standings':           ('updatedb', 'update_standings'),
+    'fetch':                      ('async_mlb', 'fetch'),
+    'fetch_text':                 ('async_mlb', 'fetch_text'),
+    'aio':                        ('aio', None),
+    'team_splits':                ('team_splits', None),
+    'constants':                  ('constants', None),
+    'Leagues':                    ('mlb_dataclasses', 'Leagues'),
+    'MlbWrapper':                 ('objects', 'MlbWrapper'),
+    'MlbDate':                    ('objects', 'MlbDate'),
+    'MlbDatetime':                ('objects', 'MlbDatetime'),
+    'league_ref':                 ('objects', 'league_ref'),
+    'franchise':                  ('classes', 'Franchise'),
+    'person':                     ('classes', 'Person'),
+    'team':                       ('classes', 'Team'),
+    'game':                       ('game', 'Game'),
+    'people_bulk':                ('classes', 'Person.bulk'),
+    'legends':                    ('mlbdata', 'get_hall_of_fame'),
+    'update_legends':             ('updatedb', 'update_hof'),
+    'update_bbref_batting_war':   ('updatedb', 'update_bbref_hitting_war'),
+}
+
+from . import paths as _paths
+__all__ = [n for n,v in vars(_paths).items() if not n.startswith('_') and not isinstance(v,types.ModuleType)] + list(_LAZY_ATTRS)
+del _paths
+
+def __getattr__(name):
+    try:
+        module_name, attr = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'") from None
+    module = importlib.import_module(f".{module_name}",__name__)
+    value = module
+    for part in (attr.split('.') if attr else ()):
+        value = getattr(value,part)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
+class _Package(types.ModuleType):
+    # Importing a submodule binds it on the package, which would make
+    # `mlb.game` the module instead of the `Game` class once anything runs
+    # `from .game import ...`. Keep the public name pointing at the class.
+    def __setattr__(self,name,value):
+        if name == 'game' and isinstance(value,types.ModuleType):
+            return
+        super().__setattr__(name,value)
+
+sys.modules[__name__].__class__ = _Package
@@ -0,0 +1,118 @@
+"""# mlb.aio
+
+Awaitable versions of the primary classes and top-level functions.
+
+Everything in this module is meant to be awaited from inside a running event
+loop (an aiohttp/FastAPI service, a notebook cell, etc.) and never blocks or
+re-enters that loop. All requests share the package's pooled client
+(`mlb.async_mlb.client.client`), so its connection pool, scheduler, response
+cache and request coalescing apply to every call.
+
+`Person`, `Team`, `Franchise` and `Game` (and `fetch`/`fetch_text`) are
+native coroutines. The remaining functions wrap their synchronous
+counterparts and run them in the default executor so that they don't block
+the loop.
+
+Examples
+--------
+```
+import asyncio
+import mlb.aio
+
+async def main():
+    sox, cubs = await asyncio.gather(mlb.aio.Team(145), mlb.aio.Team(112))
+    abreu = await mlb.aio.Person(547989)
+    sched = await mlb.aio.schedule(145)
+
+asyncio.run(main())
+```
+
+"""
+import asyncio
+import functools
+
+import requests
+from dateutil.parser import parse
+
+from . import classes
+from .game import Game as _Game
+from . import functions as funcs
+from .async_mlb.client import client
+from .async_mlb.fetch import fetch
+from .async_mlb.fetch_text import fetch as fetch_text
+from .utils import default_season
+
+async def Person(mlbam: int, **kwargs) -> classes.Person:
+    """Awaitable `mlb.Person`"""
+    data = await funcs._player_data_async(mlbam)
+    return classes.Person(mlbam, _data=data, **kwargs)
+
+async def people_bulk(mlbams, chunk_size=25, debut_games=False) -> dict:
+    """Awaitable `mlb.Person.bulk`"""
+    data = await funcs._people_bulk_async(mlbams, chunk_size=chunk_size, debut_games=debut_games)
+    return {mlbam: classes.Person(mlbam, _data=d) for mlbam, d in data.items()}
+
+async def Team(mlbam: int, season=None, **kwargs) -> classes.Team:
+    """Awaitable `mlb.Team`"""
+    if season is None:
+        season = default_season()
+    data = await funcs._team_data_async(int(mlbam), int(season))
+    return classes.Team(mlbam, season, _data=data, **kwargs)
+
+async def Franchise(mlbam: int) -> classes.Franchise:
+    """Awaitable `mlb.Franchise`"""
+    data = await funcs._franchise_data_async(int(mlbam))
+    return classes.Franchise(mlbam, _data=data)
+
+async def Game(game_pk, timecode=None, tz='et') -> _Game:
+    """Awaitable `mlb.Game`"""
+    if timecode == '':
+        timecode = None
+    if timecode is not None and timecode.find('_') == -1:
+        timecode = parse(timecode).strftime(r'%Y%m%d_%H%M%S')
+    params = {'hydrate':'venue,flags,preState',
+              'timecode':timecode}
+    url = requests.Request(
+        "GET",f"https://statsapi.mlb.com/api/v1.1/game/{game_pk}/feed/live?",params=params).prepare().url
+    data = await client.get_json(url)
+    return _Game(game_pk, timecode=timecode, tz=tz, _data=data)
+
+franchise = Franchise
+person = Person
+team = Team
+game = Game
+
+def _in_executor(func):
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        return await asyncio.to_thread(func, *args, **kwargs)
+    return wrapper
+
+play_search                 = _in_executor(funcs.play_search)
+pitch_search                = _in_executor(funcs.pitch_search)
+game_search                 = _in_executor(funcs.game_search)
+last_game                   = _in_executor(funcs.last_game)
+next_game                   = _in_executor(funcs.next_game)
+find_team                   = _in_executor(funcs.find_team)
+find_venue                  = _in_executor(funcs.find_venue)
+schedule                    = _in_executor(funcs.schedule)
+scores                      = _in_executor(funcs.scores)
+games_today                 = _in_executor(funcs.games_today)
+free_agents                 = _in_executor(funcs.free_agents)
+player_bio                  = _in_executor(funcs.player_bio)
+player_stats                = _in_executor(funcs.player_stats)
+player_game_logs            = _in_executor(funcs.player_game_logs)
+player_date_range           = _in_executor(funcs.player_date_range)
+player_date_range_advanced  = _in_executor(funcs.player_date_range_advanced)
+player_splits               = _in_executor(funcs.player_splits)
+player_splits_advanced      = _in_executor(funcs.player_splits_advanced)
+team_roster                 = _in_executor(funcs.team_roster)
+team_game_logs              = _in_executor(funcs.team_game_logs)
+team_appearances            = _in_executor(funcs.team_appearances)
+team_stats                  = _in_executor(funcs.team_stats)
+league_stats                = _in_executor(funcs.league_stats)
+league_leaders              = _in_executor(funcs.league_leaders)
+season_standings            = _in_executor(funcs.season_standings)
+game_highlights             = _in_executor(funcs.game_highlights)
+get_video_link              = _in_executor(funcs.get_video_link)
+league                      = _in_executor(funcs.league)
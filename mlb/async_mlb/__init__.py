@@ -1,6 +1,12 @@
 from .fetch import runit as fetch
 from .fetch_text import runit as fetch_text
 from .fetch import _determine_loop
+from .runner import run_sync
+from .runner import background_loop
 from .yby_records import runit as get_updated_records
 from .coaches import runit as fetch_coaching_roster
 from .standings import runit as fetch_standings
+from .scheduler import scheduler
+from .scheduler import PRIORITY_HIGH, PRIORITY_NORMAL, PRIORITY_BULK
+from .cache import cache
+from .dedup import dedup_report
@@ -0,0 +1,367 @@
+import os
+import re
+import json
+import time
+import zlib
+import sqlite3
+import warnings
+import hashlib
+import datetime as dt
+import threading
+from urllib.parse import urlparse, parse_qs
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from ..paths import HTTP_CACHE_DB
+from .dedup import record
+
+FOREVER = float('inf')
+
+# Endpoints that must always be fetched from the API
+NEVER_CACHE = [
+    re.compile(r'/feed/live'),
+    re.compile(r'/diffPatch'),
+    re.compile(r'/timestamps'),
+    re.compile(r'/game/\d+/'),
+]
+
+# (pattern, ttl in seconds) for responses that are not tied to a completed
+# season. The first matching pattern wins
+ENDPOINT_TTLS = [
+    (re.compile(r'/schedule'),              5 * 60),
+    (re.compile(r'/stats'),                 10 * 60),
+    (re.compile(r'/standings'),             10 * 60),
+    (re.compile(r'/roster'),                60 * 60),
+    (re.compile(r'/awards/'),               24 * 60 * 60),
+    (re.compile(r'/venues'),                24 * 60 * 60),
+    (re.compile(r'/(sports|leagues|divisions|seasons)'), 24 * 60 * 60),
+    (re.compile(r'/(baseballStats|statGroups|statTypes|leagueLeaderTypes|gameTypes|pitchTypes|pitchCodes|eventTypes)'), 7 * 24 * 60 * 60),
+]
+
+DEFAULT_TTL = 15 * 60
+
+# /schedule responses that can include games in progress (today's slate or
+# live linescores) are only reused for a few seconds
+LIVE_SCHEDULE_TTL = 10
+
+def _parse_date(value:str) -> dt.date:
+    for fmt in (r'%Y-%m-%d',r'%m/%d/%Y'):
+        try:
+            return dt.datetime.strptime(value.strip(),fmt).date()
+        except ValueError:
+            pass
+    return None
+
+def _live_schedule(url:str) -> bool:
+    params = parse_qs(urlparse(url).query)
+    dates = [_parse_date(v) for key in ('date','startDate','endDate') for v in params.get(key,[])]
+    if dates:
+        today = dt.date.today()
+        return any(d is None or d >= today for d in dates)
+    if not params.get('season'):
+        # no date or season means today's schedule
+        return True
+    return any('linescore' in v for v in params.get('hydrate',[]))
+
+def _url_seasons(url:str) -> list[int]:
+    params = parse_qs(urlparse(url).query)
+    seasons = []
+    for key in ('season','seasons'):
+        for value in params.get(key,[]):
+            for s in value.split(','):
+                if s.strip().isdigit():
+                    seasons.append(int(s))
+    return seasons
+
+def ttl_for(url:str) -> float:
+    """Number of seconds a response for `url` may be reused.
+
+    `0` means the response is never cached and `FOREVER` means it never
+    expires (any season referenced by the url has been completed)
+    """
+    path = urlparse(url).path
+    for pattern in NEVER_CACHE:
+        if pattern.search(path):
+            return 0
+    seasons = _url_seasons(url)
+    if seasons and max(seasons) < dt.date.today().year:
+        return FOREVER
+    if '/schedule' in path and _live_schedule(url):
+        return LIVE_SCHEDULE_TTL
+    for pattern, ttl in ENDPOINT_TTLS:
+        if pattern.search(path):
+            return ttl
+    return DEFAULT_TTL
+
+class ResponseCache:
+    """Compressed on-disk cache of API responses
+
+    Response bodies are zlib-compressed and stored in a SQLite database keyed
+    by a hash of the url. How long an entry is valid is decided by `ttl_for`:
+    completed seasons are kept forever, live game feeds are never stored and
+    everything else expires after a few minutes to a day depending on the
+    endpoint. When the database grows past `max_bytes` the least recently
+    used entries are evicted.
+
+    Parameters:
+    -----------
+    path : str, default mlb.paths.HTTP_CACHE_DB
+        location of the SQLite database (`$MLB_CACHE_DIR/http_cache.db`,
+        or `~/.cache/mlbstats/http_cache.db` when that isn't set)
+
+    max_bytes : int, default 256 MB
+        size cap for the compressed response bodies
+
+    enabled : bool, default True
+        set to False to bypass the cache entirely
+
+    If the database can't be opened or written (a read-only home
+    directory, a full disk, ...) the cache disables itself with a warning
+    and every request goes upstream
+    """
+    def __init__(self,path=HTTP_CACHE_DB,max_bytes=256*1024*1024,enabled=True):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+
+        self.hits = 0
+        self.misses = 0
+
+        self._conn: sqlite3.Connection = None
+        self._bytes = 0
+        self._lock = threading.RLock()
+
+    def __repr__(self):
+        return f"<ResponseCache hits={self.hits} misses={self.misses} path='{self.path}'>"
+
+    def configure(self,**kwargs):
+        """Change cache settings
+
+        Accepts the same keyword arguments as the class constructor
+        """
+        for k,v in kwargs.items():
+            if not hasattr(self,k) or k.startswith('_'):
+                raise TypeError(f"'{k}' is not a valid cache setting")
+            setattr(self,k,v)
+        if 'path' in kwargs:
+            self.close()
+        with self._lock:
+            if self._conn is not None:
+                self._evict()
+
+    def _disable(self,exc:Exception):
+        warnings.warn(f"response cache disabled, '{self.path}' is not usable: {exc}",RuntimeWarning,stacklevel=3)
+        self.enabled = False
+        self.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            folder = os.path.dirname(self.path)
+            if folder:
+                os.makedirs(folder,exist_ok=True)
+            conn = sqlite3.connect(self.path,check_same_thread=False,isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    url TEXT NOT NULL,
+                    headers TEXT,
+                    body BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    stored REAL NOT NULL,
+                    expires REAL,
+                    accessed REAL NOT NULL
+                )""")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses (accessed)")
+            self._bytes = conn.execute("SELECT COALESCE(SUM(size),0) FROM responses").fetchone()[0]
+            self._conn = conn
+        return self._conn
+
+    @staticmethod
+    def _key(url:str) -> str:
+        return hashlib.sha1(url.encode()).hexdigest()
+
+    def get(self,url:str):
+        """Return `(headers, body)` for a fresh cached response or `None`"""
+        if not self.enabled or ttl_for(url) == 0:
+            return None
+        key = self._key(url)
+        now = time.time()
+        with self._lock:
+            try:
+                conn = self._connect()
+                row = conn.execute(
+                    "SELECT headers, body, expires FROM responses WHERE key=?",(key,)).fetchone()
+                if row is None or (row[2] is not None and row[2] < now):
+                    self.misses += 1
+                    return None
+                conn.execute("UPDATE responses SET accessed=? WHERE key=?",(now,key))
+            except (OSError, sqlite3.Error) as exc:
+                self._disable(exc)
+                return None
+            self.hits += 1
+        headers = json.loads(row[0]) if row[0] else {}
+        return headers, zlib.decompress(row[1])
+
+    def set(self,url:str,headers:dict,body:bytes):
+        """Store a response body (if the url is cacheable)"""
+        if not self.enabled:
+            return
+        ttl = ttl_for(url)
+        if ttl == 0:
+            return
+        now = time.time()
+        expires = None if ttl == FOREVER else now + ttl
+        blob = zlib.compress(body)
+        key = self._key(url)
+        # bodies are stored decoded so the transfer headers no longer apply
+        headers = {k:v for k,v in dict(headers or {}).items()
+                   if k.lower() not in ('content-encoding','content-length','transfer-encoding')}
+        with self._lock:
+            try:
+                conn = self._connect()
+                old = conn.execute("SELECT size FROM responses WHERE key=?",(key,)).fetchone()
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?,?,?,?,?,?,?,?)",
+                    (key,url,json.dumps(headers),blob,len(blob),now,expires,now))
+                self._bytes += len(blob) - (old[0] if old else 0)
+                if self._bytes > self.max_bytes:
+                    self._evict()
+            except (OSError, sqlite3.Error) as exc:
+                self._disable(exc)
+
+    def _evict(self):
+        conn = self._conn
+        conn.execute("DELETE FROM responses WHERE expires IS NOT NULL AND expires < ?",(time.time(),))
+        self._bytes = conn.execute("SELECT COALESCE(SUM(size),0) FROM responses").fetchone()[0]
+        if self._bytes <= self.max_bytes:
+            return
+        # trim to 90% of the cap so that eviction doesn't run on every insert
+        target = self.max_bytes * 0.9
+        removed = 0
+        keys = []
+        for key, size in conn.execute("SELECT key, size FROM responses ORDER BY accessed"):
+            if self._bytes - removed <= target:
+                break
+            keys.append((key,))
+            removed += size
+        conn.executemany("DELETE FROM responses WHERE key=?",keys)
+        self._bytes -= removed
+
+    def clear(self):
+        """Delete every cached response and reset the counters"""
+        with self._lock:
+            try:
+                conn = self._connect()
+                conn.execute("DELETE FROM responses")
+                conn.execute("VACUUM")
+            except (OSError, sqlite3.Error) as exc:
+                self._disable(exc)
+            self._bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        """Hit/miss counters and current size of the cache"""
+        with self._lock:
+            entries = 0
+            if self.enabled:
+                try:
+                    entries = self._connect().execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+                except (OSError, sqlite3.Error) as exc:
+                    self._disable(exc)
+            size = self._bytes
+        lookups = self.hits + self.misses
+        return {
+            'hits':self.hits,
+            'misses':self.misses,
+            'hit_rate':(self.hits / lookups) if lookups else 0.0,
+            'entries':entries,
+            'bytes':size,
+            'max_bytes':self.max_bytes,
+            'enabled':self.enabled,
+        }
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+class CachedSession(requests.Session):
+    """`requests.Session` that answers GET requests from a `ResponseCache`
+
+    Threads requesting a url that another thread is already downloading wait
+    for that response instead of sending their own
+    """
+    def __init__(self,response_cache:ResponseCache):
+        super().__init__()
+        self.response_cache = response_cache
+        self._inflight: dict[str,list] = {}
+        self._inflight_lock = threading.Lock()
+
+    def _cached_response(self,url:str):
+        cached = self.response_cache.get(url)
+        if cached is None:
+            return None
+        headers, body = cached
+        resp = requests.Response()
+        resp.status_code = 200
+        resp.reason = 'OK'
+        resp.url = url
+        resp.headers = CaseInsensitiveDict(headers)
+        resp.encoding = 'utf-8'
+        resp._content = body
+        return resp
+
+    @staticmethod
+    def _copy_response(resp:requests.Response) -> requests.Response:
+        copy = requests.Response()
+        copy.status_code = resp.status_code
+        copy.reason = resp.reason
+        copy.url = resp.url
+        copy.headers = CaseInsensitiveDict(resp.headers)
+        copy.encoding = resp.encoding
+        copy._content = resp.content
+        return copy
+
+    def request(self,method,url,params=None,**kwargs):
+        if method.upper() != 'GET' or kwargs.get('stream'):
+            return super().request(method,url,params=params,**kwargs)
+        full_url = requests.Request(method,url,params=params).prepare().url
+        record('requested',full_url)
+        with self._inflight_lock:
+            flight = self._inflight.get(full_url)
+            leader = flight is None
+            if leader:
+                # [done, leader's response]
+                flight = self._inflight[full_url] = [threading.Event(),None]
+        if not leader:
+            flight[0].wait()
+            # responses that can't be cached (live feeds, errors) are
+            # handed over in memory
+            resp = flight[1]
+            if resp is not None:
+                record('coalesced')
+                return self._copy_response(resp)
+        try:
+            resp = self._cached_response(full_url)
+            if resp is not None:
+                record('cached')
+            else:
+                record('upstream')
+                resp = super().request(method,url,params=params,**kwargs)
+                if resp.status_code == 200:
+                    self.response_cache.set(full_url,resp.headers,resp.content)
+            if leader:
+                flight[1] = resp
+            return resp
+        finally:
+            if leader:
+                with self._inflight_lock:
+                    self._inflight.pop(full_url,None)
+                flight[0].set()
+
+cache = ResponseCache()
@@ -0,0 +1,220 @@
+import json
+import atexit
+import asyncio
+import threading
+import weakref
+
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+
+from .cache import cache
+from .cache import ttl_for
+from .cache import CachedSession
+from .scheduler import scheduler
+from .scheduler import PRIORITY_NORMAL
+from .dedup import record
+
+def _is_current_loop(loop) -> bool:
+    try:
+        return asyncio.get_running_loop() is loop
+    except RuntimeError:
+        return False
+
+class FetchedResponse:
+    def __init__(self,_url,_headers,_json) -> None:
+        self.url: str = _url
+        self.headers: dict = _headers
+        self.json: dict = _json
+
+    def __getitem__(self,key):
+        return self.json[key]
+
+    def get(self,key,default=None):
+        return self.json.get(key,default)
+
+# request kwargs that don't change the response, so requests differing
+# only in them still share one upstream call
+_SHARED_KWARGS = ('ssl',)
+
+def _inflight_key(url:str,kwargs:dict) -> tuple:
+    # headers/params/timeouts can change the response, so they are part of
+    # the key (repr'd, since they are usually dicts)
+    return (url,tuple(sorted((k,repr(v)) for k,v in kwargs.items() if k not in _SHARED_KWARGS)))
+
+class Client:
+    """Process-wide HTTP client for the MLB Stats API
+
+    Every fetcher in the package borrows its connections from a single
+    instance of this class (`mlb.async_mlb.client.client`) so that the
+    TCP/TLS handshakes to statsapi.mlb.com are paid once per process instead
+    of once per `Person()`, `Team()` or `Franchise()`.
+
+    An `aiohttp.ClientSession` is kept for each event loop that makes a
+    request (sessions cannot be shared across loops) and a single pooled
+    `requests.Session` is kept for the synchronous functions. Both answer
+    GET requests from the on-disk response cache (`mlb.async_mlb.cache.cache`)
+    when possible.
+
+    Parameters:
+    -----------
+    limit : int, default 100
+        total number of simultaneous connections held by the connector
+
+    limit_per_host : int, default 30
+        number of simultaneous connections to a single host (this is also the
+        size of the `requests` connection pool)
+
+    keepalive_timeout : float, default 30
+        seconds that an idle connection is kept open for reuse
+
+    ttl_dns_cache : int, default 300
+        seconds that resolved host names are cached
+
+    timeout : float, default 60
+        total number of seconds allowed for a single request
+
+    """
+    def __init__(
+        self,
+        limit=100,
+        limit_per_host=30,
+        keepalive_timeout=30.0,
+        ttl_dns_cache=300,
+        timeout=60.0):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.ttl_dns_cache = ttl_dns_cache
+        self.timeout = timeout
+
+        self._sessions: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._inflight: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._http: requests.Session = None
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"<Client limit={self.limit} limit_per_host={self.limit_per_host} sessions={len(self._sessions)}>"
+
+    def configure(self,**kwargs):
+        """Change connector settings. Open sessions are closed so that the
+        next request picks up the new values.
+
+        Accepts the same keyword arguments as the class constructor
+        """
+        for k,v in kwargs.items():
+            if not hasattr(self,k) or k.startswith('_'):
+                raise TypeError(f"'{k}' is not a valid client setting")
+            setattr(self,k,v)
+        self.close()
+
+    async def session(self) -> aiohttp.ClientSession:
+        """Get the shared `aiohttp.ClientSession` for the running event loop"""
+        loop = asyncio.get_running_loop()
+        session: aiohttp.ClientSession = self._sessions.get(loop)
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=self.ttl_dns_cache)
+            session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout))
+            self._sessions[loop] = session
+        return session
+
+    @property
+    def http(self) -> requests.Session:
+        """Shared (pooled) `requests.Session` for synchronous calls"""
+        if self._http is None:
+            with self._lock:
+                if self._http is None:
+                    sesh = CachedSession(cache)
+                    adapter = HTTPAdapter(
+                        pool_connections=10,
+                        pool_maxsize=self.limit_per_host)
+                    sesh.mount('https://',adapter)
+                    sesh.mount('http://',adapter)
+                    self._http = sesh
+        return self._http
+
+    async def _read(self,url:str,**kwargs) -> tuple[str,dict,bytes]:
+        # the cache is SQLite + zlib, so it is kept off the event loop and
+        # not consulted at all for urls it never stores (live feeds)
+        cacheable = cache.enabled and ttl_for(url) != 0
+        if cacheable:
+            cached = await asyncio.to_thread(cache.get,url)
+            if cached is not None:
+                record('cached')
+                headers, body = cached
+                return url, headers, body
+        record('upstream')
+        session = await self.session()
+        async with session.get(url,**kwargs) as response:
+            body = await response.read()
+            headers = dict(response.headers)
+            if cacheable and response.status == 200:
+                await asyncio.to_thread(cache.set,url,headers,body)
+            return str(response.url), headers, body
+
+    async def _fetch(self,url:str,priority:int,**kwargs) -> tuple[str,dict,bytes]:
+        # Identical urls requested while one is already in flight share that
+        # request instead of going upstream again
+        record('requested',url)
+        loop = asyncio.get_running_loop()
+        inflight: dict = self._inflight.get(loop)
+        if inflight is None:
+            inflight = self._inflight[loop] = {}
+        key = _inflight_key(url,kwargs)
+        task = inflight.get(key)
+        if task is not None:
+            record('coalesced')
+        else:
+            task = loop.create_task(scheduler.run(self._read,url,url=url,priority=priority,**kwargs))
+            inflight[key] = task
+            task.add_done_callback(lambda t: inflight.pop(key,None) if inflight.get(key) is t else None)
+        return await asyncio.shield(task)
+
+    async def get(self,url:str,priority:int=PRIORITY_NORMAL,**kwargs) -> FetchedResponse:
+        """Request a url and return the decoded JSON as a `FetchedResponse`
+
+        The request waits for a slot from `mlb.async_mlb.scheduler.scheduler`;
+        `priority` is one of the `PRIORITY_*` constants in that module. If the
+        same url is already being requested, the response is shared with it
+        (each caller still gets its own decoded copy)
+        """
+        resp_url, headers, body = await self._fetch(url,priority,**kwargs)
+        return FetchedResponse(resp_url,headers,json.loads(body) if body else None)
+
+    async def get_json(self,url:str,priority:int=PRIORITY_NORMAL,**kwargs):
+        """Request a url and return the decoded JSON"""
+        return (await self.get(url,priority=priority,**kwargs)).json
+
+    async def get_text(self,url:str,priority:int=PRIORITY_NORMAL,**kwargs) -> str:
+        """Request a url and return the response body as a string"""
+        resp_url, headers, body = await self._fetch(url,priority,**kwargs)
+        return body.decode('utf-8',errors='replace')
+
+    def close(self):
+        """Close every open session. New ones are created on the next request"""
+        with self._lock:
+            if self._http is not None:
+                self._http.close()
+                self._http = None
+        for loop, session in list(self._sessions.items()):
+            if session.closed or loop.is_closed():
+                continue
+            if not loop.is_running():
+                loop.run_until_complete(session.close())
+            elif not _is_current_loop(loop):
+                # e.g. the background loop used by the sync API
+                try:
+                    asyncio.run_coroutine_threadsafe(session.close(),loop).result(5)
+                except Exception:
+                    pass
+        self._sessions.clear()
+
+client = Client()
+
+atexit.register(client.close)
@@ -1,17 +1,26 @@
 import asyncio
-import aiohttp
 from urllib.parse import urlparse, parse_qs
 
 import pandas as pd
 
 from ..mlbdata import get_teams_df
+from .. import refindex
+from .client import client
+from .scheduler import PRIORITY_BULK
+from .client import FetchedResponse
+from .runner import run_sync
 
-TEAMS = get_teams_df().sort_values(by='season',ascending=False)
+def __getattr__(name):
+    if name == 'TEAMS':
+        return get_teams_df().sort_values(by='season',ascending=False)
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
 
 def roster_json_to_df(rosters_list:list[dict]):
     data = []
     for roster_dict in rosters_list:
         try:
+            if len(roster_dict['roster']) == 0:
+                raise KeyError('roster')
             for entry in roster_dict['roster']:
                 entry: dict
                 person = entry.pop('person',{})
@@ -32,8 +41,8 @@ def roster_json_to_df(rosters_list:list[dict]):
     df = pd.DataFrame(data)
     return df
 
-async def parse_data(response:aiohttp.ClientResponse):
-    url_components = urlparse(str(response.url))
+async def parse_data(response:FetchedResponse):
+    url_components = urlparse(response.url)
     path = url_components.path
     params = parse_qs(url_components.query)
     
@@ -43,29 +52,55 @@ async def parse_data(response:aiohttp.ClientResponse):
     mlbam = path[first_slash_idx+1:last_slash_idx]
     season = params['season'][0]
     
-    team_row = TEAMS[(TEAMS['mlbam']==int(mlbam)) & (TEAMS['season']==int(season))].iloc[0]
+    team_row = refindex.team(mlbam,season)
     
-    roster: dict = await response.json()
+    roster: dict = response.json
     roster['season'] = int(season)
     roster['team_mlbam'] = roster.pop('teamId')
     roster['team_name'] = team_row['name_full']
     
     return roster
 
-async def fetch_coaches():
+async def fetch_coaches(team_seasons=None,return_failed=False):
+    """Fetch coaching rosters
+
+    Parameters:
+    -----------
+    team_seasons : list[tuple[int,int]], optional
+        (team mlbam, season) pairs to fetch. Default: every team-season in
+        teams.csv
+
+    return_failed : bool, default False
+        if True, return `(rosters, failed)` where `failed` lists the pairs
+        whose request failed instead of raising on the first failure
+
+    """
+    if team_seasons is None:
+        teams = get_teams_df().sort_values(by='season',ascending=False)
+        team_seasons = list(zip(teams['mlbam'],teams['season']))
+    tasks = []
+    for mlbam, season in team_seasons:
+        url = f'https://statsapi.mlb.com/api/v1/teams/{mlbam}/coaches?season={season}'
+        tasks.append(client.get(url,priority=PRIORITY_BULK,ssl=False))
+    client_responses = await asyncio.gather(*tasks,return_exceptions=return_failed)
+
     parsed_responses = []
-    async with aiohttp.ClientSession() as sesh:
-        tasks = []
-        for idx,row in TEAMS.iterrows():
-            mlbam, season = (row['mlbam'], row['season'])
-            url = f'https://statsapi.mlb.com/api/v1/teams/{mlbam}/coaches?season={season}'
-            tasks.append(sesh.get(url,ssl=False))
-        client_responses = await asyncio.gather(*tasks)
-        for response in client_responses:
+    failed = []
+    for pair, response in zip(team_seasons,client_responses):
+        if isinstance(response,BaseException):
+            failed.append(pair)
+            continue
+        try:
             parsed_responses.append(await parse_data(response))
-            
+        except Exception:
+            if not return_failed:
+                raise
+            failed.append(pair)
+
+    if return_failed:
+        return parsed_responses, failed
     return parsed_responses
 
-def runit():
-    retrieved = asyncio.run(fetch_coaches())
+def runit(**kwargs):
+    retrieved = run_sync(fetch_coaches(**kwargs))
     return retrieved
\ No newline at end of file
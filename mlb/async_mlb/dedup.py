@@ -0,0 +1,87 @@
+import contextlib
+import contextvars
+from collections import Counter
+
+class DedupReport:
+    """Summary of the requests made inside a `dedup_report()` block
+
+    Attributes:
+    -----------
+    requested : int
+        number of requests asked for by the calling code
+
+    coalesced : int
+        requests that were answered by an identical request already in flight
+
+    cached : int
+        requests that were answered by the on-disk response cache
+
+    upstream : int
+        requests that actually went to the API
+
+    urls : collections.Counter
+        number of times each url was requested
+
+    """
+    def __init__(self):
+        self.requested = 0
+        self.coalesced = 0
+        self.cached = 0
+        self.upstream = 0
+        self.urls = Counter()
+
+    def __repr__(self):
+        return (f"<DedupReport requested={self.requested} coalesced={self.coalesced} "
+                f"cached={self.cached} upstream={self.upstream}>")
+
+    @property
+    def duplicates(self) -> dict:
+        """Urls that were requested more than once and how many times"""
+        return {url:n for url,n in self.urls.items() if n > 1}
+
+    @property
+    def saved(self) -> int:
+        """Number of requests that did not reach the API"""
+        return self.requested - self.upstream
+
+    def summary(self) -> dict:
+        return {
+            'requested':self.requested,
+            'coalesced':self.coalesced,
+            'cached':self.cached,
+            'upstream':self.upstream,
+            'saved':self.saved,
+            'duplicate_urls':len(self.duplicates),
+        }
+
+_current_report: contextvars.ContextVar = contextvars.ContextVar('dedup_report',default=None)
+
+def current_report() -> DedupReport:
+    """The report for the enclosing `dedup_report()` block (or `None`)"""
+    return _current_report.get()
+
+def record(field:str,url:str=None):
+    report = _current_report.get()
+    if report is None:
+        return
+    setattr(report,field,getattr(report,field) + 1)
+    if url is not None:
+        report.urls[url] += 1
+
+@contextlib.contextmanager
+def dedup_report():
+    """Collect a `DedupReport` for every request made inside the block
+
+    Example:
+    --------
+    >>> with mlb.async_mlb.dedup_report() as report:
+    ...     teams = [mlb.Team(mlbam) for mlbam in team_ids]
+    >>> report.summary()
+
+    """
+    report = DedupReport()
+    token = _current_report.set(report)
+    try:
+        yield report
+    finally:
+        _current_report.reset(token)
@@ -1,38 +1,24 @@
-import lxml
 import asyncio
-import aiohttp
-from bs4 import BeautifulSoup as bs
-import nest_asyncio
-nest_asyncio.apply()
 
 import time
-# import pandas as pd
 
-async def fetch(urls:list):
-    retrieved_responses = []
-    async with aiohttp.ClientSession() as session:
-        tasks = []
-        for url in urls:
-            tasks.append(session.get(url, ssl=True))
+from .client import client
+from .scheduler import PRIORITY_NORMAL
+from .runner import run_sync
 
-        responses = await asyncio.gather(*tasks)
-        
-        for response in responses:
-            
-            resp = await response.text()
+async def fetch(urls:list,priority:int=PRIORITY_NORMAL):
+    tasks = []
+    for url in urls:
+        tasks.append(client.get_text(url, priority=priority, ssl=True))
 
-            retrieved_responses.append(resp)
-        
-        await session.close()
+    retrieved_responses = await asyncio.gather(*tasks)
     
-    return retrieved_responses
+    return list(retrieved_responses)
 
-def runit(urls:list,_log=False):
+def runit(urls:list,_log=False,priority:int=PRIORITY_NORMAL):
     start = time.time()
-    # retrieved = asyncio.run(fetch(urls))
 
-    loop = asyncio.get_event_loop()
-    retrieved = loop.run_until_complete(fetch(urls))
+    retrieved = run_sync(fetch(urls,priority=priority))
     
     if _log is True:
         print(f"--- {time.time() - start } seconds ---")
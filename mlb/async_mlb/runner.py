@@ -0,0 +1,81 @@
+import asyncio
+import threading
+import concurrent.futures
+
+class BackgroundLoop:
+    """Event loop running forever on a dedicated daemon thread
+
+    The synchronous API (`mlb.Person`, `mlb.Team`, `mlb.fetch`, ...) submits
+    its coroutines to this loop and waits on the result, so it can be called
+    from any number of threads (or from inside another running event loop)
+    while every request shares the loop's single connection pool.
+
+    The thread is started on first use.
+    """
+    def __init__(self):
+        self._loop: asyncio.AbstractEventLoop = None
+        self._thread: threading.Thread = None
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        running = self._thread is not None and self._thread.is_alive()
+        return f"<BackgroundLoop running={running}>"
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        if self._loop is None or self._loop.is_closed():
+            with self._lock:
+                if self._loop is None or self._loop.is_closed():
+                    loop = asyncio.new_event_loop()
+                    started = threading.Event()
+                    thread = threading.Thread(
+                        target=self._run,args=(loop,started),
+                        name='mlb-event-loop',daemon=True)
+                    thread.start()
+                    started.wait()
+                    self._loop, self._thread = loop, thread
+        return self._loop
+
+    @staticmethod
+    def _run(loop:asyncio.AbstractEventLoop,started:threading.Event):
+        asyncio.set_event_loop(loop)
+        loop.call_soon(started.set)
+        loop.run_forever()
+
+    def in_loop_thread(self) -> bool:
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def run(self,coro,timeout=None):
+        """Run `coro` on the background loop and block until it finishes
+
+        Context variables of the calling thread (e.g. an active
+        `dedup_report()`) are visible to the coroutine
+        """
+        if self.in_loop_thread():
+            coro.close()
+            raise RuntimeError("cannot wait for a coroutine from the mlb event loop thread; await it instead")
+        future: concurrent.futures.Future = asyncio.run_coroutine_threadsafe(coro,self.loop)
+        try:
+            return future.result(timeout)
+        except BaseException:
+            future.cancel()
+            raise
+
+    def stop(self):
+        """Stop the loop and wait for the thread to exit"""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop, self._thread = None, None
+        if loop is None or loop.is_closed():
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(5)
+        if not loop.is_running():
+            loop.close()
+
+background_loop = BackgroundLoop()
+
+def run_sync(coro,timeout=None):
+    """Run a coroutine to completion from synchronous code (any thread)"""
+    return background_loop.run(coro,timeout)
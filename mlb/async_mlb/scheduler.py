@@ -0,0 +1,169 @@
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+import weakref
+from urllib.parse import urlparse
+
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 1
+PRIORITY_BULK = 2
+
+class TokenBucket:
+    """Token-bucket rate limiter
+
+    Tokens are reserved up front (the balance may go negative) so that
+    waiters are released in the order they arrived without polling. The
+    bucket is guarded by a thread lock and can be shared by several event
+    loops.
+
+    Parameters:
+    -----------
+    rate : float
+        tokens added per second. A rate of `None` or `0` disables limiting
+
+    burst : int
+        maximum number of tokens the bucket can hold
+
+    """
+    def __init__(self,rate:float,burst:int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token and return the number of seconds to wait before using it"""
+        if not self.rate:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    async def acquire(self):
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+class _LoopState:
+    def __init__(self):
+        self.in_flight = 0
+        self.waiters = []
+
+class Scheduler:
+    """Bounded-concurrency scheduler for API requests
+
+    Every request made through `mlb.async_mlb.client.client` passes through
+    the module-level instance of this class (`mlb.async_mlb.scheduler.scheduler`).
+    At most `max_in_flight` requests run at once on an event loop; when the
+    limit is reached, waiting requests are started in priority order
+    (`PRIORITY_HIGH` first, `PRIORITY_BULK` last) and first-come-first-served
+    within a priority. Each host additionally gets a token bucket so that
+    large fan-outs (coaching staffs, standings since 1876, etc.) cannot exceed
+    `rate` requests per second.
+
+    Parameters:
+    -----------
+    max_in_flight : int, default 24
+        number of requests allowed to run at the same time (per event loop)
+
+    rate : float, default 50
+        requests per second allowed to a single host. `None` disables the
+        rate limit
+
+    burst : int, default 50
+        number of requests that may be sent to a host back-to-back before
+        the rate limit applies
+
+    """
+    def __init__(self,max_in_flight=24,rate=50.0,burst=50):
+        self.max_in_flight = max_in_flight
+        self.rate = rate
+        self.burst = burst
+
+        self._states: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._buckets: dict[str,TokenBucket] = {}
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"<Scheduler max_in_flight={self.max_in_flight} rate={self.rate} burst={self.burst}>"
+
+    def configure(self,**kwargs):
+        """Change scheduler settings
+
+        Accepts the same keyword arguments as the class constructor
+        """
+        for k,v in kwargs.items():
+            if not hasattr(self,k) or k.startswith('_'):
+                raise TypeError(f"'{k}' is not a valid scheduler setting")
+            setattr(self,k,v)
+        with self._lock:
+            self._buckets.clear()
+
+    def _state(self) -> _LoopState:
+        loop = asyncio.get_running_loop()
+        state = self._states.get(loop)
+        if state is None:
+            state = self._states[loop] = _LoopState()
+        return state
+
+    def _bucket(self,host:str) -> TokenBucket:
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.setdefault(host,TokenBucket(self.rate,self.burst))
+        return bucket
+
+    async def _acquire_slot(self,state:_LoopState,priority:int):
+        if state.in_flight < self.max_in_flight and not state.waiters:
+            state.in_flight += 1
+            return
+        fut = asyncio.get_running_loop().create_future()
+        heapq.heappush(state.waiters,(priority,next(self._counter),fut))
+        try:
+            await fut
+        except asyncio.CancelledError:
+            # the slot may have been handed over right before cancellation
+            if fut.done() and not fut.cancelled():
+                self._release_slot(state)
+            raise
+
+    def _release_slot(self,state:_LoopState):
+        while state.waiters:
+            _, _, fut = heapq.heappop(state.waiters)
+            if not fut.done():
+                # hand the slot straight to the next waiter
+                fut.set_result(None)
+                return
+        state.in_flight -= 1
+
+    async def run(self,coro_func,*args,url:str=None,priority:int=PRIORITY_NORMAL,**kwargs):
+        """Await `coro_func(*args, **kwargs)` once a slot (and, if `url` is
+        given, a token for the url's host) is available
+        """
+        state = self._state()
+        await self._acquire_slot(state,priority)
+        try:
+            if url is not None:
+                await self._bucket(urlparse(url).netloc).acquire()
+            return await coro_func(*args,**kwargs)
+        finally:
+            self._release_slot(state)
+
+    def stats(self) -> dict:
+        """Number of running and queued requests on the current event loop"""
+        try:
+            state = self._state()
+        except RuntimeError:
+            return {'in_flight':0,'queued':0}
+        return {'in_flight':state.in_flight,'queued':len(state.waiters)}
+
+scheduler = Scheduler()
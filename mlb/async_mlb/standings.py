@@ -1,6 +1,5 @@
 import time
 import asyncio
-import aiohttp
 import datetime as dt
 from urllib.parse import urlparse, parse_qs
 from requests import Request
@@ -8,6 +7,11 @@ from requests import Request
 import pandas as pd
 import numpy as np
 
+from .client import client
+from .scheduler import PRIORITY_BULK
+from .client import FetchedResponse
+from .runner import run_sync
+
 div_record_label = {200:'vs_west', 201:'vs_east', 202:'vs_central',
                     203:'vs_west', 204:'vs_east', 205:'vs_central'}
 
@@ -37,12 +41,12 @@ def get_league_label_name(league_mlbam:int, division_mlbam:int):
 
 
 
-async def parse_data(response:aiohttp.ClientResponse,**kwargs):
-    url_components = urlparse(str(response.url))
+async def parse_data(response:FetchedResponse,**kwargs):
+    url_components = urlparse(response.url)
     params = parse_qs(url_components.query)
     season = params['season'][0]
 
-    standings_json: dict = await response.json()
+    standings_json: dict = response.json
     
     data = []
     for record in standings_json.get('records',[{}]):
@@ -119,24 +123,27 @@ async def fetch_standings(**kwargs):
     
     dfs = []
     
-    async with aiohttp.ClientSession() as sesh:
-        tasks = []
-        for season in range(1876,dt.datetime.today().year + 1):
-            params['season'] = str(season)
-            url = Request("GET",base_url,params=params).prepare().url
-            if kwargs.get('log'):
-                print(url)
-            tasks.append(sesh.get(url))
-        client_responses = await asyncio.gather(*tasks)
-        for response in client_responses:
-            dfs.append(await parse_data(response,**kwargs))
+    seasons = kwargs.get('seasons')
+    if seasons is None:
+        seasons = range(1876,dt.datetime.today().year + 1)
+
+    tasks = []
+    for season in seasons:
+        params['season'] = str(season)
+        url = Request("GET",base_url,params=params).prepare().url
+        if kwargs.get('log'):
+            print(url)
+        tasks.append(client.get(url,priority=PRIORITY_BULK))
+    client_responses = await asyncio.gather(*tasks)
+    for response in client_responses:
+        dfs.append(await parse_data(response,**kwargs))
     
     df = pd.concat(dfs)
     return df
 
 def runit(**kwargs):
     start = time.time()
-    retrieved = asyncio.run(fetch_standings(**kwargs))
+    retrieved = run_sync(fetch_standings(**kwargs))
     if kwargs.get("log"):
         print(f'-- {time.time() - start} seconds --')
     return retrieved
\ No newline at end of file
@@ -1,10 +1,11 @@
 import asyncio
-import aiohttp
 import pandas as pd
 # import time
 # from pprint import pprint
 
 from ..constants import BASE
+from .client import client
+from .runner import run_sync
 from ..constants import HITTING_CATEGORIES
 from ..constants import PITCHING_CATEGORIES
 from ..constants import FIELDING_CATEGORIES
@@ -610,32 +611,30 @@ async def get_team_responses(mlbam,season):
     p_cats = ",".join(PITCHING_CATEGORIES)
     f_cats = ",".join(FIELDING_CATEGORIES)
 
-    async with aiohttp.ClientSession() as session:
+    endpoints = {
+        "team stats":   f"/teams/{mlbam}/stats?stats={statTypes}&group={statGroups}&season={season}",
+        "roster stats": f"/teams/{mlbam}/roster?rosterType=fullSeason&hydrate={roster_hydrations}",
+        "game log":     f"/schedule?&hydrate={log_hydrations}&season={season}&sportId=1&teamId={mlbam}&gameType=R",
+        "game stats":   f"/teams/{mlbam}/stats?stats=gameLog&group={statGroups}&season={season}",
+        "hit_leaders": leader_ep + f"{h_cats}&statType=season&teamId={mlbam}&gameType=R&season={season}&statGroup=hitting&limit=1000&playerPool=all",
+        "pitch_leaders": leader_ep + f"{p_cats}&statType=season&teamId={mlbam}&gameType=R&season={season}&statGroup=pitching&limit=1000&playerPool=all",
+        "field_leaders": leader_ep + f"{f_cats}&statType=season&teamId={mlbam}&gameType=R&season={season}&statGroup=fielding&limit=1000&playerPool=all",
+        "transactions": f"/transactions?teamId={mlbam}&startDate=1/1/{season}&endDate=12/1/{season}",
+        "draft":        f"/draft/{season}?teamId={mlbam}"
+        # "retired nums": f"/awards/RETIREDUNI_{mlbam}/recipients?sportId=1&hydrate=results",
         
-        endpoints = {
-            "team stats":   f"/teams/{mlbam}/stats?stats={statTypes}&group={statGroups}&season={season}",
-            "roster stats": f"/teams/{mlbam}/roster?rosterType=fullSeason&hydrate={roster_hydrations}",
-            "game log":     f"/schedule?&hydrate={log_hydrations}&season={season}&sportId=1&teamId={mlbam}&gameType=R",
-            "game stats":   f"/teams/{mlbam}/stats?stats=gameLog&group={statGroups}&season={season}",
-            "hit_leaders": leader_ep + f"{h_cats}&statType=season&teamId={mlbam}&gameType=R&season={season}&statGroup=hitting&limit=1000&playerPool=all",
-            "pitch_leaders": leader_ep + f"{p_cats}&statType=season&teamId={mlbam}&gameType=R&season={season}&statGroup=pitching&limit=1000&playerPool=all",
-            "field_leaders": leader_ep + f"{f_cats}&statType=season&teamId={mlbam}&gameType=R&season={season}&statGroup=fielding&limit=1000&playerPool=all",
-            "transactions": f"/transactions?teamId={mlbam}&startDate=1/1/{season}&endDate=12/1/{season}",
-            "draft":        f"/draft/{season}?teamId={mlbam}"
-            # "retired nums": f"/awards/RETIREDUNI_{mlbam}/recipients?sportId=1&hydrate=results",
-            
-            }
-        
-        tasks = []
-        for ep in endpoints.values():
-            tasks.append(session.get(BASE + ep, ssl=False))
+        }
+    
+    tasks = []
+    for ep in endpoints.values():
+        tasks.append(client.get_json(BASE + ep, ssl=False))
 
-        responses = await asyncio.gather(*tasks)
-        
-        for idx, response in enumerate(responses):
-            resp = await response.json()
-            parsed = await parse_data(resp,idx,mlbam)
-            parsed_data.append(parsed)
+    responses = await asyncio.gather(*tasks)
+    
+    for idx, response in enumerate(responses):
+        resp = response
+        parsed = await parse_data(resp,idx,mlbam)
+        parsed_data.append(parsed)
 
     parsed_data_dict = {
         "team_stats":parsed_data[0],
@@ -661,5 +660,5 @@ def runit(mlbam,season):
     
     # return retrieved.result()
     # r =  asyncio.run_coroutine_threadsafe(get_team_responses(mlbam,season),loop=loop)
-    retrieved = asyncio.run(get_team_responses(mlbam,season))
+    retrieved = run_sync(get_team_responses(mlbam,season))
     return retrieved
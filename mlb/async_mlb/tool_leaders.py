@@ -1,10 +1,11 @@
 import asyncio
-import aiohttp
 import pandas as pd
 import time
 # from pprint import pprint
 
 from ..constants import BASE
+from .client import client
+from .runner import run_sync
 from ..constants import HITTING_CATEGORIES
 from ..constants import PITCHING_CATEGORIES
 from ..constants import FIELDING_CATEGORIES
@@ -92,50 +93,49 @@ async def get_leaders(tm_mlbam=None,league_mlbam=None,season=None,gameTypes=None
     
     # might need to remove 'sitCodes'
 
-    async with aiohttp.ClientSession() as session:
-        if startDate is not None and endDate is not None:
-            if endDate is not None:
-                sitCodes = ""
-                statType = "byDateRange"
-                hit_base +   f"statType={statType}&{teamQuery}gameTypes={gameTypes}&leagueIds={leagueIds}&startDate={startDate}&endDate={endDate}&limit={limit}{sitCodes}",
-                pitch_base + f"statType={statType}&{teamQuery}gameTypes={gameTypes}&leagueIds={leagueIds}&startDate={startDate}&endDate={endDate}&limit={limit}{sitCodes}",
-                field_base + f"statType={statType}&{teamQuery}gameTypes={gameTypes}&leagueIds={leagueIds}&startDate={startDate}&endDate={endDate}&limit={limit}{sitCodes}"
-            else:
-                print("startDate and endDate must be used together")
-                return []
-
-        elif season is None:
+    if startDate is not None and endDate is not None:
+        if endDate is not None:
             sitCodes = ""
-            statType = "statsSingleSeason"
-            urls = [
-                hit_base +   f"statType={statType}&{teamQuery}gameTypes={gameTypes}&leagueIds={leagueIds}&limit={limit}{sitCodes}",
-                pitch_base + f"statType={statType}&{teamQuery}gameTypes={gameTypes}&leagueIds={leagueIds}&limit={limit}{sitCodes}",
-                field_base + f"statType={statType}&{teamQuery}gameTypes={gameTypes}&leagueIds={leagueIds}&limit={limit}{sitCodes}"
-                ]
+            statType = "byDateRange"
+            hit_base +   f"statType={statType}&{teamQuery}gameTypes={gameTypes}&leagueIds={leagueIds}&startDate={startDate}&endDate={endDate}&limit={limit}{sitCodes}",
+            pitch_base + f"statType={statType}&{teamQuery}gameTypes={gameTypes}&leagueIds={leagueIds}&startDate={startDate}&endDate={endDate}&limit={limit}{sitCodes}",
+            field_base + f"statType={statType}&{teamQuery}gameTypes={gameTypes}&leagueIds={leagueIds}&startDate={startDate}&endDate={endDate}&limit={limit}{sitCodes}"
         else:
-            if sitCodes == "":
-                statType = "season"
-            else:
-                statType = "statSplits"
-            urls = [
-                hit_base +   f"statType={statType}&{teamQuery}gameTypes={gameTypes}&leagueIds={leagueIds}&season={season}&limit={limit}{sitCodes}",
-                pitch_base + f"statType={statType}&{teamQuery}gameTypes={gameTypes}&leagueIds={leagueIds}&season={season}&limit={limit}{sitCodes}",
-                field_base + f"statType={statType}&{teamQuery}gameTypes={gameTypes}&leagueIds={leagueIds}&season={season}&limit={limit}{sitCodes}"
-                ]
-
-        tasks = []
-        for url in urls:
-            print(url)
-            print("\n")
-        for url in urls:
-            tasks.append(session.get(url, ssl=False))
-
-        responses = await asyncio.gather(*tasks)
-        
-        for response in responses:
-            resp = await response.json()
-            parsed = await parse_data(resp)
-            parsed_data.append(parsed)
+            print("startDate and endDate must be used together")
+            return []
+
+    elif season is None:
+        sitCodes = ""
+        statType = "statsSingleSeason"
+        urls = [
+            hit_base +   f"statType={statType}&{teamQuery}gameTypes={gameTypes}&leagueIds={leagueIds}&limit={limit}{sitCodes}",
+            pitch_base + f"statType={statType}&{teamQuery}gameTypes={gameTypes}&leagueIds={leagueIds}&limit={limit}{sitCodes}",
+            field_base + f"statType={statType}&{teamQuery}gameTypes={gameTypes}&leagueIds={leagueIds}&limit={limit}{sitCodes}"
+            ]
+    else:
+        if sitCodes == "":
+            statType = "season"
+        else:
+            statType = "statSplits"
+        urls = [
+            hit_base +   f"statType={statType}&{teamQuery}gameTypes={gameTypes}&leagueIds={leagueIds}&season={season}&limit={limit}{sitCodes}",
+            pitch_base + f"statType={statType}&{teamQuery}gameTypes={gameTypes}&leagueIds={leagueIds}&season={season}&limit={limit}{sitCodes}",
+            field_base + f"statType={statType}&{teamQuery}gameTypes={gameTypes}&leagueIds={leagueIds}&season={season}&limit={limit}{sitCodes}"
+            ]
+
+    tasks = []
+    for url in urls:
+        print(url)
+        print("\n")
+    for url in urls:
+        tasks.append(client.get_json(url, ssl=False))
+
+    responses = await asyncio.gather(*tasks)
+    
+    for response in responses:
+        resp = response
+        parsed = await parse_data(resp)
+        parsed_data.append(parsed)
 
     parsed_data_dict = {
         "hitting":parsed_data[0],
@@ -146,7 +146,7 @@ async def get_leaders(tm_mlbam=None,league_mlbam=None,season=None,gameTypes=None
 
 def runit(tm_mlbam=None,league_mlbam=None,season=None,gameTypes=None,sitCodes=None,limit=None,startDate=None,endDate=None,group_by_team=False):
     start = time.time()
-    retrieved = asyncio.run(get_leaders(tm_mlbam,league_mlbam,season,gameTypes,sitCodes,limit,startDate,endDate,group_by_team))
+    retrieved = run_sync(get_leaders(tm_mlbam,league_mlbam,season,gameTypes,sitCodes,limit,startDate,endDate,group_by_team))
     print("--- {} seconds ---".format(time.time()-start))
     return retrieved
 
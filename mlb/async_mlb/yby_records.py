@@ -1,15 +1,19 @@
 import asyncio
-import aiohttp
 # import time
 import pandas as pd
 
 from ..constants import BASE
 from .. import mlb_dataclasses as dclass
-from ..mlbdata import get_teams_df
+from .. import refindex
 
 from ..utils import curr_year
+from .client import client
+from .scheduler import PRIORITY_BULK
+from .runner import run_sync
 
-async def parse_data(response,teams_df):
+COLUMNS = ["season","tm_mlbam","tm_name","tm_bbrefID","lg_mlbam","lg_abbrv","div_mlbam","div_short","v_mlbam","G","W","L","W%","R","RA","RunDiff","al_W","al_L","nl_W","nl_L","west_W","west_L","east_W","east_L","central_W","central_L","hm_W","hm_L","aw_W","aw_L","lt_W","lt_L","xInn_W","xInn_L","1R_W","1R_L","win_W","win_L","dy_W","dy_L","nt_W","nt_L","g_W","g_L","t_W","t_L","rhp_W","rhp_L","lhp_W","lhp_L"]
+
+async def parse_data(response):
     all_records = []
     for league in response["records"]:
         lg_mlbam = league.get("league",{}).get("id","")
@@ -18,8 +22,9 @@ async def parse_data(response,teams_df):
         for team in league["teamRecords"]:
         # SEASON RECORDS FOR EACH TEAM
             tm_mlbam = team["team"]["id"]
-            tm_name = teams_df[(teams_df["mlbam"]==tm_mlbam) & (teams_df["season"]==year)].fullName.item()
-            tm_bbrefID = teams_df[(teams_df["mlbam"]==tm_mlbam) & (teams_df["season"]==year)].bbrefID.item()
+            tm_row = refindex.team(tm_mlbam,year)
+            tm_name = tm_row["name_full"]
+            tm_bbrefID = tm_row["bbrefID"]
             div_mlbam = team.get("team",{}).get("division",{}).get("id","")
             div_short = dclass.Leagues.get(div_mlbam).short_name
             v_mlbam = team.get("team",{}).get("venue",{}).get("id")
@@ -179,8 +184,7 @@ async def parse_data(response,teams_df):
 
     return all_records       
 
-async def get_updated_records(year=None,start=None,end=None):
-    teams_df = get_teams_df()
+async def get_updated_records(year=None,start=None,end=None,seasons=None):
     leagueIDs = "103,104"
     standingsTypes = "byLeague"
     if year is not None:
@@ -189,27 +193,26 @@ async def get_updated_records(year=None,start=None,end=None):
     if year is None and start is None and end is None:
         start = 1876
         end = curr_year
+    if seasons is None:
+        seasons = range(start,end+1)
 
     parsed_data_by_year = []
     all_records = []
-    async with aiohttp.ClientSession() as sesh:
-        tasks = []
-        for season in range(start,end+1):
-            url = BASE + f"/standings?leagueId={leagueIDs}&standingsTypes={standingsTypes}&season={season}&hydrate=league,team(division)"
-            tasks.append(sesh.get(url,ssl=False))
-        responses = await asyncio.gather(*tasks)
-        for response in responses:
-            resp = await response.json()
-            parsed_data_by_year.append(await parse_data(resp,teams_df))
+    tasks = []
+    for season in seasons:
+        url = BASE + f"/standings?leagueId={leagueIDs}&standingsTypes={standingsTypes}&season={season}&hydrate=league,team(division)"
+        tasks.append(client.get_json(url,priority=PRIORITY_BULK,ssl=False))
+    responses = await asyncio.gather(*tasks)
+    for resp in responses:
+        parsed_data_by_year.append(await parse_data(resp))
     for y in parsed_data_by_year:
         for r in y:
             all_records.append(r)
-    columns = ["season","tm_mlbam","tm_name","tm_bbrefID","lg_mlbam","lg_abbrv","div_mlbam","div_short","v_mlbam","G","W","L","W%","R","RA","RunDiff","al_W","al_L","nl_W","nl_L","west_W","west_L","east_W","east_L","central_W","central_L","hm_W","hm_L","aw_W","aw_L","lt_W","lt_L","xInn_W","xInn_L","1R_W","1R_L","win_W","win_L","dy_W","dy_L","nt_W","nt_L","g_W","g_L","t_W","t_L","rhp_W","rhp_L","lhp_W","lhp_L"]
-    df = pd.DataFrame(data=all_records,columns=columns)
+    df = pd.DataFrame(data=all_records,columns=COLUMNS)
     return df
 
-def runit():
+def runit(**kwargs):
     # start = time.time()
-    retrieved = asyncio.run(get_updated_records())
+    retrieved = run_sync(get_updated_records(**kwargs))
     # print(f"--- {time.time()-start} seconds ---")
     return retrieved
@@ -11,6 +11,7 @@ from . import mlb_dataclasses as dclass
 from . import parsing
 from . import functions as funcs
 from . import objects as objs
+from .async_mlb.client import client
 
 from .constants import BASE
 from .utils import iso_format_ms
@@ -87,7 +88,9 @@ class Person:
     def __init__(self, mlbam: int, **kwargs):
         # self = object.__new__(cls)
         _pd_df = pd.DataFrame
-        data = funcs._player_data(mlbam)
+        data = kwargs.get('_data')
+        if data is None:
+            data = funcs._player_data(mlbam)
 
         _bio: Union[list, None] = data["bio"]
         _info: dict = data["info"]
@@ -154,7 +157,7 @@ class Person:
                 ),
             }
         else:
-            _debut_data = {"date": md(data["first_game"])}
+            _debut_data = {"date": md(_info["first_game"])}
 
         # last game info
         _last_game_data = {
@@ -242,6 +245,31 @@ class Person:
 
         self._edu = objs.EducationWrapper(edu_df=edu)
 
+    @classmethod
+    def bulk(cls, mlbams: List[int], chunk_size: int = 25, debut_games: bool = False) -> Dict[int, "Person"]:
+        """Load many people at once
+
+        Players are requested in batches of `chunk_size` through the
+        `/people?personIds=...` endpoint instead of 4-5 requests per player.
+
+        Parameters:
+        -----------
+        mlbams : list[int]
+            Official "MLB Advanced Media" IDs
+
+        chunk_size : int, default 25
+            number of players hydrated per request
+
+        debut_games : bool, default False
+            whether to request each player's debut game log (one extra
+            request per player). When False, `debut_game` only holds the date
+
+        Returns a dictionary of `mlbam -> Person`. IDs that the API does not
+        recognize are left out
+        """
+        data = funcs._people_bulk(mlbams, chunk_size=chunk_size, debut_games=debut_games)
+        return {mlbam: cls(mlbam, _data=d) for mlbam, d in data.items()}
+
     def __str__(self):
         return self._name.full
 
@@ -482,8 +510,10 @@ class Franchise:
 
     """
 
-    def __init__(self, mlbam: int):
-        data = funcs._franchise_data(int(mlbam))
+    def __init__(self, mlbam: int, **kwargs):
+        data = kwargs.get('_data')
+        if data is None:
+            data = funcs._franchise_data(int(mlbam))
 
         records       = data["records"]
         record_splits = data["record_splits"]  # like standings splits
@@ -652,7 +682,9 @@ class Team:
         self.mlbam = int(mlbam)
         self.season = int(season)
 
-        data: Union[dict, None] = funcs._team_data(self.mlbam, self.season)
+        data: Union[dict, None] = kwargs.get('_data')
+        if data is None:
+            data = funcs._team_data(self.mlbam, self.season)
         self.raw_data = data
 
         ti: dict = data["team_info"]
@@ -844,7 +876,7 @@ class api:
                 teamIds = ",".join(teamIds).replace(", ", ",")
             params["teamIds"] = teamIds
 
-        resp = requests.get(url, params=params)
+        resp = client.http.get(url, params=params)
 
         parsed_data = []
         for p_dict in resp.json()["people"]:
@@ -871,7 +903,7 @@ class api:
             hydrations = f"&hydrate={hydrations}"
         else:
             hydrations = ""
-        resp = requests.get(f"{BASE}/teams?sportId=1&season={season}{hydrations}")
+        resp = client.http.get(f"{BASE}/teams?sportId=1&season={season}{hydrations}")
 
         for t in resp.json()["teams"]:
             if query.lower() in t.get("name").lower():
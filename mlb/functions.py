@@ -5,18 +5,18 @@ from urllib.parse import unquote
 from typing import Union, Optional, List
 
 import pandas as pd
-import asyncio, aiohttp, nest_asyncio
+import asyncio, aiohttp
 from bs4 import BeautifulSoup as bs, SoupStrainer
 
 from . import mlb_dataclasses as dclass
 from . import constants as c
-from . import parsing, helpers, mlbdata
-from .async_mlb import fetch, _determine_loop
+from . import parsing, helpers, mlbdata, refindex
+from .async_mlb import fetch, run_sync
+from .async_mlb.fetch import fetch as async_fetch
+from .async_mlb.client import client
 from .utils import curr_date, default_season, get_tzinfo
 from .helpers import ExtendedDict
 
-nest_asyncio.apply()
-
 if platform.system() == "Windows":
     standard_time_fmt = r"%I:%M %p"
 else:
@@ -28,23 +28,20 @@ else:
 
 async def _parse_player_data(
     data,
-    session:aiohttp.ClientSession,
     _url,
     _mlbam=None):
     if "hydrate=currentTeam" in _url:
         data = data["people"][0]
         debut = data["mlbDebutDate"]
         query = f"stats=gameLog&startDate={debut}&endDate={debut}&hydrate=team"
-        resp = await session.get(f"{c.BASE}/people/{_mlbam}/stats?{query}")
-        data["debut_data"] = await resp.json()
+        data["debut_data"] = await client.get_json(f"{c.BASE}/people/{_mlbam}/stats?{query}")
         return data
     elif type(data) is dict:
         return data
     else:
         soup = bs(data,'lxml',parse_only=SoupStrainer("a"))
         href_url = soup.find("a",text="View Player Info")["href"]
-        resp = await session.get(href_url)
-        bio_page = await resp.text()
+        bio_page = await client.get_text(href_url)
         soup = bs(bio_page,'lxml',parse_only=SoupStrainer(['div','h2','p']))
 
         all_ps = soup.find(id="mw-content-text").find("div",class_="mw-parser-output").find("h2").find_all_next("p")
@@ -58,24 +55,26 @@ async def _fetch_player_data(
     _get_bio=None,
     _mlbam=None):
     retrieved_responses = []
-    async with aiohttp.ClientSession() as session:
-        tasks = []
-        for url in urls:
-            tasks.append(session.get(url, ssl=False))
+    tasks = []
+    for url_idx, url in enumerate(urls):
+        if url_idx == 0 and _get_bio is True:
+            tasks.append(client.get_text(url, ssl=False))
+        else:
+            tasks.append(client.get(url, ssl=False))
 
-        responses = await asyncio.gather(*tasks)
+    responses = await asyncio.gather(*tasks)
+    
+    for resp_idx, response in enumerate(responses):
+        if resp_idx == 0 and _get_bio is True:
+            resp = response
+            resp_url = ""
+        else:
+            resp = response.json
+            resp_url = response.url
         
-        for resp_idx, response in enumerate(responses):
-            if resp_idx == 0 and _get_bio is True:
-                resp = await response.text()
-            else:
-                resp = await response.json()
-            
-            parsed_data = await _parse_player_data(data=resp,session=session,_url=str(response.url),_mlbam=_mlbam)
+        parsed_data = await _parse_player_data(data=resp,_url=resp_url,_mlbam=_mlbam)
 
-            retrieved_responses.append(parsed_data)
-        
-        await session.close()
+        retrieved_responses.append(parsed_data)
     
     return retrieved_responses
 
@@ -616,27 +615,23 @@ async def _fetch_team_data(
     _mlbam,
     _logtime=None):
     retrieved_responses = []
-    async with aiohttp.ClientSession() as session:
-        tasks = []
-        for url in urls:
-            tasks.append(session.get(url, ssl=False))
+    session = await client.session()
+    tasks = []
+    for url in urls:
+        tasks.append(client.get(url, ssl=False))
 
-        responses = await asyncio.gather(*tasks)
-        
-        for response in responses:
-            resp = await response.json()
-            
-            parsed_data = await _parse_team_data(
-                data=resp,
-                session=session,
-                _url=str(response.url),
-                lgs_df=lgs_df,
-                _mlbam=_mlbam,
-                _logtime=_logtime)
-
-            retrieved_responses.append(parsed_data)
-        
-        await session.close()
+    responses = await asyncio.gather(*tasks)
+    
+    for response in responses:
+        parsed_data = await _parse_team_data(
+            data=response.json,
+            session=session,
+            _url=response.url,
+            lgs_df=lgs_df,
+            _mlbam=_mlbam,
+            _logtime=_logtime)
+
+        retrieved_responses.append(parsed_data)
     
     return retrieved_responses
 
@@ -644,10 +639,10 @@ async def _fetch_team_data(
 # Bulk Retrieval
 # ===============================================================
 
-def _team_data(_mlbam,_season,**kwargs) -> Union[dict,list]:
+async def _team_data_async(_mlbam,_season,**kwargs) -> Union[dict,list]:
     start = time.time()
     lgs_df = mlbdata.get_leagues_df().set_index('mlbam')
-    tms_df = mlbdata.mlbdata.get_teams_df()
+    tms_df = mlbdata.get_teams_df()
     ssn_df = mlbdata.get_seasons_df().set_index('season')
     ssn_row = ssn_df.loc[int(_season)]
 
@@ -734,9 +729,7 @@ def _team_data(_mlbam,_season,**kwargs) -> Union[dict,list]:
     # Generator comprehension
     url_list = (url for url in url_list)
     
-    loop = _determine_loop()
-    
-    team_data_dict = loop.run_until_complete(_fetch_team_data(urls=url_list,lgs_df=lgs_df,_mlbam=_mlbam,_logtime=_logtime))
+    team_data_dict = await _fetch_team_data(urls=url_list,lgs_df=lgs_df,_mlbam=_mlbam,_logtime=_logtime)
     
     total_hitting_S  = team_data_dict[8]
     total_pitching_S = team_data_dict[9]
@@ -790,7 +783,10 @@ def _team_data(_mlbam,_season,**kwargs) -> Union[dict,list]:
 
     return fetched_data
 
-def _player_data(_mlbam,**kwargs) -> dict:
+def _team_data(_mlbam,_season,**kwargs) -> Union[dict,list]:
+    return run_sync(_team_data_async(_mlbam,_season,**kwargs))
+
+async def _player_data_async(_mlbam,**kwargs) -> dict:
     """Fetch a variety of player information/stats in one API call
 
     Parameters
@@ -800,8 +796,7 @@ def _player_data(_mlbam,**kwargs) -> dict:
     
     """
     
-    pdf = mlbdata.get_people_df().set_index("mlbam").loc[_mlbam]
-    tdf = mlbdata.mlbdata.get_teams_df()
+    tdf = mlbdata.get_teams_df()
     lg_df = mlbdata.get_leagues_df().set_index("mlbam")
 
     url_list = []
@@ -821,8 +816,7 @@ def _player_data(_mlbam,**kwargs) -> dict:
     
     # Generator attempt
     url_list = (url for url in url_list)
-    loop = _determine_loop()
-    responses = loop.run_until_complete(_fetch_player_data(url_list,_get_bio=kwargs.get("_get_bio"),_mlbam=_mlbam))
+    responses = await _fetch_player_data(url_list,_get_bio=kwargs.get("_get_bio"),_mlbam=_mlbam)
     if kwargs.get("_get_bio") is True:
         _player_bio     = responses[-5]
     else:
@@ -832,6 +826,30 @@ def _player_data(_mlbam,**kwargs) -> dict:
     player_transactions = responses[-2]["transactions"]
     player_info         = responses[-1]
 
+    return _build_player_data(
+        _mlbam,
+        _player_bio=_player_bio,
+        player_stats=player_stats,
+        player_awards=player_awards,
+        player_transactions=player_transactions,
+        player_info=player_info,
+        bbrefID=refindex.person_bbref(_mlbam),
+        tdf=tdf,
+        lg_df=lg_df)
+
+def _build_player_data(
+    _mlbam,
+    _player_bio,
+    player_stats:list,
+    player_awards:list,
+    player_transactions:list,
+    player_info:dict,
+    bbrefID,
+    tdf:pd.DataFrame,
+    lg_df:pd.DataFrame) -> dict:
+    """Parse the raw responses for a single player into the dictionary used
+    by `mlb.Person`"""
+
     education           = player_info.get("education",{})
     roster_entries      = player_info.get("rosterEntries",[{}])
     draft               = player_info.get("drafts",[{}])
@@ -1148,9 +1166,9 @@ def _player_data(_mlbam,**kwargs) -> dict:
             if col not in df.columns:
                 cols.remove(col)
         if int(idx) >= 5 and len(df)>0:
-            stat_dict[df_name] = df[cols].sort_values(by="season",ascending=False)
+            stat_dict[df_name] = parsing.coerce_stats(df[cols].sort_values(by="season",ascending=False))
         else:
-            stat_dict[df_name] = df[cols]#.sort_values(by="Season",ascending=False)
+            stat_dict[df_name] = parsing.coerce_stats(df[cols])#.sort_values(by="Season",ascending=False)
     
     hitting["career"]           = stat_dict["career_hit"]
     hitting["career_advanced"]  = stat_dict["career_hit_adv"]
@@ -1250,7 +1268,7 @@ def _player_data(_mlbam,**kwargs) -> dict:
     
     _player_info = {
         'mlbam':                int(_mlbam),
-        'bbrefID':              pdf['bbrefID'],
+        'bbrefID':              bbrefID,
         'primary_position':     player_info.get('primaryPosition',{}),
         'givenName':            player_info['fullFMLName'],
         'fullName':             player_info['fullName'],
@@ -1387,6 +1405,77 @@ def _player_data(_mlbam,**kwargs) -> dict:
 
     return fetched_data
 
+def _player_data(_mlbam,**kwargs) -> dict:
+    return run_sync(_player_data_async(_mlbam,**kwargs))
+
+async def _people_bulk_async(mlbams,chunk_size=25,debut_games=False) -> dict:
+    """Fetch the data for many players using batched
+    `/people?personIds=...` calls
+
+    Stats, roster entries, education, draft, awards and transactions are
+    hydrated for up to `chunk_size` players per request. Per-player requests
+    are only made for data that can't be batched: awards/transactions missing
+    from a batched response and, when `debut_games` is True, the debut game
+    log.
+
+    Returns a dictionary of `mlbam -> data` where each value has the same
+    shape as `_player_data`
+    """
+    mlbams = list(dict.fromkeys(int(m) for m in mlbams))
+    tdf = mlbdata.get_teams_df()
+    lg_df = mlbdata.get_leagues_df().set_index("mlbam")
+
+    stat_hydration = "stats(group=[hitting,pitching,fielding],type=[career,careerAdvanced,yearByYear,yearByYearAdvanced],gameType=[R,P])"
+    hydrations = f"{stat_hydration},currentTeam,rosterEntries(team),education,draft,awards,transactions"
+
+    urls = []
+    for i in range(0,len(mlbams),chunk_size):
+        person_ids = ",".join(str(m) for m in mlbams[i:i+chunk_size])
+        urls.append(c.BASE + f"/people?personIds={person_ids}&appContext=majorLeague&hydrate={hydrations}")
+
+    responses = await asyncio.gather(*[client.get_json(url,ssl=False) for url in urls])
+    people = {}
+    for resp in responses:
+        for person in resp.get("people",[]):
+            people[person["id"]] = person
+
+    # Per-player fallbacks
+    fallbacks = []
+    for mlbam, person in people.items():
+        if "awards" not in person:
+            fallbacks.append((mlbam,"awards",c.BASE + f"/people/{mlbam}/awards"))
+        if "transactions" not in person:
+            fallbacks.append((mlbam,"transactions",c.BASE + f"/transactions?playerId={mlbam}"))
+        debut = person.get("mlbDebutDate")
+        if debut_games is True and debut is not None:
+            query = f"stats=gameLog&startDate={debut}&endDate={debut}&hydrate=team"
+            fallbacks.append((mlbam,"debut_data",c.BASE + f"/people/{mlbam}/stats?{query}"))
+    fallback_resps = await asyncio.gather(*[client.get_json(url,ssl=False) for _,_,url in fallbacks])
+    for (mlbam, key, url), resp in zip(fallbacks,fallback_resps):
+        people[mlbam][key] = resp if key == "debut_data" else resp.get(key,[])
+
+    bulk_data = {}
+    for mlbam in mlbams:
+        person = people.get(mlbam)
+        if person is None:
+            continue
+        person.setdefault("debut_data",{})
+        bulk_data[mlbam] = _build_player_data(
+            mlbam,
+            _player_bio=[""],
+            player_stats=person.pop("stats",[]),
+            player_awards=person.pop("awards",[]),
+            player_transactions=person.pop("transactions",[]),
+            player_info=person,
+            bbrefID=refindex.person_bbref(mlbam),
+            tdf=tdf,
+            lg_df=lg_df)
+
+    return bulk_data
+
+def _people_bulk(mlbams,chunk_size=25,debut_games=False) -> dict:
+    return run_sync(_people_bulk_async(mlbams,chunk_size=chunk_size,debut_games=debut_games))
+
 def _parse_franchise_standings(data:dict,lgs_df:pd.DataFrame) -> list[pd.DataFrame,pd.DataFrame]:
     records_data = []
     splits_data  = []
@@ -1529,7 +1618,7 @@ def _parse_franchise_standings(data:dict,lgs_df:pd.DataFrame) -> list[pd.DataFra
     
     return records_df, splits_df
         
-def _franchise_data(mlbam,**kwargs) -> dict:
+async def _franchise_data_async(mlbam,**kwargs) -> dict:
     """Fetch various team season data & information for a team in one API call
 
     Parameters
@@ -1573,7 +1662,7 @@ def _franchise_data(mlbam,**kwargs) -> dict:
 
     # == ASYNC STARTS HERE ===============================================
     lgs_df = mlbdata.get_leagues_df().set_index('mlbam')
-    team_df = mlbdata.mlbdata.get_teams_df()
+    team_df = mlbdata.get_teams_df()
     team_df = team_df[team_df['mlbam']==int(mlbam)]
     firstYear = team_df.iloc[0]["first_year"]
     years = range(firstYear,int(default_season())+1)
@@ -1592,7 +1681,7 @@ def _franchise_data(mlbam,**kwargs) -> dict:
     # https://statsapi.mlb.com/api/v1/teams/stats/leaders?season=2021&leaderCategories=wins,losses
     # https://statsapi.mlb.com/api/v1/teams/145/roster/coach?season=1904
 
-    resps = fetch(urls)
+    resps = await async_fetch(urls)
     
     yby_data = resps[:-5]
     team_info = resps[-5]
@@ -1839,6 +1928,9 @@ def _franchise_data(mlbam,**kwargs) -> dict:
 
     return fetched_data
 
+def _franchise_data(mlbam,**kwargs) -> dict:
+    return run_sync(_franchise_data_async(mlbam,**kwargs))
+
 # ===============================================================
 # PLAYER Functions
 # ===============================================================
@@ -1930,7 +2022,7 @@ def player_stats(mlbam,**kwargs):
         params['group'] = statGroup
         
     url = c.BASE + f"/people/{mlbam}/stats"
-    resp = requests.get(url,params=params)
+    resp = client.http.get(url,params=params)
     
     dfs = {}
     
@@ -2010,7 +2102,7 @@ def player_game_logs(mlbam,season=None,statGroup=None,gameType=None,**kwargs) ->
         params["endDate"] = kwargs["endDate"]
 
     url = c.BASE + f"/people/{mlbam}/stats?"
-    resp = requests.get(url,params=params)
+    resp = client.http.get(url,params=params)
 
     data = []
 
@@ -2092,7 +2184,7 @@ def player_date_range(mlbam,statGroup,startDate,endDate,gameType=None) -> pd.Dat
 
     url = c.BASE + f"/people/{mlbam}/stats?"
 
-    resp = requests.get(url,params=params)
+    resp = client.http.get(url,params=params)
     resp_json = resp.json()
 
     data = []
@@ -2145,7 +2237,7 @@ def player_date_range_advanced(mlbam,statGroup,startDate,endDate,gameType=None)
 
     url = c.BASE + f"/people/{mlbam}/stats?"
 
-    resp = requests.get(url,params=params)
+    resp = client.http.get(url,params=params)
     resp_json = resp.json()
 
     data = []
@@ -2199,7 +2291,7 @@ def player_splits(mlbam,statGroup,sitCodes,season=None,gameType=None) -> pd.Data
 
     url = c.BASE + f"/people/{mlbam}/stats?"
 
-    resp = requests.get(url,params=params)
+    resp = client.http.get(url,params=params)
     resp_json = resp.json()
 
     data = []
@@ -2255,7 +2347,7 @@ def player_splits_advanced(mlbam,statGroup,sitCodes,season=None,gameType=None) -
 
     url = c.BASE + f"/people/{mlbam}/stats?"
 
-    resp = requests.get(url,params=params)
+    resp = client.http.get(url,params=params)
     resp_json = resp.json()
 
     data = []
@@ -2299,7 +2391,7 @@ def team_stats(mlbam,**kwargs) -> pd.DataFrame:
         params['group'] = statGroup
     
     url = c.BASE + f"/teams/{mlbam}/stats"
-    resp = requests.get(url,params=params)
+    resp = client.http.get(url,params=params)
     
     dfs = {}
     
@@ -2380,7 +2472,7 @@ def team_game_logs(mlbam,season=None,statGroup=None,gameType=None,**kwargs) -> p
         params["endDate"] = kwargs["endDate"]
 
     url = c.BASE + f"/teams/{mlbam}/stats?"
-    resp = requests.get(url,params=params)
+    resp = client.http.get(url,params=params)
 
     data = []
     tms_df = mlbdata.get_teams_df(year=season).set_index("mlbam")
@@ -2466,7 +2558,7 @@ def team_roster(mlbam,season=None,rosterType=None,**kwargs) -> pd.DataFrame:
     # hydrate=person(rosterEntries)
     url = c.BASE + f"/teams/{mlbam}/roster"
 
-    resp = requests.get(url,params=params)
+    resp = client.http.get(url,params=params)
     roster = resp.json()["roster"]
     
     columns = [
@@ -2513,32 +2605,32 @@ def team_roster(mlbam,season=None,rosterType=None,**kwargs) -> pd.DataFrame:
 def team_appearances(mlbam):
     gt_types = {'F':'wild_card_series','D':'division_series','L':'league_series','W':'world_series','P':'playoffs'}
     sort_orders = {'F':1,'D':2,'L':3,'W':4}
-    with requests.session() as sesh:
-        data = []
-        for gt in ('F','D','L','W'):
-            url = f"https://statsapi.mlb.com/api/v1/teams/{mlbam}/stats?stats=yearByYearPlayoffs&group=pitching&gameType={gt}&fields=stats,splits,stat,wins,losses,season"
-            resp = sesh.get(url)
-            game_type = gt_types[gt]
-            years = resp.json()["stats"][0]["splits"]
-            for y in years:
-                season = y.get("season","")
-                wins = y.get("stat",{}).get("wins",0)
-                losses = y.get("stat",{}).get("losses",0)
-                if wins > losses:
-                    title_winner = True
-                else:
-                    title_winner = False
-                sort_order = sort_orders[gt]
-                
-                data.append([
-                    season,gt,game_type,wins,losses,title_winner,sort_order
-                ])
-                
+    sesh = client.http
+    data = []
+    for gt in ('F','D','L','W'):
+        url = f"https://statsapi.mlb.com/api/v1/teams/{mlbam}/stats?stats=yearByYearPlayoffs&group=pitching&gameType={gt}&fields=stats,splits,stat,wins,losses,season"
+        resp = sesh.get(url)
+        game_type = gt_types[gt]
+        years = resp.json()["stats"][0]["splits"]
+        for y in years:
+            season = y.get("season","")
+            wins = y.get("stat",{}).get("wins",0)
+            losses = y.get("stat",{}).get("losses",0)
+            if wins > losses:
+                title_winner = True
+            else:
+                title_winner = False
+            sort_order = sort_orders[gt]
+            
+            data.append([
+                season,gt,game_type,wins,losses,title_winner,sort_order
+            ])
+            
 
-                
-        df = pd.DataFrame(data=data,columns=['season','gt','game_type','wins','losses','title_winner','sort_order']).sort_values(by=["season","sort_order"],ascending=[True,True]).reset_index(drop=True)
-        
-        return df
+            
+    df = pd.DataFrame(data=data,columns=['season','gt','game_type','wins','losses','title_winner','sort_order']).sort_values(by=["season","sort_order"],ascending=[True,True]).reset_index(drop=True)
+    
+    return df
 
 # ===============================================================
 # LEAGUE Functions
@@ -2578,7 +2670,7 @@ def league_stats(league="all",season=None,hydrate:Optional[str]=None,**kwargs) -
             print(prepared_url)
         return prepared_url
     
-    resp = requests.get(url,params=params)
+    resp = client.http.get(url,params=params)
     if kwargs.get("log"):
         print(resp.url)
     
@@ -2610,79 +2702,23 @@ def league_leaders(season=None,statGroup=None,playerPool="Qualified"):
 
     url = c.BASE + f"/stats?stats=season&season={season}&group={statGroup}&playerPool={playerPool}"
 
-    resp = requests.get(url)
+    resp = client.http.get(url)
 
     resp_json = resp.json()
 
     hit_cols = ['rank','season','position','player_mlbam','player_name','team_mlbam','team_name','league_mlbam','league_name','G','GO','AO','R','2B','3B','HR','SO','BB','IBB','H','HBP','AVG','AB','OBP','SLG','OPS','CS','SB','SB%','GIDP','P','PA','TB','RBI','LOB','sB','sF','BABIP','GO/AO','CI','AB/HR']
     pit_cols = ['rank','season','position','player_mlbam','player_name','team_mlbam','team_name','league_mlbam','league_name','G','GS','GO','AO','R','2B','3B','HR','SO','BB','IBB','H','HBP','AVG','AB','OBP','SLG','OPS','CS','SB','SB%','GIDP','P','ERA','IP','W','L','SV','SVO','HLD','BS','ER','WHIP','BF','O','GP','CG','ShO','K','K%','HB','BK','WP','PK','TB','GO/AO','W%','P/Inn','GF','SO:BB','SO/9','BB/9','H/9','R/9','HR/9','IR','IRS','CI','sB','sF']
 
-    top_hitters = []
-    top_pitchers = []
+    hit_df = pd.DataFrame(columns=hit_cols)
+    pitch_df = pd.DataFrame(columns=pit_cols)
 
     for g in resp_json['stats']:
         sg = g.get("group",{}).get("displayName")
         # st = g.get("type",{}).get("displayName")
         if sg == "hitting":
-            for s in g.get("splits",[{}]):
-                stats = s.get("stat")
-
-                rank = s.get('rank')
-                season = s.get("season",'-')
-                player = s.get("player",{})
-                player_mlbam = player.get("id","")
-                player_name = player.get("fullName","")
-                team = s.get("team",{})
-                team_mlbam = team.get("id","")
-                team_name = team.get("name","")
-                league = s.get("league",{})
-                league_mlbam = league.get("id","")
-                league_name = league.get("name","")
-                position = s.get("position",{}).get("abbreviation",'-')
-
-                stats["rank"] = rank
-                stats["season"] = season
-                stats["position"] = position
-                stats["player_mlbam"] = player_mlbam
-                stats["player_name"] = player_name
-                stats["team_mlbam"] = team_mlbam
-                stats["team_name"] = team_name
-                stats["league_mlbam"] = league_mlbam
-                stats["league_name"] = league_name
-                
-                top_hitters.append(pd.Series(stats))
-
+            hit_df = parsing._parse_leader_stats(g.get("splits",[]))[hit_cols]
         elif sg == "pitching":
-            for s in g.get("splits",[{}]):
-                stats = s.get("stat")
-
-                rank = s.get('rank')
-                season = s.get("season",'-')
-                player = s.get("player",{})
-                player_mlbam = player.get("id","")
-                player_name = player.get("fullName","")
-                team = s.get("team",{})
-                team_mlbam = team.get("id","")
-                team_name = team.get("name","")
-                league = s.get("league",{})
-                league_mlbam = league.get("id","")
-                league_name = league.get("name","")
-                position = s.get("position",{}).get("abbreviation",'-')
-
-                stats["rank"] = rank
-                stats["season"] = season
-                stats["position"] = position
-                stats["player_mlbam"] = player_mlbam
-                stats["player_name"] = player_name
-                stats["team_mlbam"] = team_mlbam
-                stats["team_name"] = team_name
-                stats["league_mlbam"] = league_mlbam
-                stats["league_name"] = league_name
-                
-                top_pitchers.append(pd.Series(stats))
-
-    hit_df = pd.DataFrame(data=top_hitters).rename(columns=c.STATDICT)[hit_cols]
-    pitch_df = pd.DataFrame(data=top_pitchers).rename(columns=c.STATDICT)[pit_cols]
+            pitch_df = parsing._parse_leader_stats(g.get("splits",[]))[pit_cols]
 
     return {"hitting":hit_df,"pitching":pitch_df}
 
@@ -2702,7 +2738,7 @@ def season_standings(season=None,standingsType=None,**kwargs):
         req = requests.Request("GET",url,params=params)
         return req.prepare().url
     
-    resp = requests.get(url,params=params)
+    resp = client.http.get(url,params=params)
     
     parsed_data = parsing._parse_season_standings_data(resp.json())
     
@@ -2743,13 +2779,9 @@ def find_team(query,season=None):
     else:
         df = df[df["season"]==int(season)]
 
-    query = query.lower()
-    rows = []
-    for idx,row in df.iterrows():
-        if query in row['name_full'].lower():
-            rows.append(row)
+    df = df[df['name_full'].str.lower().str.contains(query.lower(),regex=False)]
 
-    return pd.DataFrame(rows).reset_index(drop=True)
+    return df.reset_index(drop=True)
 
 def find_venue(query):
     """Search for venues by name
@@ -2848,7 +2880,7 @@ def play_search(
     teams_df = mlbdata.get_teams_df(year=season).set_index('mlbam')
 
     url = c.BASE + f'/people/{mlbam}/stats'
-    response = requests.get(url,params=params)
+    response = client.http.get(url,params=params)
     resp = response.json()
 
     if kwargs.get('_log') is True:
@@ -3172,7 +3204,7 @@ def pitch_search(mlbam,seasons=None,statGroup=None,opposingTeamId=None,eventType
     url = c.BASE + f"/people/{mlbam}/stats?stats=pitchLog&{queryString}"
 
 
-    response = requests.get(url)
+    response = client.http.get(url)
     
     log = response.json()["stats"][0]
     
@@ -3430,7 +3462,7 @@ def game_search(
               }
     
     url = c.BASE + f"/schedule"
-    response = requests.get(url,params=params)
+    response = client.http.get(url,params=params)
     all_results = []
 
     for d in response.json()["dates"]:
@@ -3499,7 +3531,7 @@ def last_game(mlbam):
 
     url = c.BASE + f"/teams/{teamID}?hydrate=previousSchedule(date={m}/{d}/{y},inclusive=True,limit=1,season={season},gameType=[S,R,D,W,F,C,L])"
 
-    resp = requests.get(url)
+    resp = client.http.get(url)
 
     result = resp.json()["teams"][0]["previousGameSchedule"]["dates"][0]["games"][0]
     gamePk = result.get("gamePk","")
@@ -3538,11 +3570,11 @@ def next_game(mlbam):
 
     try:
         url = c.BASE + f"/teams/{teamID}?hydrate=nextSchedule(date={m}/{d}/{y},inclusive=True,limit=1,season={y},gameType=[S,R,P])"
-        response = requests.get(url)
+        response = client.http.get(url)
         results = response.json()["teams"][0]["nextGameSchedule"]["dates"][0]["games"]
     except:
         url = c.BASE + f"/teams/{teamID}?hydrate=nextSchedule(date={m}/{d}/{y},inclusive=True,limit=1,season={y+1},gameType=[S,R,P])"
-        response = requests.get(url)
+        response = client.http.get(url)
         results = response.json()["teams"][0]["nextGameSchedule"]["dates"][0]["games"]
 
     result = results[0]
@@ -3661,7 +3693,7 @@ def schedule(mlbam=None,season=None,date=None,startDate=None,endDate=None,gameTy
         req = requests.Request("GET",url,params=params)
         prepared_url = req.prepare().url
         return prepared_url
-    resp = requests.get(url,params=params)
+    resp = client.http.get(url,params=params)
 
     if kwargs.get('log') is True:
         print("\n================")
@@ -3793,7 +3825,7 @@ def game_highlights(
         print("One of params, 'date' or 'season' must be utilized")
         return None
 
-    resp = requests.get(url)
+    resp = client.http.get(url)
 
     sched = resp.json()
 
@@ -3872,7 +3904,7 @@ def get_video_link(playID:str,broadcast=None) -> str:
         url = f"https://baseballsavant.mlb.com/sporty-videos?playId={playID}&videoType={broadcast}"
     else:
         url = f"https://baseballsavant.mlb.com/sporty-videos?playId={playID}"
-    resp = requests.get(url)
+    resp = client.http.get(url)
     soup = bs(resp.text,'lxml')
     video_tag = soup.find("video",id="sporty")
     video_source = video_tag.find("source")["src"]
@@ -3888,24 +3920,24 @@ def player_bio(mlbam:int):
     
     """
     # URL to Player's Baseball-Reference page
-    with requests.session() as sesh:
-        url = f"https://www.baseball-reference.com/redirect.fcgi?player=1&mlb_ID={mlbam}"
+    sesh = client.http
+    url = f"https://www.baseball-reference.com/redirect.fcgi?player=1&mlb_ID={mlbam}"
 
-        resp = sesh.get(url)
+    resp = sesh.get(url)
 
-        soup = bs(resp.text,'lxml')
+    soup = bs(resp.text,'lxml')
 
-        # URL to Player's "Bullpen" page
-        url = soup.find('a',text='View Player Info')['href']
+    # URL to Player's "Bullpen" page
+    url = soup.find('a',text='View Player Info')['href']
 
-        resp = sesh.get(url)
+    resp = sesh.get(url)
 
-        soup = bs(resp.text,'lxml')
+    soup = bs(resp.text,'lxml')
 
-        bio_p_tags = soup.find("span",id="Biographical_Information"
-                               ).findParent('h2').find_next_siblings('p')
+    bio_p_tags = soup.find("span",id="Biographical_Information"
+                           ).findParent('h2').find_next_siblings('p')
 
-        return bio_p_tags
+    return bio_p_tags
 
 def free_agents(
     season:Optional[int]=None,
@@ -3937,7 +3969,7 @@ def free_agents(
         params['hydrate'] = 'person'
     
     url = f"{c.BASE}/people/freeAgents"
-    resp = requests.get(url,params=params)
+    resp = client.http.get(url,params=params)
     
     data = []
     for fa in resp.json()['freeAgents']:
@@ -1,7 +1,10 @@
+import copy
+import asyncio
 import requests
 import datetime as dt
 from dateutil.parser import parse
 
+import aiohttp
 import pandas as pd
 
 from . import utils
@@ -9,10 +12,124 @@ from . import helpers
 from . import objects as objs
 from . import constants as c
 from . import mlb_dataclasses as dclass
+from .async_mlb.client import client
+from .async_mlb.runner import run_sync
 
 md = objs.MlbDate
 mdt = objs.MlbDatetime
 
+# playEvents 'eventType's reported as substitutions by `Game.stream()`
+SUBSTITUTION_EVENTS = frozenset((
+    'pitching_substitution',
+    'offensive_substitution',
+    'defensive_substitution',
+    'defensive_switch',
+))
+
+TIMESTAMP_COLUMNS = ("ab_idx","type","event_idx","event_type","event_desc",
+                     "event_start","start_tc","event_end","end_tc","play_id")
+
+def _timecode(iso:str) -> str:
+    """'2021-07-04T18:05:12.345Z' -> '20210704_180512'"""
+    if len(iso) >= 20 and iso[4] == '-' and iso[10] == 'T' and iso.endswith('Z'):
+        return f'{iso[0:4]}{iso[5:7]}{iso[8:10]}_{iso[11:13]}{iso[14:16]}{iso[17:19]}'
+    return dt.datetime.strptime(iso, r"%Y-%m-%dT%H:%M:%S.%fZ").strftime(r"%Y%m%d_%H%M%S")
+
+# ===============================================================
+# Feed diffs
+# ===============================================================
+# `Game.refresh()` applies the feed's diffPatch responses: lists of JSON
+# patch (RFC 6902) operations against the live feed
+
+_SECTIONS = ('gameData','boxscore','linescore','plays')
+
+def _pointer(path:str) -> list:
+    if path == '':
+        return []
+    return [t.replace('~1','/').replace('~0','~') for t in path.lstrip('/').split('/')]
+
+def _touched(doc:dict,path:str) -> tuple:
+    """The feed section a patch path falls in and, for paths inside
+    'allPlays', the index of the play it changes. A `None` section means
+    the path is too broad to patch (the feed should be reloaded)"""
+    tokens = _pointer(path)
+    if len(tokens) == 0:
+        return None, None
+    if tokens[0] == 'metaData':
+        return 'metaData', None
+    if tokens[0] == 'gameData':
+        return 'gameData', None
+    if tokens[0] != 'liveData' or len(tokens) < 2:
+        return None, None
+    if tokens[1] in ('boxscore','linescore'):
+        return tokens[1], None
+    if tokens[1] != 'plays':
+        # decisions, leaders
+        return 'metaData', None
+    if len(tokens) < 3:
+        return 'plays', 0
+    if tokens[2] != 'allPlays':
+        # currentPlay, scoringPlays, playsByInning
+        return 'plays', None
+    if len(tokens) < 4:
+        return 'plays', 0
+    if tokens[3] == '-':
+        return 'plays', len(doc['liveData']['plays']['allPlays'])
+    return 'plays', int(tokens[3])
+
+def _resolve(doc,tokens:list):
+    for t in tokens:
+        doc = doc[int(t)] if isinstance(doc,list) else doc[t]
+    return doc
+
+def _remove(doc,path:str):
+    tokens = _pointer(path)
+    parent = _resolve(doc,tokens[:-1])
+    if isinstance(parent,list):
+        return parent.pop(int(tokens[-1]))
+    return parent.pop(tokens[-1])
+
+def _add(doc,path:str,value):
+    tokens = _pointer(path)
+    parent = _resolve(doc,tokens[:-1])
+    key = tokens[-1]
+    if isinstance(parent,list):
+        if key == '-':
+            parent.append(value)
+        else:
+            idx = int(key)
+            if idx > len(parent):
+                raise IndexError(path)
+            parent.insert(idx,value)
+    else:
+        parent[key] = value
+
+def _apply_op(doc:dict,op:dict):
+    """Apply one JSON patch operation to `doc` in place"""
+    kind = op['op']
+    path = op['path']
+    if kind == 'add':
+        _add(doc,path,op['value'])
+    elif kind == 'remove':
+        _remove(doc,path)
+    elif kind == 'replace':
+        tokens = _pointer(path)
+        parent = _resolve(doc,tokens[:-1])
+        if isinstance(parent,list):
+            parent[int(tokens[-1])] = op['value']
+        else:
+            _resolve(parent,tokens[-1:])
+            parent[tokens[-1]] = op['value']
+    elif kind == 'move':
+        _add(doc,path,_remove(doc,op['from']))
+    elif kind == 'copy':
+        _add(doc,path,copy.deepcopy(_resolve(doc,_pointer(op['from']))))
+    elif kind == 'test':
+        if _resolve(doc,_pointer(path)) != op['value']:
+            raise ValueError(f"test failed at '{path}'")
+    else:
+        raise ValueError(f"unknown patch op '{kind}'")
+
 class Game:
     """# Game
 
@@ -86,16 +203,27 @@ class Game:
 
     flags() -> dict
         returns a dictionary of notable attributes about the game
+
+    refresh() -> dict
+        brings the game up to date by applying only what changed since the
+        last update (`refresh_async()` is the awaitable version)
+
+    timecodes() -> list
+        returns every timecode at which the feed changed
+
+    stream() -> async generator
+        yields new pitch, substitution, play and score-change events as
+        they appear in the feed (`watch()` is the callback-based version)
     """
 
-    def __init__(self,game_pk, timecode=None, tz='et'):
+    def __init__(self,game_pk, timecode=None, tz='et', **kwargs):
         self.last_updated = dt.datetime.now()
         if timecode == '':
             timecode = None
         if timecode is not None and timecode.find('_') == -1:
             timecode = parse(timecode).strftime(r'%Y%m%d_%H%M%S')
         
-        tz_obj = objs.get_tz(tz)
+        self._tz_obj = objs.get_tz(tz)
         self._tz = tz
         
         self.__game_pk = game_pk
@@ -106,16 +234,33 @@ class Game:
         params = {'hydrate':'venue,flags,preState',
                   'timecode':timecode}
 
-        gm = requests.get(game_url,params=params).json()
+        gm = kwargs.get('_data')
+        if gm is None:
+            gm = client.http.get(game_url,params=params).json()
+        self._load_feed(gm)
+
+    # ===============================================================
+    # Loading
+    # ===============================================================
+    # Each section of the feed has its own loader so `refresh()` can
+    # re-derive only what a diff touched
+
+    def _load_feed(self,gm:dict):
         self._raw_game_data = gm
+        self._load_meta()
+        self._load_game_data()
+        self._load_boxscore()
+        self._load_linescore()
+        self._load_plays(0)
 
-        self.meta = gm['metaData']
-        gameData = gm['gameData']
-        liveData = gm['liveData']
+    def _load_meta(self):
+        self.meta = self._raw_game_data['metaData']
+        self._timecode = self.meta.get('timeStamp')
+
+    def _load_game_data(self):
+        gameData = self._raw_game_data['gameData']
 
         # GAME Information
-        self._linescore = liveData['linescore']
-        self._boxscore = liveData['boxscore']
         self._flags = gameData['flags']
 
         self.abstractState  = gameData['status']['abstractGameState']
@@ -124,7 +269,6 @@ class Game:
         self.detailed_state = self.detailedState
         self.gameState  = self.abstract_state
         self.game_state = self.abstract_state
-        self.info = self._boxscore['info']
         self.sky = gameData['weather'].get('condition', '-')
         self.temp = gameData['weather'].get('temp', '-')
         self.wind = gameData['weather'].get('wind', '-')
@@ -133,7 +277,7 @@ class Game:
         self.start = gameData.get('datetime', {}).get('time', '-')
         self.start_iso = gameData.get('datetime', {}).get('dateTime', '-')
 
-        self._game_datetime = mdt(self.start_iso,tz=tz_obj)
+        self._game_datetime = mdt(self.start_iso,tz=self._tz_obj)
 
         datetime = gameData['datetime']
         self.game_date = datetime['officialDate']
@@ -142,33 +286,9 @@ class Game:
 
         self._venue = gameData['venue']
 
-        self._officials = self._boxscore.get('officials', [{}, {}, {}, {}])
-
-        if len(self._officials) != 0:
-            _ump_home = self._officials[0].get('official', {})
-            _ump_first = self._officials[1].get('official', {})
-            _ump_second = self._officials[2].get('official', {})
-            _ump_third = self._officials[3].get('official', {})
-        else:
-            _ump_home = {}
-            _ump_first = {}
-            _ump_second = {}
-            _ump_third = {}
-        
-        self._umpires = objs.Umpires(
-            first  = _ump_first.get('fullName',''),
-            second = _ump_second.get('fullName',''),
-            third  = _ump_third.get('fullName',''),
-            home   = _ump_home.get('fullName','')
-            )
-
         # ALL PLAYERS IN GAME
         self._players = gameData['players']
         
-        self.__all_players_game_data = {}
-        self.__all_players_game_data.update(self._boxscore['teams']['away']['players'])
-        self.__all_players_game_data.update(self._boxscore['teams']['home']['players'])
-        
         away_probable_mlbam = (gameData.get('probablePitchers',{})
                                .get('away',{})
                                .get('id',0))
@@ -202,26 +322,13 @@ class Game:
         # AWAY Team Data
         away = gameData['teams']['away']
         self._away_info = away
-        _away_data = self._boxscore['teams']['away']
-        _away_score_data = self._linescore['teams']['away']
         self.away_id = away['id']
         self._away_team_full = away['name']
         self._away_team = away['clubName']
         self._away_team_abbrv = away['abbreviation']
-        self._away_stats = _away_data['teamStats']
-        self._away_players = _away_data['players']
-        self._away_lineup = _away_data['batters']
-        self._away_starting_order = _away_data['battingOrder']
-        self._away_pitcher_lineup = _away_data['pitchers']
-        self._away_bullpen = _away_data['bullpen']
-        self._away_rhe = self._linescore['teams']['away']
-        self._away_bench = _away_data['bench']
         self.away_full = self._away_team_full
         self.away_club = self._away_team
         self.away_abbrv = self._away_team_abbrv
-        self.away_runs = _away_score_data.get('runs')
-        self.away_hits = _away_score_data.get('hits')
-        self.away_errs = _away_score_data.get('errors')
         self.away_record = f"{away['record']['wins']}-{away['record']['losses']}"
 
         self.__away = dclass.TeamName(away['id'],away['name'],away['locationName'],away['franchiseName'],
@@ -230,34 +337,84 @@ class Game:
         # HOME Team Data
         home = gameData['teams']['home']
         self._home_info = home
-        _home_data = self._boxscore['teams']['home']
-        _home_score_data = self._linescore['teams']['home']
         self.home_id = home['id']
         self._home_team_full = home['name']
         self._home_team = home['clubName']
         self._home_team_abbrv = home['abbreviation']
+        self.home_full = self._home_team_full
+        self.home_club = self._home_team
+        self.home_abbrv = self._home_team_abbrv
+        self.home_record = f"{home['record']['wins']}-{home['record']['losses']}"
+        
+        self.__home = dclass.TeamName(away['id'],home['name'],home['locationName'],home['franchiseName'],
+                                home['clubName'],home['shortName'],home['abbreviation'])
+
+    def _load_boxscore(self):
+        self._boxscore = self._raw_game_data['liveData']['boxscore']
+        self.info = self._boxscore['info']
+
+        self._officials = self._boxscore.get('officials', [{}, {}, {}, {}])
+
+        if len(self._officials) != 0:
+            _ump_home = self._officials[0].get('official', {})
+            _ump_first = self._officials[1].get('official', {})
+            _ump_second = self._officials[2].get('official', {})
+            _ump_third = self._officials[3].get('official', {})
+        else:
+            _ump_home = {}
+            _ump_first = {}
+            _ump_second = {}
+            _ump_third = {}
+        
+        self._umpires = objs.Umpires(
+            first  = _ump_first.get('fullName',''),
+            second = _ump_second.get('fullName',''),
+            third  = _ump_third.get('fullName',''),
+            home   = _ump_home.get('fullName','')
+            )
+
+        self.__all_players_game_data = {}
+        self.__all_players_game_data.update(self._boxscore['teams']['away']['players'])
+        self.__all_players_game_data.update(self._boxscore['teams']['home']['players'])
+
+        _away_data = self._boxscore['teams']['away']
+        self._away_stats = _away_data['teamStats']
+        self._away_players = _away_data['players']
+        self._away_lineup = _away_data['batters']
+        self._away_starting_order = _away_data['battingOrder']
+        self._away_pitcher_lineup = _away_data['pitchers']
+        self._away_bullpen = _away_data['bullpen']
+        self._away_bench = _away_data['bench']
+
+        _home_data = self._boxscore['teams']['home']
         self._home_stats = _home_data['teamStats']
         self._home_players = _home_data['players']
         self._home_lineup = _home_data['batters']
         self._home_starting_order = _home_data['battingOrder']
         self._home_pitcher_lineup = _home_data['pitchers']
         self._home_bullpen = _home_data['bullpen']
-        self._home_rhe = self._linescore['teams']['home']
         self._home_bench = _home_data['bench']
-        self.home_full = self._home_team_full
-        self.home_club = self._home_team
-        self.home_abbrv = self._home_team_abbrv
+
+        # the player tables are rebuilt on next access
+        self.__player_data = {}
+
+    def _load_linescore(self):
+        self._linescore = self._raw_game_data['liveData']['linescore']
+
+        _away_score_data = self._linescore['teams']['away']
+        self._away_rhe = _away_score_data
+        self.away_runs = _away_score_data.get('runs')
+        self.away_hits = _away_score_data.get('hits')
+        self.away_errs = _away_score_data.get('errors')
+
+        _home_score_data = self._linescore['teams']['home']
+        self._home_rhe = _home_score_data
         self.home_runs = _home_score_data.get('runs')
         self.home_hits = _home_score_data.get('hits')
         self.home_errs = _home_score_data.get('errors')
-        self.home_record = f"{home['record']['wins']}-{home['record']['losses']}"
-        
-        self.__home = dclass.TeamName(away['id'],home['name'],home['locationName'],home['franchiseName'],
-                                home['clubName'],home['shortName'],home['abbreviation'])
 
         self._curr_defense = self._linescore['defense']
         self._curr_offense = self._linescore['offense']
-        self._curr_play = liveData['plays'].get('currentPlay', {})
 
         self.__inning = self._linescore.get('currentInning', '-')
         self.__inning_ordinal = self._linescore.get('currentInningOrdinal', '-')
@@ -276,15 +433,33 @@ class Game:
         self._inn_label = f'{self._inn_half} of the {self.__inning_ordinal}'
         self._scheduled_innings = self._linescore.get('scheduledInnings', 9)
 
-        # PLAYS and EVENTS
-        self._all_plays = liveData['plays']['allPlays']
-        self._scoring_plays = []
+    def _load_plays(self,start:int=0):
+        """(Re)index the plays from `start` onwards. Everything derived
+        from earlier plays is kept"""
+        plays = self._raw_game_data['liveData']['plays']
+        self._curr_play = plays.get('currentPlay', {})
 
-        self._all_events = []
-        self._pitch_events = []
-        self._bip_events = []
+        # PLAYS and EVENTS
+        self._all_plays = plays['allPlays']
+        if start <= 0 or not hasattr(self,'_play_offsets'):
+            start = 0
+            self._scoring_plays = []
+            self._all_events = []
+            self._pitch_events = []
+            self._bip_events = []
+            # lengths of the lists above before each play
+            self._play_offsets = [(0,0,0,0)]
+        else:
+            start = min(start,len(self._play_offsets) - 1)
+            n_scoring, n_all, n_pitch, n_bip = self._play_offsets[start]
+            del self._scoring_plays[n_scoring:]
+            del self._all_events[n_all:]
+            del self._pitch_events[n_pitch:]
+            del self._bip_events[n_bip:]
+            del self._play_offsets[start + 1:]
+        self._truncate_tables(start)
         
-        for play in self._all_plays:
+        for play in self._all_plays[start:]:
             for event in play['playEvents']:
                 self._all_events.append(event)
                 if event['isPitch'] == True:
@@ -296,9 +471,290 @@ class Game:
                     self._scoring_plays.append(play)
             except:
                 pass
+            self._play_offsets.append((len(self._scoring_plays),len(self._all_events),
+                                       len(self._pitch_events),len(self._bip_events)))
+
+    # ===============================================================
+    # Updating
+    # ===============================================================
+    def refresh(self) -> dict:
+        """Bring the game up to date
 
-        self.__away_player_data  = self.__get_player_data('away')
-        self.__home_player_data  = self.__get_player_data('home')
+        Requests only what changed since the last known timecode (the
+        feed's diffPatch endpoint), applies it to the feed held in memory
+        and re-derives only the sections it touched. Falls back to
+        fetching the whole feed when there is no timecode to start from or
+        the diff can't be applied
+
+        Returns:
+        --------
+        dict : {'full': bool, 'ops': int, 'sections': list, 'first_play': int | None}
+            'full' is True when the whole feed was reloaded; 'sections' are
+            the parts that were re-derived ('gameData','boxscore',
+            'linescore','plays') and 'first_play' the index of the first
+            play that changed
+        """
+        if self._timecode is None:
+            return self._reload()
+        try:
+            resp = client.http.get(self._diff_url(),params={'startTimecode':self._timecode})
+            # an error body ({"message": ...}) isn't a diff
+            resp.raise_for_status()
+            data = resp.json()
+        except (requests.RequestException, ValueError):
+            return self._reload()
+        return self._apply_update(data) or self._reload()
+
+    async def refresh_async(self) -> dict:
+        """Awaitable `refresh()`. Requests go through the shared async
+        client, so any number of games can be refreshed concurrently"""
+        data = None
+        if self._timecode is not None:
+            try:
+                data = await client.get_json(f'{self._diff_url()}?startTimecode={self._timecode}',raise_for_status=True)
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+                data = None
+        summary = None if data is None else self._apply_update(data)
+        if summary is None:
+            summary = self._reload(await client.get_json(self._feed_url()))
+        return summary
+
+    def _diff_url(self) -> str:
+        return f'{c.BASE}/v1.1/game/{self.game_pk}/feed/live/diffPatch'
+
+    def _feed_url(self) -> str:
+        return f'{c.BASE}/v1.1/game/{self.game_pk}/feed/live?hydrate=venue,flags,preState'
+
+    def _reload(self,gm:dict=None) -> dict:
+        if gm is None:
+            gm = client.http.get(self._feed_url()).json()
+        self._load_feed(gm)
+        self.last_updated = dt.datetime.now()
+        return {'full':True,'ops':0,'sections':list(_SECTIONS),'first_play':0}
+
+    def _apply_update(self,data) -> dict:
+        """Apply a diffPatch response (a list of `{'diff': [ops]}`
+        patches, or the whole feed when the server decides that's
+        smaller) and re-derive what it touched. Returns `None` when the
+        feed has to be fetched again in full"""
+        if isinstance(data,dict):
+            if 'gameData' in data and 'liveData' in data:
+                return self._reload(data)
+            data = [data]
+        ops = []
+        for patch in data or []:
+            if isinstance(patch,dict) and 'diff' in patch:
+                ops.extend(patch['diff'])
+            elif isinstance(patch,dict) and 'op' in patch:
+                ops.append(patch)
+        self.last_updated = dt.datetime.now()
+        if len(ops) == 0:
+            return {'full':False,'ops':0,'sections':[],'first_play':None}
+
+        sections = set()
+        first_play = None
+        # until every op has been applied (and the sections re-derived) the
+        # feed in memory can't be diffed against, so a failure anywhere from
+        # here on makes the next refresh fetch the whole feed
+        self._timecode = None
+        try:
+            for op in ops:
+                for path in (op.get('path'),op.get('from')):
+                    if path is None:
+                        continue
+                    section, play_idx = _touched(self._raw_game_data,path)
+                    if section is None:
+                        return None
+                    sections.add(section)
+                    if play_idx is not None and (first_play is None or play_idx < first_play):
+                        first_play = play_idx
+                _apply_op(self._raw_game_data,op)
+        except (KeyError, IndexError, ValueError, TypeError):
+            # the feed in memory no longer matches the server's
+            return None
+
+        if 'gameData' in sections:
+            self._load_game_data()
+        if 'boxscore' in sections or 'gameData' in sections:
+            self._load_boxscore()
+        if 'linescore' in sections:
+            self._load_linescore()
+        if 'plays' in sections:
+            self._load_plays(len(self._play_offsets) - 1 if first_play is None else first_play)
+        self._load_meta()
+        sections.discard('metaData')
+        sections.discard(None)
+        return {'full':False,'ops':len(ops),
+                'sections':[s for s in _SECTIONS if s in sections],
+                'first_play':first_play}
+
+    def timecodes(self) -> list:
+        """Every timecode at which the feed changed (as "YYYYmmdd_HHMMSS")"""
+        resp = client.http.get(f'{c.BASE}/v1.1/game/{self.game_pk}/feed/live/timestamps')
+        return resp.json()
+
+    # ===============================================================
+    # Event stream
+    # ===============================================================
+    def new_events(self,kinds=None) -> list:
+        """Events that appeared in the feed since the last call (every
+        event in the game on the first call)
+
+        Pitches and substitutions are keyed by their `playId`, plays and
+        score changes by their `atBatIndex`; an event is returned once no
+        matter how many times the feed is refreshed in between
+
+        Plays and score changes come from a plate appearance's result, so
+        they are only emitted once it is complete. Runs that score during
+        an at-bat (wild pitch, stolen base of home, balk...) arrive in the
+        `ScoreChange` of the plate appearance they happened in
+
+        Parameters:
+        -----------
+        kinds : str or list, optional
+            only return these kinds of events ('pitch','substitution',
+            'play','score'). Events of other kinds are still marked as seen
+
+        """
+        if not hasattr(self,'_stream_seen'):
+            self._stream_seen = set()
+            # first play that wasn't complete when last scanned
+            self._stream_from = 0
+            self._stream_score = (0,0)
+        if isinstance(kinds,str):
+            kinds = (kinds,)
+
+        events = []
+        seen = self._stream_seen
+        def emit(event):
+            key = event.key
+            if key not in seen:
+                seen.add(key)
+                if kinds is None or event.kind in kinds:
+                    events.append(event)
+
+        complete = True
+        for ab_idx in range(self._stream_from,len(self._all_plays)):
+            play = self._all_plays[ab_idx]
+            about = play.get('about',{})
+            inning = about.get('inning')
+            half = about.get('halfInning')
+            for event in play.get('playEvents',[]):
+                details = event.get('details',{})
+                if event.get('isPitch'):
+                    count = event.get('count',{})
+                    emit(dclass.PitchEvent(
+                        'pitch',self.game_pk,ab_idx,event.get('index'),event.get('playId'),
+                        inning,half,details.get('description'),event,
+                        pitch_number=event.get('pitchNumber'),
+                        call=details.get('call',{}).get('description'),
+                        pitch_type=details.get('type',{}).get('description'),
+                        speed=event.get('pitchData',{}).get('startSpeed'),
+                        balls=count.get('balls'),
+                        strikes=count.get('strikes'),
+                        outs=count.get('outs')))
+                elif details.get('eventType') in SUBSTITUTION_EVENTS:
+                    emit(dclass.SubstitutionEvent(
+                        'substitution',self.game_pk,ab_idx,event.get('index'),event.get('playId'),
+                        inning,half,details.get('description'),event,
+                        event_type=details.get('eventType'),
+                        player_mlbam=event.get('player',{}).get('id'),
+                        position=event.get('position',{}).get('abbreviation')))
+            if not about.get('isComplete',False):
+                complete = False
+                continue
+            result = play.get('result',{})
+            matchup = play.get('matchup',{})
+            away_score = result.get('awayScore',self._stream_score[0])
+            home_score = result.get('homeScore',self._stream_score[1])
+            emit(dclass.PlayEvent(
+                'play',self.game_pk,ab_idx,None,None,
+                inning,half,result.get('description'),play,
+                event=result.get('event'),
+                event_type=result.get('eventType'),
+                batter_mlbam=matchup.get('batter',{}).get('id'),
+                pitcher_mlbam=matchup.get('pitcher',{}).get('id'),
+                rbi=result.get('rbi'),
+                away_score=away_score,
+                home_score=home_score))
+            prev_away, prev_home = self._stream_score
+            if (away_score,home_score) != (prev_away,prev_home):
+                emit(dclass.ScoreChange(
+                    'score',self.game_pk,ab_idx,None,None,
+                    inning,half,result.get('description'),play,
+                    away_score=away_score,
+                    home_score=home_score,
+                    away_runs=away_score - prev_away,
+                    home_runs=home_score - prev_home))
+            self._stream_score = (away_score,home_score)
+            if complete:
+                self._stream_from = ab_idx + 1
+        return events
+
+    async def stream(self,interval:float=10.0,kinds=None,replay:bool=False,until_final:bool=True):
+        """Async generator of the game's events as they appear
+
+        Refreshes the game every `interval` seconds (see `refresh_async()`)
+        and yields each new `PitchEvent`, `SubstitutionEvent`, `PlayEvent`
+        and `ScoreChange` once, in the order they happened. Like
+        `new_events()`, a run scored mid at-bat is only reported when that
+        plate appearance completes. A refresh that fails (network error,
+        timeout, malformed feed) is skipped and retried after `interval`
+
+        Parameters:
+        -----------
+        interval : float, default 10.0
+            seconds between refreshes
+
+        kinds : str or list, optional
+            only yield these kinds of events ('pitch','substitution',
+            'play','score')
+
+        replay : bool, default False
+            first yield every event already in the feed
+
+        until_final : bool, default True
+            stop once the game is Final (otherwise run until cancelled)
+
+        Examples
+        --------
+        >>> async for event in game.stream(kinds=['play','score']):
+        ...     print(event)
+        """
+        if replay:
+            for event in self.new_events(kinds):
+                yield event
+        else:
+            self.new_events()
+        while not (until_final and self.abstract_state == 'Final'):
+            await asyncio.sleep(interval)
+            try:
+                await self.refresh_async()
+            except Exception:
+                # as in LiveTracker, a bad refresh only costs one interval
+                continue
+            for event in self.new_events(kinds):
+                yield event
+
+    def watch(self,callback,interval:float=10.0,kinds=None,replay:bool=False,until_final:bool=True) -> int:
+        """Blocking, callback-based version of `stream()`
+
+        Calls `callback(event)` for every new event (from the package's
+        background event loop thread) until the game is Final or
+        `callback` returns False. Returns the number of events delivered
+        """
+        async def run():
+            delivered = 0
+            events = self.stream(interval=interval,kinds=kinds,replay=replay,until_final=until_final)
+            try:
+                async for event in events:
+                    delivered += 1
+                    if callback(event) is False:
+                        break
+            finally:
+                await events.aclose()
+            return delivered
+        return run_sync(run())
 
     def __str__(self):
         return f"{self.game_id} | {self._away_team_abbrv} ({self._away_rhe.get('runs',0)}) @ {self._home_team_abbrv} ({self._home_rhe.get('runs',0)})"
@@ -486,6 +942,13 @@ class Game:
         
         return all_player_data
 
+    def __team_player_data(self,home_or_away):
+        data = self.__player_data.get(home_or_away)
+        if data is None:
+            data = self.__get_player_data(home_or_away)
+            self.__player_data[home_or_away] = data
+        return data
+
     def __get_team_stats(self):
         pass
 
@@ -519,65 +982,65 @@ class Game:
     def away_batters(self,default_index=None) -> pd.DataFrame:
         """Away batters game/season stats, bio, and game status"""
         if default_index is None:
-            return self.__away_player_data['batters']
+            return self.__team_player_data('away')['batters']
         else:
-            return self.__away_player_data['batters'].set_index(default_index)
+            return self.__team_player_data('away')['batters'].set_index(default_index)
     
     @property
     def away_pitchers(self,default_index=None) -> pd.DataFrame:
         """Away pitchers game/season stats, bio, and game status"""
         if default_index is None:
-            return self.__away_player_data['pitchers']
+            return self.__team_player_data('away')['pitchers']
         else:
-            return self.__away_player_data['pitchers'].set_index(default_index)
+            return self.__team_player_data('away')['pitchers'].set_index(default_index)
     
     @property
     def away_bullpen(self,default_index=None) -> pd.DataFrame:
         """Away bullpen game/season stats, bio, and game status"""
         if default_index is None:
-            return self.__away_player_data['bullpen']
+            return self.__team_player_data('away')['bullpen']
         else:
-            return self.__away_player_data['bullpen'].set_index(default_index)
+            return self.__team_player_data('away')['bullpen'].set_index(default_index)
     
     @property
     def away_bench(self,default_index=None) -> pd.DataFrame:
         """Away bench game/season stats, bio, and game status"""
         if default_index is None:
-            return self.__away_player_data['bench']
+            return self.__team_player_data('away')['bench']
         else:
-            return self.__away_player_data['bench'].set_index(default_index)
+            return self.__team_player_data('away')['bench'].set_index(default_index)
     
     @property
     def home_batters(self,default_index=None) -> pd.DataFrame:
         """Home batters game/season stats, bio, and game status"""
         if default_index is None:
-            return self.__home_player_data['batters']
+            return self.__team_player_data('home')['batters']
         else:
-            return self.__home_player_data['batters'].set_index(default_index)
+            return self.__team_player_data('home')['batters'].set_index(default_index)
     
     @property
     def home_pitchers(self,default_index=None) -> pd.DataFrame:
         """Home pitchers game/season stats, bio, and game status"""
         if default_index is None:
-            return self.__home_player_data['pitchers']
+            return self.__team_player_data('home')['pitchers']
         else:
-            return self.__home_player_data['pitchers'].set_index(default_index)
+            return self.__team_player_data('home')['pitchers'].set_index(default_index)
     
     @property
     def home_bullpen(self,default_index=None) -> pd.DataFrame:
         """Home bullpen game/season stats, bio, and game status"""
         if default_index is None:
-            return self.__home_player_data['bullpen']
+            return self.__team_player_data('home')['bullpen']
         else:
-            return self.__home_player_data['bullpen'].set_index(default_index)
+            return self.__team_player_data('home')['bullpen'].set_index(default_index)
     
     @property
     def home_bench(self,default_index=None) -> pd.DataFrame:
         """Home bench game/season stats, bio, and game status"""
         if default_index is None:
-            return self.__home_player_data['bench']
+            return self.__team_player_data('home')['bench']
         else:
-            return self.__home_player_data['bench'].set_index(default_index)
+            return self.__team_player_data('home')['bench'].set_index(default_index)
 
     def player_bio(self,mlbam) -> dict:
         """Get bio information for a specific player
@@ -909,83 +1372,141 @@ class Game:
         except:
             return pd.DataFrame(columns=headers)
 
-        events_data = []
+        # rows are kept for the current at-bat and only its new events are
+        # processed (the log is reset whenever the plays are re-indexed)
+        ab_idx = self._curr_play.get('atBatIndex')
+        log = self._matchup_log
+        if log is None or log['ab'] != ab_idx or log['events'] > len(pa_events):
+            log = self._matchup_log = {'ab':ab_idx,'events':0,'rows':[],'frame':None}
+        # callers get a copy, so editing the result can't change the log
+        if log['frame'] is not None and log['events'] == len(pa_events):
+            return log['frame'].copy()
+
+        for ab_log in pa_events[log['events']:]:
+            if ab_log['isPitch'] != False:
+                log['rows'].append(self._matchup_row(ab_log,pa_events,bat_side))
+        log['events'] = len(pa_events)
+
+        matchup_df = pd.DataFrame.from_dict(data=log['rows'])
+        if matchup_df.empty:
+            matchup_df = pd.DataFrame(columns=headers)
+        
+        matchup_df.sort_values(by=["pitch_num"], inplace=True)
+        log['frame'] = matchup_df
 
-        for ab_log in pa_events:
-            play_id = ab_log.get('playId')
-            if ab_log['isPitch'] == False:
-                pass
-            else:
-                event = []
+        return matchup_df.copy()
 
-                pitch_number = ab_log['pitchNumber']
+    def _matchup_row(self,ab_log,pa_events,bat_side) -> dict:
+        play_id = ab_log.get('playId')
 
-                details = ab_log['details']
-                pitch_desc = details['description']
-                pitch_type = details.get('type',{}).get('description','unknown')
-                pitch_type_id = details.get('type',{}).get('code','UN')
-                pitch_code = details.get('code','UN')
+        pitch_number = ab_log['pitchNumber']
 
-                _pitch_data = ab_log.get('pitchData',{})
-                _hit_data = ab_log.get('hitData',{})
+        details = ab_log['details']
+        pitch_desc = details['description']
+        pitch_type = details.get('type',{}).get('description','unknown')
+        pitch_type_id = details.get('type',{}).get('code','UN')
+        pitch_code = details.get('code','UN')
 
-                start_vel = _pitch_data.get('startSpeed','--')
-                end_vel = _pitch_data.get('endSpeed','--')
+        _pitch_data = ab_log.get('pitchData',{})
+        _hit_data = ab_log.get('hitData',{})
 
-                pX = _pitch_data.get('coordinates',{}).get('pX','--')
-                pZ = _pitch_data.get('coordinates',{}).get('pZ','--')
+        start_vel = _pitch_data.get('startSpeed','--')
+        end_vel = _pitch_data.get('endSpeed','--')
 
-                try:
-                    zoneTopInitial = pa_events[0]['pitchData']['strikeZoneTop']
-                    zoneBottomInitial = pa_events[0]['pitchData']['strikeZoneBottom']
-                except:
-                    try:
-                        zoneTopInitial = pa_events[0]['pitchData']['strikeZoneTop']
-                        zoneBottomInitial = pa_events[0]['pitchData']['strikeZoneBottom']
-                    except:
-                        zoneTopInitial = 3.5
-                        zoneBottomInitial = 1.5
+        pX = _pitch_data.get('coordinates',{}).get('pX','--')
+        pZ = _pitch_data.get('coordinates',{}).get('pZ','--')
 
-                zone_top = _pitch_data.get('strikeZoneTop',3.5)
-                zone_bot = _pitch_data.get('strikeZoneBottom',1.5)
+        try:
+            zoneTopInitial = pa_events[0]['pitchData']['strikeZoneTop']
+            zoneBottomInitial = pa_events[0]['pitchData']['strikeZoneBottom']
+        except:
+            try:
+                zoneTopInitial = pa_events[0]['pitchData']['strikeZoneTop']
+                zoneBottomInitial = pa_events[0]['pitchData']['strikeZoneBottom']
+            except:
+                zoneTopInitial = 3.5
+                zoneBottomInitial = 1.5
 
-                spin = _pitch_data.get('breaks',{}).get('spinRate','')
-                zone = _pitch_data.get('zone','')
-                hit_location = _hit_data.get('hitData',{}).get('location','')
+        zone_top = _pitch_data.get('strikeZoneTop',3.5)
+        zone_bot = _pitch_data.get('strikeZoneBottom',1.5)
 
-                hX = _hit_data.get('coordinates',{}).get('coordX','')
-                hY = _hit_data.get('coordinates',{}).get('coordY','')
-                
-                events_data.append({
-                    'pitch_num':pitch_number,
-                    'details':pitch_desc,
-                    'zone_top':zone_top,
-                    'zone_bot':zone_bot,
-                    'zoneTopInitial':zoneTopInitial,
-                    'zoneBottomInitial':zoneBottomInitial,
-                    'bat_side':bat_side,
-                    'pitch_type':pitch_type,
-                    'pitch_type_id':pitch_type_id,
-                    'pitch_code':pitch_code,
-                    'release_speed':start_vel,
-                    'end_speed':end_vel,
-                    'spin':spin,
-                    'zone':zone,
-                    'pX':pX,
-                    'pZ':pZ,
-                    'hit_location':hit_location,
-                    'hX':hX,
-                    'hY':hY,
-                    'play_id':play_id
-                })
+        spin = _pitch_data.get('breaks',{}).get('spinRate','')
+        zone = _pitch_data.get('zone','')
+        hit_location = _hit_data.get('hitData',{}).get('location','')
 
-        matchup_df = pd.DataFrame.from_dict(data=events_data)
-        if matchup_df.empty:
-            matchup_df = pd.DataFrame(columns=headers)
-        
-        matchup_df.sort_values(by=["pitch_num"], inplace=True)
+        hX = _hit_data.get('coordinates',{}).get('coordX','')
+        hY = _hit_data.get('coordinates',{}).get('coordY','')
+
+        return {
+            'pitch_num':pitch_number,
+            'details':pitch_desc,
+            'zone_top':zone_top,
+            'zone_bot':zone_bot,
+            'zoneTopInitial':zoneTopInitial,
+            'zoneBottomInitial':zoneBottomInitial,
+            'bat_side':bat_side,
+            'pitch_type':pitch_type,
+            'pitch_type_id':pitch_type_id,
+            'pitch_code':pitch_code,
+            'release_speed':start_vel,
+            'end_speed':end_vel,
+            'spin':spin,
+            'zone':zone,
+            'pX':pX,
+            'pZ':pZ,
+            'hit_location':hit_location,
+            'hX':hX,
+            'hY':hY,
+            'play_id':play_id
+        }
 
-        return matchup_df
+    # ===============================================================
+    # Derived tables
+    # ===============================================================
+    # plays(), events() and timestamps() keep their rows per play. When the
+    # plays are re-indexed from some play onwards (see `_load_plays`) only
+    # the rows from that play on are dropped; the next access turns just
+    # the plays after the last processed one into rows
+
+    def _table(self,name:str,play_rows) -> pd.DataFrame:
+        tables = self.__dict__.setdefault('_tables',{})
+        t = tables.get(name)
+        if t is None:
+            # offsets: number of rows before each processed play
+            t = tables[name] = {'frame':None,'plays':0,'offsets':[0]}
+        if t['frame'] is not None and t['plays'] == len(self._all_plays):
+            return t['frame']
+        rows = []
+        # kept aside until frame/plays are updated so that a failing
+        # play_rows leaves the table as it was
+        new_offsets = []
+        base = t['offsets'][-1]
+        for play in self._all_plays[t['plays']:]:
+            rows.extend(play_rows(play))
+            new_offsets.append(base + len(rows))
+        new = pd.DataFrame.from_dict(rows)
+        if t['frame'] is None or len(t['frame'].columns) == 0:
+            t['frame'] = new
+        elif len(rows) > 0:
+            t['frame'] = pd.concat([t['frame'],new],ignore_index=True)
+        t['plays'] = len(self._all_plays)
+        t['offsets'].extend(new_offsets)
+        return t['frame']
+
+    def _truncate_tables(self,start:int):
+        for t in self.__dict__.get('_tables',{}).values():
+            if t['plays'] > start:
+                t['frame'] = t['frame'].iloc[:t['offsets'][start]]
+                del t['offsets'][start + 1:]
+                t['plays'] = start
+        self._matchup_log = None
+
+    def _home_batting(self,play) -> bool:
+        half = play.get('about',{}).get('halfInning')
+        if half is not None:
+            return half == 'bottom'
+        batter_mlbam = play.get('matchup',{}).get('batter',{}).get('id')
+        return f'ID{batter_mlbam}' in self._home_players
 
     def plays(self) -> pd.DataFrame:
         """
@@ -993,119 +1514,274 @@ class Game:
 
         NOTE: Dataframe begins with most recent plate appearance
         """
+        return self._table('plays',self._play_rows).iloc[::-1]
 
-        events_data = []
-        for play in self._all_plays:
-            ev_data = {}
-            events = play['playEvents']
-            for e in events:
-                if 'game_advisory' in e.get('details', {}).get('eventType', '').lower():
-                    pass
-                else:
-                    firstEvent = e
-                    break
-                
-            # Sometimes, the 'playEvents' array isn't populated for a few seconds; 
-            # So we skip over it for the time being
-            if len(events) == 0:
-                continue
-            _play_matchup = play.get('matchup',{})
-            lastEvent = events[-1]
-            play_id = lastEvent.get("playId", "-")
-            pitchData = lastEvent.get('pitchData',{})
-            try:
-                ab_num = play["atBatIndex"] + 1
-            except:
-                ab_num = "--"
+    def _play_rows(self,play) -> list:
+        ev_data = {}
+        events = play['playEvents']
+        for e in events:
+            if 'game_advisory' in e.get('details', {}).get('eventType', '').lower():
+                pass
+            else:
+                firstEvent = e
+                break
             
-            bat_side = _play_matchup.get('batSide',{}).get('code','--')
+        # Sometimes, the 'playEvents' array isn't populated for a few seconds; 
+        # So we skip over it for the time being
+        if len(events) == 0:
+            return []
+        _play_matchup = play.get('matchup',{})
+        lastEvent = events[-1]
+        play_id = lastEvent.get("playId", "-")
+        pitchData = lastEvent.get('pitchData',{})
+        try:
+            ab_num = play["atBatIndex"] + 1
+        except:
+            ab_num = "--"
+        
+        bat_side = _play_matchup.get('batSide',{}).get('code','--')
 
-            innNum = play.get('about',{}).get('inning','--')
-            innHalf = play.get('about',{}).get('halfInning','--')
+        innNum = play.get('about',{}).get('inning','--')
+        innHalf = play.get('about',{}).get('halfInning','--')
 
-            if innHalf == "bottom":
-                inning = f"Bot {innNum}"
-            else:
-                inning = f"Top {innNum}"
+        if innHalf == "bottom":
+            inning = f"Bot {innNum}"
+        else:
+            inning = f"Top {innNum}"
 
-            batter = _play_matchup.get('batter',{})
-            batter_name = batter.get('fullName','--')
-            batter_mlbam = batter.get('id','--')
-            
-            pitcher = _play_matchup.get('pitcher',{})
-            pitcher_name = pitcher.get('fullName','--')
-            pitcher_mlbam = pitcher.get('id','--')
-            
-            pa_pitch_count = lastEvent.get('pitchNumber','--')
+        batter = _play_matchup.get('batter',{})
+        batter_name = batter.get('fullName','--')
+        batter_mlbam = batter.get('id','--')
+        
+        pitcher = _play_matchup.get('pitcher',{})
+        pitcher_name = pitcher.get('fullName','--')
+        pitcher_mlbam = pitcher.get('id','--')
+        
+        pa_pitch_count = lastEvent.get('pitchNumber','--')
 
-            _play_result = play.get('result',{})
-            event = _play_result.get('event','--')
-            event_type = _play_result.get('eventType','--')
-            details = _play_result.get('description','--')
+        _play_result = play.get('result',{})
+        event = _play_result.get('event','--')
+        event_type = _play_result.get('eventType','--')
+        details = _play_result.get('description','--')
 
+        try:
+            pitchType = lastEvent["details"]["type"]["description"]
+            pitchCode = lastEvent["details"]["type"]["code"]
+        except:
+            pitchType = "--"
+            pitchCode = "--"
+        try:
+            releaseSpeed = pitchData["startSpeed"]
+        except:
+            releaseSpeed = "--"
+        try:
+            endSpeed = pitchData["endSpeed"]
+        except:
+            endSpeed = "--"
+        try:
+            spinRate = pitchData["breaks"]["spinRate"]
+        except:
+            spinRate = "--"
+        try:
+            zone = pitchData["zone"]
+        except:
+            zone = "--"
+
+        # Hit Data (and Trajectory - if ball is in play)
+        _hitData = lastEvent.get('hitData',{})
+        launch_speed = _hitData.get('launchSpeed','-')
+        launch_angle = _hitData.get('launchAngle','-')
+        distance = _hitData.get('totalDistance','-')
+        location = _hitData.get('location','-')
+        hX = _hitData.get('coordinates',{}).get('coordX','-')
+        hY = _hitData.get('coordinates',{}).get('coordY','-')
+        hitTrajectory = _hitData.get('trajectory','-')
+
+        # Event Category/Type
+        category = lastEvent.get('type','-')
+
+        # Time information
+        try:
+            startTime = firstEvent["startTime"]
+            startTime_obj = dt.datetime.strptime(startTime, utils.iso_format_ms).replace(
+                tzinfo=utils.utc_zone
+            )
+            startTime = dt.datetime.strftime(startTime_obj, utils.iso_format_ms)
+
+        except:
+            startTime = "--"
+        try:
+            endTime = lastEvent["endTime"]
+            endTime_obj = dt.datetime.strptime(endTime, utils.iso_format_ms).replace(
+                tzinfo=utils.utc_zone
+            )
+            endTime = dt.datetime.strftime(endTime_obj, utils.iso_format_ms)
+            # endTime = dt.datetime.strptime(play["playEvents"][-1]["endTime"],utils.iso_format_ms).replace(tzinfo=utils.utc_zone)
+
+            elasped = endTime_obj - startTime_obj
+
+        except Exception as e:
+            endTime = "--"
+            elasped = "--"
+            print(f"ERROR: -- {e} --")
+
+        # Is Home Team Batting?
+        if self._home_batting(play):
+            is_home = True
+            bat_tm_mlbam = self.home_id
+            bat_tm_name = self._home_team
+        else:
+            is_home = False
+            bat_tm_mlbam = self.away_id
+            bat_tm_name = self._away_team
+
+        ev_data = {'bat_tm_mlbam':bat_tm_mlbam,
+                    'bat_tm_name':bat_tm_name,
+                    'pa':ab_num,
+                    'inning':inning,
+                    'batter':batter_name,
+                    'bat_side':bat_side,
+                    'pitcher':pitcher_name,
+                    'pa_pitch_count':pa_pitch_count,
+                    'event':event,
+                    'event_type':event_type,
+                    'details':details,
+                    'pitch_type':pitchType,
+                    'pitch_code':pitchCode,
+                    'release_velocity':releaseSpeed,
+                    'end_velocity':endSpeed,
+                    'spin_rate':spinRate,
+                    'zone':zone,
+                    'exit_velocity':launch_speed,
+                    'launch_angle':launch_angle,
+                    'distance':distance,
+                    'location':location,
+                    'hit_trajectory':hitTrajectory,
+                    'hX':hX,
+                    'hY':hY,
+                    'category':category,
+                    'timeElasped':utils.prettify_time(elasped),
+                    'timeStart':utils.prettify_time(startTime),
+                    'timeEnd':utils.prettify_time(endTime),
+                    'batter_mlbam':batter_mlbam,
+                    'pitcher_mlbam':pitcher_mlbam,
+                    'is_home':is_home,
+                    'play_id':play_id,
+                    }
+
+        return [ev_data]
+
+    def events(self) -> pd.DataFrame:
+        """Get detailed log of every pitch event
+
+        NOTE: Dataframe begins with most recent pitch event
+        """
+        return self._table('events',self._event_rows).iloc[::-1]
+
+    def _event_rows(self,play) -> list:
+        events_data = []
+        
+        try:
+            ab_num = play['about']['atBatIndex'] + 1
+        except:
+            ab_num = '--'
+        
+        matchup = play.get('matchup',{'batter':{},'pitcher':{}})
+        
+        batter = matchup['batter']
+        batter_name = batter.get('fullName','--')
+        batter_mlbam = batter.get('id','--')
+        
+        pitcher = matchup['pitcher']
+        pitcher_name = pitcher.get('fullName','--')
+        pitcher_mlbam = pitcher.get('id','--')
+
+        zone_top = self._players.get(f'ID{batter_mlbam}',{}
+                                     ).get('strikeZoneTop','-')
+        zone_bot = self._players.get(f'ID{batter_mlbam}',{}
+                                     ).get('strikeZoneBottom','-')
+            
+        bat_side = matchup.get('batSide',{}).get('code')
+            
+        play_events = play['playEvents']
+        if len(play_events) == 0:
+            return []
+        home_batting = self._home_batting(play)
+        last_idx = play_events[-1]['index']
+
+        for event_idx, event in enumerate(play_events):
+            play_id = event.get('playId')
             try:
-                pitchType = lastEvent["details"]["type"]["description"]
-                pitchCode = lastEvent["details"]["type"]["code"]
-            except:
-                pitchType = "--"
-                pitchCode = "--"
-            try:
-                releaseSpeed = pitchData["startSpeed"]
+                if event_idx != last_idx:
+                    desc = '--'
+                else:
+                    desc = play['result']['description']
             except:
-                releaseSpeed = "--"
+                desc = '--'
+
+            event_label = play.get('result',{}).get('event','--')
+            event_type  = play.get('result',{}).get('eventType','--')
+            pitch_number = event.get('pitchNumber',0)
+
+            # Times
             try:
-                endSpeed = pitchData["endSpeed"]
+                startTime = dt.datetime.strptime(
+                    event['startTime'], utils.iso_format_ms
+                ).replace(tzinfo=utils.utc_zone)
             except:
-                endSpeed = "--"
+                startTime = '--'
             try:
-                spinRate = pitchData["breaks"]["spinRate"]
+                endTime = dt.datetime.strptime(
+                    event['endTime'], utils.iso_format_ms
+                ).replace(tzinfo=utils.utc_zone)
             except:
-                spinRate = "--"
+                endTime = '--'
             try:
-                zone = pitchData["zone"]
+                elapsed = endTime - startTime
+                elapsed = utils.prettify_time(elapsed)
             except:
-                zone = "--"
+                elapsed = '--'
+
+            # Call and Pitch Type and Count/Outs
+            _event_details = event['details']
+            pitchType = _event_details.get('type',{}).get('description','--')
+            pitchCode = _event_details.get('type',{}).get('code','--')
+            call = _event_details.get('description','--')
+            
+            _count_data = event.get('count',{})
+            balls = _count_data.get('balls',0)
+            strikes = _count_data.get('strikes',0)
+            count = f'{balls}-{strikes}'
+            outs = _count_data.get('outs',0)
+
+
+            # Pitch Data
+            _pitchData = event.get('pitchData',{})
+            
+            startSpeed = _pitchData.get('startSpeed','-')
+            endSpeed   = _pitchData.get('endSpeed','-')
+            spinRate   = _pitchData.get('breaks',{}).get('spinRate','-')
+            zone = _pitchData.get('zone','-')
+
+            pX = _pitchData.get('coordinates',{}).get('pX','-')
+            pZ = _pitchData.get('coordinates',{}).get('pZ','-')
+
+            zone_top = _pitchData.get('strikeZoneTope',3.5)
+            zone_bot = _pitchData.get('strikeZoneTope',1.5)
 
-            # Hit Data (and Trajectory - if ball is in play)
-            _hitData = lastEvent.get('hitData',{})
+            # Hit Data
+            _hitData = event.get('hitData',{})
             launch_speed = _hitData.get('launchSpeed','-')
             launch_angle = _hitData.get('launchAngle','-')
             distance = _hitData.get('totalDistance','-')
             location = _hitData.get('location','-')
             hX = _hitData.get('coordinates',{}).get('coordX','-')
             hY = _hitData.get('coordinates',{}).get('coordY','-')
-            hitTrajectory = _hitData.get('trajectory','-')
 
-            # Event Category/Type
-            category = lastEvent.get('type','-')
-
-            # Time information
-            try:
-                startTime = firstEvent["startTime"]
-                startTime_obj = dt.datetime.strptime(startTime, utils.iso_format_ms).replace(
-                    tzinfo=utils.utc_zone
-                )
-                startTime = dt.datetime.strftime(startTime_obj, utils.iso_format_ms)
-
-            except:
-                startTime = "--"
-            try:
-                endTime = lastEvent["endTime"]
-                endTime_obj = dt.datetime.strptime(endTime, utils.iso_format_ms).replace(
-                    tzinfo=utils.utc_zone
-                )
-                endTime = dt.datetime.strftime(endTime_obj, utils.iso_format_ms)
-                # endTime = dt.datetime.strptime(play["playEvents"][-1]["endTime"],utils.iso_format_ms).replace(tzinfo=utils.utc_zone)
-
-                elasped = endTime_obj - startTime_obj
-
-            except Exception as e:
-                endTime = "--"
-                elasped = "--"
-                print(f"ERROR: -- {e} --")
+            category = event.get('type','--')
 
             # Is Home Team Batting?
-            if f"ID{batter_mlbam}" in self._home_players.keys():
+            if home_batting:
                 is_home = True
                 bat_tm_mlbam = self.home_id
                 bat_tm_name = self._home_team
@@ -1113,210 +1789,49 @@ class Game:
                 is_home = False
                 bat_tm_mlbam = self.away_id
                 bat_tm_name = self._away_team
-
+                
             ev_data = {'bat_tm_mlbam':bat_tm_mlbam,
                         'bat_tm_name':bat_tm_name,
                         'pa':ab_num,
-                        'inning':inning,
+                        'event':event_label,
+                        'event_type':event_type,
+                        'inning':play['about']['inning'],
+                        'pitch_idx':event_idx,
                         'batter':batter_name,
+                        'batter_mlbam':batter_mlbam,
                         'bat_side':bat_side,
+                        'zone_top':zone_top,
+                        'zone_bot':zone_bot,
                         'pitcher':pitcher_name,
-                        'pa_pitch_count':pa_pitch_count,
-                        'event':event,
-                        'event_type':event_type,
-                        'details':details,
+                        'pitcher_mlbam':pitcher_mlbam,
+                        'desc':desc,
+                        'pitch_num':pitch_number,
                         'pitch_type':pitchType,
                         'pitch_code':pitchCode,
-                        'release_velocity':releaseSpeed,
+                        'call':call,
+                        'count':count,
+                        'outs':outs,
+                        'release_velocity':startSpeed,
                         'end_velocity':endSpeed,
                         'spin_rate':spinRate,
                         'zone':zone,
+                        'pX':pX,
+                        'pZ':pZ,
                         'exit_velocity':launch_speed,
                         'launch_angle':launch_angle,
                         'distance':distance,
                         'location':location,
-                        'hit_trajectory':hitTrajectory,
                         'hX':hX,
                         'hY':hY,
                         'category':category,
-                        'timeElasped':utils.prettify_time(elasped),
-                        'timeStart':utils.prettify_time(startTime),
-                        'timeEnd':utils.prettify_time(endTime),
-                        'batter_mlbam':batter_mlbam,
-                        'pitcher_mlbam':pitcher_mlbam,
+                        'end_time':endTime,
                         'is_home':is_home,
                         'play_id':play_id,
                         }
 
             events_data.append(ev_data)
 
-        df = pd.DataFrame.from_dict(data=events_data).sort_values(by='pa',
-                                                              ascending=False)
-
-        return df
-
-    def events(self) -> pd.DataFrame:
-        """Get detailed log of every pitch event
-
-        NOTE: Dataframe begins with most recent pitch event
-        """
-        
-        events_data = []
-        for play in self._all_plays:
-            
-            try:
-                ab_num = play['about']['atBatIndex'] + 1
-            except:
-                ab_num = '--'
-            
-            matchup = play.get('matchup',{'batter':{},'pitcher':{}})
-            
-            batter = matchup['batter']
-            batter_name = batter.get('fullName','--')
-            batter_mlbam = batter.get('id','--')
-            
-            pitcher = matchup['pitcher']
-            pitcher_name = pitcher.get('fullName','--')
-            pitcher_mlbam = pitcher.get('id','--')
-
-            zone_top = self._players.get(f'ID{batter_mlbam}',{}
-                                         ).get('strikeZoneTop','-')
-            zone_bot = self._players.get(f'ID{batter_mlbam}',{}
-                                         ).get('strikeZoneBottom','-')
-                
-            bat_side = matchup.get('batSide',{}).get('code')
-                
-            play_events = play['playEvents']
-            if len(play_events) == 0:
-                continue
-            last_idx = play_events[-1]['index']
-
-            for event_idx, event in enumerate(play_events):
-                play_id = event.get('playId')
-                try:
-                    if event_idx != last_idx:
-                        desc = '--'
-                    else:
-                        desc = play['result']['description']
-                except:
-                    desc = '--'
-
-                event_label = play.get('result',{}).get('event','--')
-                event_type  = play.get('result',{}).get('eventType','--')
-                pitch_number = event.get('pitchNumber',0)
-
-                # Times
-                try:
-                    startTime = dt.datetime.strptime(
-                        event['startTime'], utils.iso_format_ms
-                    ).replace(tzinfo=utils.utc_zone)
-                except:
-                    startTime = '--'
-                try:
-                    endTime = dt.datetime.strptime(
-                        event['endTime'], utils.iso_format_ms
-                    ).replace(tzinfo=utils.utc_zone)
-                except:
-                    endTime = '--'
-                try:
-                    elapsed = endTime - startTime
-                    elapsed = utils.prettify_time(elapsed)
-                except:
-                    elapsed = '--'
-
-                # Call and Pitch Type and Count/Outs
-                _event_details = event['details']
-                pitchType = _event_details.get('type',{}).get('description','--')
-                pitchCode = _event_details.get('type',{}).get('code','--')
-                call = _event_details.get('description','--')
-                
-                _count_data = event.get('count',{})
-                balls = _count_data.get('balls',0)
-                strikes = _count_data.get('strikes',0)
-                count = f'{balls}-{strikes}'
-                outs = _count_data.get('outs',0)
-
-
-                # Pitch Data
-                _pitchData = event.get('pitchData',{})
-                
-                startSpeed = _pitchData.get('startSpeed','-')
-                endSpeed   = _pitchData.get('endSpeed','-')
-                spinRate   = _pitchData.get('breaks',{}).get('spinRate','-')
-                zone = _pitchData.get('zone','-')
-
-                pX = _pitchData.get('coordinates',{}).get('pX','-')
-                pZ = _pitchData.get('coordinates',{}).get('pZ','-')
-
-                zone_top = _pitchData.get('strikeZoneTope',3.5)
-                zone_bot = _pitchData.get('strikeZoneTope',1.5)
-
-                # Hit Data
-                _hitData = event.get('hitData',{})
-                launch_speed = _hitData.get('launchSpeed','-')
-                launch_angle = _hitData.get('launchAngle','-')
-                distance = _hitData.get('totalDistance','-')
-                location = _hitData.get('location','-')
-                hX = _hitData.get('coordinates',{}).get('coordX','-')
-                hY = _hitData.get('coordinates',{}).get('coordY','-')
-
-                category = event.get('type','--')
-
-                # Is Home Team Batting?
-                if f'ID{batter["id"]}' in self._home_players.keys():
-                    is_home = True
-                    bat_tm_mlbam = self.home_id
-                    bat_tm_name = self._home_team
-                else:
-                    is_home = False
-                    bat_tm_mlbam = self.away_id
-                    bat_tm_name = self._away_team
-                    
-                ev_data = {'bat_tm_mlbam':bat_tm_mlbam,
-                            'bat_tm_name':bat_tm_name,
-                            'pa':ab_num,
-                            'event':event_label,
-                            'event_type':event_type,
-                            'inning':play['about']['inning'],
-                            'pitch_idx':event_idx,
-                            'batter':batter_name,
-                            'batter_mlbam':batter_mlbam,
-                            'bat_side':bat_side,
-                            'zone_top':zone_top,
-                            'zone_bot':zone_bot,
-                            'pitcher':pitcher_name,
-                            'pitcher_mlbam':pitcher_mlbam,
-                            'desc':desc,
-                            'pitch_num':pitch_number,
-                            'pitch_type':pitchType,
-                            'pitch_code':pitchCode,
-                            'call':call,
-                            'count':count,
-                            'outs':outs,
-                            'release_velocity':startSpeed,
-                            'end_velocity':endSpeed,
-                            'spin_rate':spinRate,
-                            'zone':zone,
-                            'pX':pX,
-                            'pZ':pZ,
-                            'exit_velocity':launch_speed,
-                            'launch_angle':launch_angle,
-                            'distance':distance,
-                            'location':location,
-                            'hX':hX,
-                            'hY':hY,
-                            'category':category,
-                            'end_time':endTime,
-                            'is_home':is_home,
-                            'play_id':play_id,
-                            }
-
-                events_data.append(ev_data)
-
-        df = pd.DataFrame.from_dict(events_data).sort_values(
-            by=["pa", "pitch_idx"], ascending=False)
-        
-        return df
+        return events_data
 
     # TEAMS' INDIVIDUAL BATTER STATS
     def away_batting_stats(self) -> pd.DataFrame:
@@ -1848,75 +2363,33 @@ class Game:
 
     def timestamps(self) -> pd.DataFrame:
         """Get timestamps for all plays as "timecodes" """
-        plays = self._all_plays
+        df = self._table('timestamps',self._timestamp_rows)
+        if len(df.columns) == 0:
+            return pd.DataFrame(columns=TIMESTAMP_COLUMNS)
+        # the cached table is extended in place on later refreshes
+        return df.copy()
+
+    def _timestamp_rows(self,play) -> list:
+        play_type = play.get("result", {}).get("type")
+        abIndex = play.get("atBatIndex")
         ts = []
-        for p in plays:
-            play_type = p.get("result", {}).get("type")
-            playStartTime = p.get("about", {}).get("startTime")
-            playEndTime = p.get("playEndTime", "-")
-            playEvents = p.get("playEvents", [])
-            # print(playEvents)
-            try:
-                abIndex = p.get("atBatIndex")
-                ab_num = abIndex + 1
-            except:
-                pass
-            for e in playEvents:
-                play_id = e.get("playId")
-                eventStart = e.get("startTime")
-                eventEnd = e.get("endTime")
-                event_idx = e.get("index")
-                event_num = event_idx + 1
-                details = e.get("details", {})
-                event_type = details.get("eventType")
-                event_type2 = details.get("event")
-                event_desc = details.get("description")
-                if eventStart is None:
-                    start_tc = "-"
-                else:
-                    start_tc = dt.datetime.strptime(
-                        eventStart, r"%Y-%m-%dT%H:%M:%S.%fZ"
-                    )
-                    start_tc = start_tc.strftime(r"%Y%m%d_%H%M%S")
-                if eventEnd is None:
-                    end_tc = "-"
-                else:
-                    end_tc = dt.datetime.strptime(eventEnd, r"%Y-%m-%dT%H:%M:%S.%fZ")
-                    end_tc = end_tc.strftime(r"%Y%m%d_%H%M%S")
-
-                ts.append(
-                    [
-                        abIndex,
-                        play_type,
-                        # playStartTime,
-                        # playEndTime,
-                        event_idx,
-                        f"{event_type2} ({event_type})",
-                        event_desc,
-                        eventStart,
-                        start_tc,
-                        eventEnd,
-                        end_tc,
-                        play_id,
-                    ]
-                )
-        df = pd.DataFrame(
-            data=ts,
-            columns=(
-                "ab_idx",
-                "type",
-                "event_idx",
-                "event_type",
-                "event_desc",
-                "event_start",
-                "start_tc",
-                "event_end",
-                "end_tc",
-                "play_id",
-            ),
-        )
-
-        return df
+        for e in play.get("playEvents", []):
+            details = e.get("details", {})
+            eventStart = e.get("startTime")
+            eventEnd = e.get("endTime")
+            ts.append({
+                "ab_idx": abIndex,
+                "type": play_type,
+                "event_idx": e.get("index"),
+                "event_type": f"{details.get('event')} ({details.get('eventType')})",
+                "event_desc": details.get("description"),
+                "event_start": eventStart,
+                "start_tc": "-" if eventStart is None else _timecode(eventStart),
+                "event_end": eventEnd,
+                "end_tc": "-" if eventEnd is None else _timecode(eventEnd),
+                "play_id": e.get("playId"),
+            })
+        return ts
 
     def flags(self) -> dict:
         f = self._flags
@@ -1924,7 +2397,7 @@ class Game:
 
     def get_content(self):
         url = c.BASE + f'/game/{self.gamePk}/content'
-        resp = requests.get(url)
+        resp = client.http.get(url)
         return resp.json()
 
     def raw_feed_data(self):
@@ -1936,7 +2409,7 @@ class Game:
             url = f'https://statsapi.mlb.com/api/v1.1/game/{self.gamePk}/feed/live?timecode={timecode}'
         else:
             url = f'https://statsapi.mlb.com/api/v1.1/game/{self.gamePk}/feed/live'
-        resp = requests.get(url)
+        resp = client.http.get(url)
         return resp.json()
 
     def context_splits(self, batterID, pitcherID):  
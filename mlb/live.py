@@ -0,0 +1,302 @@
+"""Follow a day's slate of games as they happen
+
+`LiveTracker` loads the games scheduled on a date and keeps each one up to
+date with `Game.refresh_async()`. Every game is polled by its own task on
+the package's shared async client (one connection pool for the whole
+slate), and each game sets its own pace from its `abstractGameState`: slow
+while it is in Preview, fast while it is Live, and not at all once it is
+Final. A game whose polls keep coming back unchanged (rain delays, pitching
+changes, the break between innings) is polled less and less often until
+something changes again.
+
+Examples
+--------
+```
+import asyncio
+from mlb.live import LiveTracker
+
+def show(game, summary):
+    print(game)
+
+async def main():
+    tracker = LiveTracker(on_update=show)
+    await tracker.run()       # returns once every game is Final
+
+asyncio.run(main())
+```
+
+From synchronous code the tracker can run on the package's background
+event loop instead:
+
+>>> tracker = LiveTracker('2021-07-04')
+>>> tracker.start()
+>>> tracker.status()
+>>> tracker.stop()
+"""
+import time
+import asyncio
+import inspect
+import datetime as dt
+import concurrent.futures
+
+import pandas as pd
+
+from . import aio
+from . import functions as funcs
+from .game import Game
+from .async_mlb.runner import background_loop
+
+# seconds between polls of a game, by abstractGameState. Final games
+# aren't polled
+INTERVALS = {
+    'Preview':  300.0,
+    'Live':     10.0,
+}
+
+# each unchanged poll stretches the interval by BACKOFF, up to MAX_BACKOFF
+# times the base interval
+BACKOFF = 1.5
+MAX_BACKOFF = 6.0
+
+class TrackedGame:
+    """Polling state of one game followed by a `LiveTracker`"""
+    def __init__(self,game_pk:int):
+        self.game_pk = game_pk
+        self.game: Game = None
+        self.state: str = None
+        self.polls = 0
+        self.changes = 0
+        self.errors = 0
+        self.callback_errors = 0
+        self.last_error: Exception = None
+        self.backoff = 1.0
+        self.interval: float = None
+        self.next_poll: float = None
+
+    def __repr__(self):
+        return f"<TrackedGame {self.game_pk} {self.state} every {self.interval}s>"
+
+class LiveTracker:
+    """Concurrent, state-adaptive polling of many live games
+
+    Parameters:
+    -----------
+    date : str, optional (format: "YYYY-mm-dd")
+        the date whose slate is followed (default: today)
+
+    games : list[int], optional
+        follow these gamePks instead of (or, with `date`, out of) the
+        whole slate
+
+    intervals : dict, optional
+        seconds between polls by abstractGameState, merged over
+        `INTERVALS`. States without an interval use Preview's
+
+    backoff : float, default 1.5
+        factor the interval grows by after each unchanged poll
+
+    max_backoff : float, default 6.0
+        largest multiple of the base interval a game backs off to
+
+    on_update : callable, optional
+        called as `on_update(game, summary)` every time a game changes
+        (`summary` is what `Game.refresh()` returns). May be a coroutine
+        function. Exceptions it raises are counted on the game
+        (`TrackedGame.callback_errors`/`last_error`) and polling goes on
+
+    tz : str, default 'et'
+        timezone passed to each `Game`
+
+    """
+    def __init__(self,date:str=None,games:list=None,intervals:dict=None,
+                 backoff:float=BACKOFF,max_backoff:float=MAX_BACKOFF,on_update=None,tz:str='et'):
+        if date is None and games is None:
+            date = dt.date.today().strftime(r'%Y-%m-%d')
+        self.date = date
+        self.intervals = dict(INTERVALS,**(intervals or {}))
+        self.backoff = float(backoff)
+        self.max_backoff = float(max_backoff)
+        self.on_update = on_update
+        self.tz = tz
+        self._game_pks = None if games is None else [int(pk) for pk in games]
+        self._tracked: dict = {}
+        self._stop: asyncio.Event = None
+        self._loop: asyncio.AbstractEventLoop = None
+        self._future: concurrent.futures.Future = None
+
+    def __repr__(self):
+        states = {}
+        for t in self._tracked.values():
+            states[t.state] = states.get(t.state,0) + 1
+        return f"<LiveTracker {self.date or ''} {states}>"
+
+    def __getitem__(self,game_pk) -> Game:
+        return self._tracked[int(game_pk)].game
+
+    @property
+    def games(self) -> dict:
+        """gamePk -> `Game` for every loaded game"""
+        return {pk:t.game for pk,t in self._tracked.items() if t.game is not None}
+
+    @property
+    def tracked(self) -> dict:
+        """gamePk -> `TrackedGame` (polling state)"""
+        return dict(self._tracked)
+
+    # -----------------------------------------------------------
+    # Loading
+    # -----------------------------------------------------------
+    async def _slate(self) -> list:
+        if self.date is None:
+            return list(self._game_pks)
+        sched = await asyncio.to_thread(funcs.schedule,date=self.date)
+        game_pks = []
+        for pk in sched['gamePk']:
+            pk = int(pk)
+            if pk not in game_pks and (self._game_pks is None or pk in self._game_pks):
+                game_pks.append(pk)
+        return game_pks
+
+    async def _load_game(self,tracked:TrackedGame):
+        tracked.game = await aio.Game(tracked.game_pk,tz=self.tz)
+        tracked.state = tracked.game.abstract_state
+        self._schedule(tracked,changed=True)
+
+    async def load(self) -> dict:
+        """Load the slate and the current feed of every game in it
+        (concurrently)"""
+        for pk in await self._slate():
+            self._tracked.setdefault(pk,TrackedGame(pk))
+        pending = [t for t in self._tracked.values() if t.game is None]
+        results = await asyncio.gather(*(self._load_game(t) for t in pending),return_exceptions=True)
+        for tracked, result in zip(pending,results):
+            if isinstance(result,BaseException):
+                if not isinstance(result,Exception):
+                    raise result
+                tracked.errors += 1
+        return self.games
+
+    # -----------------------------------------------------------
+    # Polling
+    # -----------------------------------------------------------
+    def _schedule(self,tracked:TrackedGame,changed:bool):
+        if changed:
+            tracked.backoff = 1.0
+        else:
+            tracked.backoff = min(tracked.backoff * self.backoff,self.max_backoff)
+        base = self.intervals.get(tracked.state,self.intervals['Preview'])
+        tracked.interval = round(base * tracked.backoff,3)
+        tracked.next_poll = time.time() + tracked.interval
+
+    async def _poll(self,tracked:TrackedGame) -> bool:
+        """Refresh one game. Returns whether anything changed"""
+        tracked.polls += 1
+        try:
+            if tracked.game is None:
+                await self._load_game(tracked)
+                summary = {'full':True,'ops':0,'sections':[],'first_play':0}
+            else:
+                summary = await tracked.game.refresh_async()
+        except Exception as exc:
+            # network errors and malformed feeds alike only cost this game
+            # a poll; the rest of the slate keeps going
+            tracked.errors += 1
+            tracked.last_error = exc
+            self._schedule(tracked,changed=False)
+            return False
+        changed = summary['full'] or summary['ops'] > 0
+        tracked.state = tracked.game.abstract_state
+        if changed:
+            tracked.changes += 1
+        self._schedule(tracked,changed)
+        if changed and self.on_update is not None:
+            # a failing callback mustn't stop this (or any other) game
+            try:
+                result = self.on_update(tracked.game,summary)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as exc:
+                tracked.callback_errors += 1
+                tracked.last_error = exc
+        return changed
+
+    async def _follow(self,tracked:TrackedGame):
+        while tracked.state != 'Final' and not self._stop.is_set():
+            delay = 0 if tracked.next_poll is None else max(tracked.next_poll - time.time(),0)
+            try:
+                await asyncio.wait_for(self._stop.wait(),timeout=delay)
+                return
+            except asyncio.TimeoutError:
+                pass
+            await self._poll(tracked)
+
+    async def run(self) -> dict:
+        """Follow every game until they are all Final (or `stop()` is
+        called). Returns gamePk -> `Game`"""
+        self._loop = asyncio.get_running_loop()
+        self._stop = asyncio.Event()
+        await self.load()
+        tasks = [asyncio.ensure_future(self._follow(t)) for t in self._tracked.values()]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            # polls don't raise, so this is for run() being cancelled
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks,return_exceptions=True)
+        return self.games
+
+    def start(self) -> concurrent.futures.Future:
+        """Run the tracker on the package's background event loop without
+        blocking. The returned future resolves to `run()`'s result"""
+        if self._future is not None and not self._future.done():
+            return self._future
+        self._future = asyncio.run_coroutine_threadsafe(self.run(),background_loop.loop)
+        return self._future
+
+    def stop(self):
+        """Stop polling (safe to call from any thread)"""
+        loop, event = self._loop, self._stop
+        if loop is None or event is None or loop.is_closed():
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            event.set()
+        else:
+            loop.call_soon_threadsafe(event.set)
+
+    def wait(self,timeout:float=None) -> dict:
+        """Block until a tracker started with `start()` finishes"""
+        if self._future is None:
+            raise RuntimeError("the tracker hasn't been started")
+        return self._future.result(timeout)
+
+    # -----------------------------------------------------------
+    # Reporting
+    # -----------------------------------------------------------
+    def status(self) -> pd.DataFrame:
+        """One row per game: score, state and polling statistics"""
+        now = time.time()
+        data = []
+        for pk, t in self._tracked.items():
+            g = t.game
+            data.append({
+                'gamePk':pk,
+                'away':None if g is None else g.away_abbrv,
+                'away_score':None if g is None else g.away_runs,
+                'home':None if g is None else g.home_abbrv,
+                'home_score':None if g is None else g.home_runs,
+                'state':t.state,
+                'detailed_state':None if g is None else g.detailed_state,
+                'inning':None if g is None else g._inn_label,
+                'polls':t.polls,
+                'changes':t.changes,
+                'errors':t.errors,
+                'callback_errors':t.callback_errors,
+                'interval':t.interval,
+                'next_poll':None if t.next_poll is None or t.state == 'Final' else round(max(t.next_poll - now,0),1),
+            })
+        return pd.DataFrame(data=data)
@@ -10,3 +10,4 @@ from .stats import StatTypeCollection
 from .people import Person, PersonName, PlayerDirectory
 from .team import TeamInfo, TeamName, TeamRosters, TeamStats
 from .misc import Position
+from .game import GameEvent, PitchEvent, PlayEvent, SubstitutionEvent, ScoreChange
@@ -0,0 +1,72 @@
+from dataclasses import dataclass, asdict
+from typing import Optional, Dict
+
+@dataclass(frozen=True)
+class GameEvent:
+    """Something that happened in a game, as yielded by `Game.stream()`"""
+    kind: str
+    game_pk: int
+    at_bat_index: int
+    event_index: Optional[int]
+    play_id: Optional[str]
+    inning: Optional[int]
+    half_inning: Optional[str]
+    description: Optional[str]
+    data: Dict
+
+    @property
+    def key(self) -> tuple:
+        """Unique key of the event within its game"""
+        if self.play_id is not None:
+            return (self.kind,self.play_id)
+        return (self.kind,self.at_bat_index,self.event_index)
+
+    def asdict(self):
+        return asdict(self)
+
+    def __repr__(self):
+        if self.event_index is None:
+            return f"<{self.kind} {self.at_bat_index} {self.description!r}>"
+        return f"<{self.kind} {self.at_bat_index}.{self.event_index} {self.description!r}>"
+
+@dataclass(frozen=True,repr=False)
+class PitchEvent(GameEvent):
+    pitch_number: Optional[int]
+    call: Optional[str]
+    pitch_type: Optional[str]
+    speed: Optional[float]
+    balls: Optional[int]
+    strikes: Optional[int]
+    outs: Optional[int]
+
+@dataclass(frozen=True,repr=False)
+class SubstitutionEvent(GameEvent):
+    event_type: Optional[str]
+    player_mlbam: Optional[int]
+    position: Optional[str]
+
+@dataclass(frozen=True,repr=False)
+class PlayEvent(GameEvent):
+    event: Optional[str]
+    event_type: Optional[str]
+    batter_mlbam: Optional[int]
+    pitcher_mlbam: Optional[int]
+    rbi: Optional[int]
+    away_score: Optional[int]
+    home_score: Optional[int]
+
+@dataclass(frozen=True,repr=False)
+class ScoreChange(GameEvent):
+    """A completed plate appearance that changed the score (runs scored
+    mid at-bat are included in the plate appearance they happened in)"""
+    away_score: int
+    home_score: int
+    away_runs: int
+    home_runs: int
+
+    @property
+    def key(self) -> tuple:
+        return (self.kind,self.at_bat_index)
+
+    def __repr__(self):
+        return f"<{self.kind} {self.at_bat_index} {self.away_score}-{self.home_score}>"
@@ -1,11 +1,275 @@
 import os
+import sys
 import json
+import threading
 import datetime as dt
 
+import numpy as np
 import pandas as pd
 # from sqlalchemy import create_engine
 
 from .paths import *
+from . import snapshots
+
+# ===============================================================
+# Reference table registry
+# ===============================================================
+# Each bundled table is parsed once per process and kept here along with the
+# (mtime, size) of the file it was read from. Callers receive a copy, so the
+# cached frame can't be modified. A table is re-read when its file changes on
+# disk or after `invalidate()` (called by the `updatedb.update_*` writers).
+# Tables are loaded from their columnar snapshot (see `snapshots.py`) when it
+# is up to date with the CSV, otherwise from the CSV
+
+_registry: dict = {}
+_registry_lock = threading.Lock()
+
+def _file_stamp(path) -> tuple:
+    st = os.stat(path)
+    return (st.st_mtime_ns, st.st_size)
+
+def _copy(df:pd.DataFrame) -> pd.DataFrame:
+    # With copy-on-write a shallow copy is already isolated from the original
+    cow = int(pd.__version__.split('.')[0]) >= 3 or pd.options.mode.copy_on_write is True
+    return df.copy(deep=not cow)
+
+def _read_seasons() -> pd.DataFrame:
+    cols = ['preSeasonStartDate','preSeasonEndDate','seasonStartDate','seasonEndDate','springStartDate','springEndDate','regularSeasonStartDate','regularSeasonEndDate','allStarDate','postSeasonStartDate','postSeasonEndDate','offSeasonStartDate','offSeasonEndDate']
+
+    df = pd.read_csv(SEASONS_CSV,index_col=False)
+
+    df[cols] = df[cols].apply(pd.to_datetime,format=r"%Y-%m-%d")
+    return df
+
+# name -> (source file, loader)
+_TABLES = {
+    'teams':            (TEAMS_CSV, lambda: pd.read_csv(TEAMS_CSV,index_col=False,dtype={'mlbam':'int32','season':'int32','venue_mlbam':'int32'})),
+    'standings':        (STANDINGS_CSV, lambda: pd.read_csv(STANDINGS_CSV,index_col=False)),
+    'yby_records':      (YBY_RECORDS_CSV, lambda: pd.read_csv(YBY_RECORDS_CSV,index_col=False)),
+    'people':           (PEOPLE_CSV, lambda: pd.read_csv(PEOPLE_CSV,index_col=False,dtype={'mlbam':'int32','year_debut':'int32','year_recent':'int32'})),
+    'seasons':          (SEASONS_CSV, _read_seasons),
+    'venues':           (VENUES_CSV, lambda: pd.read_csv(VENUES_CSV,index_col=False,dtype={'mlbam':'int32','tz_offset':'int32'})),
+    'hall_of_fame':     (HALL_OF_FAME_CSV, lambda: pd.read_csv(HALL_OF_FAME_CSV,index_col=False)),
+    'broadcasts':       (BROADCASTS_CSV, lambda: pd.read_csv(BROADCASTS_CSV,index_col=False)),
+    'bbref_data':       (BBREF_DATA_CSV, lambda: pd.read_csv(BBREF_DATA_CSV,index_col=False,dtype={'mlb_ID':'int32'})),
+    'bbref_war_hit':    (BBREF_BATTING_DATA_CSV, lambda: pd.read_csv(BBREF_BATTING_DATA_CSV)),
+    'bbref_war_pitch':  (BBREF_PITCHING_DATA_CSV, lambda: pd.read_csv(BBREF_PITCHING_DATA_CSV)),
+    'leagues':          (LEAGUES_CSV, lambda: pd.read_csv(LEAGUES_CSV,index_col=False)),
+    'pitch_types':      (PITCH_TYPES_CSV, lambda: pd.read_csv(PITCH_TYPES_CSV,index_col=False)),
+    'pitch_codes':      (PITCH_CODES_CSV, lambda: pd.read_csv(PITCH_CODES_CSV,index_col=False)),
+    'event_types':      (EVENT_TYPES_CSV, lambda: pd.read_csv(EVENT_TYPES_CSV,index_col=False)),
+    'coaches':          (COACHES_MASTER_CSV, lambda: pd.read_csv(COACHES_MASTER_CSV,index_col=False)),
+}
+
+# ===============================================================
+# Compact mode
+# ===============================================================
+# Compact mode is opt-in, since it changes the dtypes the public getters
+# return. With it on, each table is held in memory as:
+#   - repeated strings (leagues, divisions, abbreviations, positions, job
+#     titles...) -> categoricals
+#   - integer columns -> int32, and integer columns with missing values
+#     (stored as float64 in the CSVs) -> nullable Int32. Nothing is narrowed
+#     below 32 bits so arithmetic on the columns can't overflow
+#   - the remaining strings -> interned, so equal values share one object
+# The compact frame is what gets snapshotted, so the conversion only happens
+# when the snapshot is (re)built. Set MLB_COMPACT_TABLES=1 or call
+# `configure(compact=True)` to turn it on; otherwise the frames are exactly
+# as parsed from the CSVs
+
+_settings = {'compact': os.environ.get('MLB_COMPACT_TABLES','0') == '1'}
+
+# a string column becomes a categorical when it has at most this many
+# distinct values per row
+CATEGORY_MAX_RATIO = 0.5
+
+_INT32 = np.iinfo(np.int32)
+
+def configure(**kwargs):
+    """Change how reference tables are held in memory
+
+    Parameters:
+    -----------
+    compact : bool, default False
+        hold tables with categorical/32-bit/interned dtypes (this changes
+        the dtypes `get_teams_df()`, `get_people_df()`, ... return).
+        Changing it drops the memoized tables
+
+    """
+    for k,v in kwargs.items():
+        if k not in _settings:
+            raise TypeError(f"'{k}' is not a valid setting")
+        if _settings[k] != v:
+            _settings[k] = v
+            invalidate()
+
+def _is_str(s:pd.Series) -> bool:
+    if pd.api.types.is_string_dtype(s.dtype) and not isinstance(s.dtype,pd.CategoricalDtype):
+        values = s.dropna()
+        return len(values) > 0 and all(isinstance(v,str) for v in values)
+    return False
+
+def _fits_int32(values) -> bool:
+    return len(values) == 0 or (values.min() >= _INT32.min and values.max() <= _INT32.max)
+
+def _intern(s:pd.Series) -> pd.Series:
+    values = np.array([sys.intern(v) if isinstance(v,str) else v for v in s.to_numpy(dtype=object)],dtype=object)
+    return pd.Series(values,index=s.index,name=s.name,dtype=s.dtype)
+
+def _intern_strings(df:pd.DataFrame) -> pd.DataFrame:
+    for col in df.columns:
+        if _is_str(df[col]):
+            df[col] = _intern(df[col])
+    return df
+
+def compact(df:pd.DataFrame) -> pd.DataFrame:
+    """`df` with the compact dtypes described above"""
+    df = df.copy()
+    for col in df.columns:
+        s = df[col]
+        if _is_str(s):
+            if s.nunique() <= CATEGORY_MAX_RATIO * len(s):
+                df[col] = s.astype('category')
+            else:
+                df[col] = _intern(s)
+        elif pd.api.types.is_bool_dtype(s.dtype):
+            continue
+        elif pd.api.types.is_integer_dtype(s.dtype) and isinstance(s.dtype,np.dtype):
+            if s.dtype.itemsize > 4 and _fits_int32(s):
+                df[col] = s.astype('int32')
+        elif pd.api.types.is_float_dtype(s.dtype) and isinstance(s.dtype,np.dtype):
+            values = s.dropna()
+            if 0 < len(values) < len(s) and (values == values.round()).all() and _fits_int32(values):
+                df[col] = s.astype('Int32')
+    return df
+
+def _snapshot_name(name:str,compact:bool) -> str:
+    return f'{name}.compact' if compact else name
+
+def _load(name:str) -> pd.DataFrame:
+    path, loader = _TABLES[name]
+    is_compact = _settings['compact']
+    snapshot = _snapshot_name(name,is_compact)
+    df = snapshots.read_snapshot(snapshot,path)
+    if df is None:
+        df = loader()
+        if is_compact:
+            df = compact(df)
+        snapshots.write_snapshot(df,snapshot,path)
+    elif is_compact:
+        # strings read back from a snapshot are separate objects again
+        df = _intern_strings(df)
+    return df
+
+def _entry(name:str) -> tuple:
+    """(stamp, frame) registry entry for a table. The frame is shared and
+    must not be modified"""
+    path = _TABLES[name][0]
+    stamp = _file_stamp(path)
+    entry = _registry.get(name)
+    if entry is None or entry[0] != stamp:
+        with _registry_lock:
+            entry = _registry.get(name)
+            if entry is None or entry[0] != stamp:
+                entry = (stamp, _load(name))
+                _registry[name] = entry
+    return entry
+
+def _table(name:str) -> pd.DataFrame:
+    return _copy(_entry(name)[1])
+
+def _raw_table(name:str) -> pd.DataFrame:
+    """A table parsed straight from its CSV with the loader's dtypes,
+    regardless of compact mode (used by the `updatedb` writers)"""
+    return _TABLES[name][1]()
+
+def invalidate(*names):
+    """Drop memoized reference tables so they are re-read on next access
+
+    Parameters:
+    -----------
+    names : str
+        table names (e.g. 'teams', 'people'). If no names are given, every
+        table is dropped
+
+    """
+    with _registry_lock:
+        if len(names) == 0:
+            _registry.clear()
+        for name in names:
+            _registry.pop(name,None)
+
+def rebuild_snapshot(name:str):
+    """Re-read a table from its CSV and rewrite its binary snapshot"""
+    path, loader = _TABLES[name]
+    is_compact = _settings['compact']
+    df = loader()
+    snapshots.write_snapshot(compact(df) if is_compact else df,_snapshot_name(name,is_compact),path)
+    snapshots.remove_snapshot(_snapshot_name(name,not is_compact))
+    invalidate(name)
+
+def cached_tables() -> list:
+    """Names of the reference tables currently held in memory"""
+    return list(_registry.keys())
+
+def _column_bytes(s:pd.Series) -> int:
+    # like `memory_usage(deep=True)` except that a string object shared by
+    # several rows (interned) is only counted once
+    if isinstance(s.dtype,pd.CategoricalDtype):
+        return s.cat.codes.to_numpy().nbytes + _column_bytes(pd.Series(s.cat.categories))
+    values = s.array
+    if pd.api.types.is_string_dtype(s.dtype) or s.dtype == object:
+        objects = s.to_numpy(dtype=object)
+        unique = {id(v):v for v in objects if isinstance(v,str)}
+        return objects.nbytes + sum(sys.getsizeof(v) for v in unique.values())
+    return int(values.nbytes)
+
+def _frame_bytes(df:pd.DataFrame) -> int:
+    return sum(_column_bytes(df[col]) for col in df.columns)
+
+def memory_report(tables=None,compare:bool=False) -> pd.DataFrame:
+    """Memory held by each reference table
+
+    Parameters:
+    -----------
+    tables : list, optional
+        table names to report on (loading them if needed). Default: the
+        tables currently held in memory
+
+    compare : bool, default False
+        also parse each table from its CSV without compact dtypes and report
+        what it would take up (only meaningful with compact mode on)
+
+    Returns:
+    --------
+    pandas.DataFrame : one row per table with its row/column counts, `bytes`
+    held and (with `compare`) `raw_bytes` and `ratio`
+
+    """
+    if tables is None:
+        tables = cached_tables()
+    elif isinstance(tables,str):
+        tables = [tables]
+    rows = []
+    for name in tables:
+        df = _entry(name)[1]
+        row = {'table':name,'rows':len(df),'columns':len(df.columns),
+               'categorical':sum(isinstance(t,pd.CategoricalDtype) for t in df.dtypes),
+               'bytes':_frame_bytes(df)}
+        if compare:
+            row['raw_bytes'] = _frame_bytes(_raw_table(name))
+            row['ratio'] = round(row['raw_bytes'] / row['bytes'],2) if row['bytes'] else None
+        rows.append(row)
+    columns = ['table','rows','columns','categorical','bytes'] + (['raw_bytes','ratio'] if compare else [])
+    df = pd.DataFrame(rows,columns=columns)
+    if len(df) > 0:
+        total = {'table':'total','rows':df['rows'].sum(),'columns':df['columns'].sum(),
+                 'categorical':df['categorical'].sum(),'bytes':df['bytes'].sum()}
+        if compare:
+            total['raw_bytes'] = df['raw_bytes'].sum()
+            total['ratio'] = round(total['raw_bytes'] / total['bytes'],2) if total['bytes'] else None
+        df = pd.concat([df,pd.DataFrame([total])],ignore_index=True)
+    return df
 
 def get(df_title) -> pd.DataFrame:
     return pd.read_csv(DATA_DIR + f"{df_title}.csv",index_col=False)
@@ -17,10 +281,7 @@ def get_teams_df(year=None) -> pd.DataFrame:
     franchise can be identified by the 'mlbam' or 'franchID' keys.
     
     """
-    teams_df = pd.read_csv(
-        TEAMS_CSV,
-        index_col=False,
-        dtype={'mlbam':'int32','season':'int32','venue_mlbam':'int32'})
+    teams_df = _table('teams')
     if year is None:
         return teams_df
     else:
@@ -31,7 +292,7 @@ def get_teams_df(year=None) -> pd.DataFrame:
 def get_standings_df() -> pd.DataFrame:
     """Yearly standings data for each team (dates back to 1876)"""
     try:
-        df = pd.read_csv(STANDINGS_CSV,index_col=False)
+        df = _table('standings')
         return df
     except Exception as e:
         print(e)
@@ -42,27 +303,19 @@ def get_yby_records(raw=False) -> pd.DataFrame:
     """
     
     try:
-        df = pd.read_csv(YBY_RECORDS_CSV,index_col=False)
+        df = _table('yby_records')
         return df
 
     except Exception as e:
         print(e)
 
 def get_people_df() -> pd.DataFrame:
-    df = pd.read_csv(
-        PEOPLE_CSV,
-        index_col=False,
-        dtype={'mlbam':'int32','year_debut':'int32','year_recent':'int32'})
+    df = _table('people')
     return df
 
 def get_seasons_df() -> pd.DataFrame:
     try:
-        cols = ['preSeasonStartDate','preSeasonEndDate','seasonStartDate','seasonEndDate','springStartDate','springEndDate','regularSeasonStartDate','regularSeasonEndDate','allStarDate','postSeasonStartDate','postSeasonEndDate','offSeasonStartDate','offSeasonEndDate']
-
-        df = pd.read_csv(SEASONS_CSV,index_col=False)
-
-        df[cols] = df[cols].apply(pd.to_datetime,format=r"%Y-%m-%d")
-        return df
+        return _table('seasons')
     except Exception as e:
         print(e)
 
@@ -76,17 +329,14 @@ def get_venues_df(active_only=False) -> pd.DataFrame:
     
     """
 
-    df = pd.read_csv(
-        VENUES_CSV,
-        index_col=False,
-        dtype={'mlbam':'int32','tz_offset':'int32'})
+    df = _table('venues')
 
     if active_only is True:
         df = df[df["active"]==True].reset_index(drop=True)
     
     return df
 
-def get_season_info(date=None) -> tuple:
+def get_season_info(date=None) -> dict:
     """Get current season in-progress and most recently completed season, 
     given a specified date
 
@@ -96,70 +346,16 @@ def get_season_info(date=None) -> tuple:
         format - `mm/dd/yyyy`\n\t\tDefault: current date
     
     """
-    
-    if date is None:
-        current_date = dt.datetime.today()
-        using_pretend = False
-    else:
-        using_pretend = True
-        pretend_current = dt.datetime.strptime(date,r"%m/%d/%Y")
-        current_date = pretend_current
-    try:
-
-        df = get_seasons_df()
-        if using_pretend is False:
-            df = df.head(4)
-
-        df = df.rename(columns={'seasonStartDate':'start',
-                                'seasonEndDate':'end'})
-
-        df_dates = df
-        # return df_dates
-
-        for row in range(len(df_dates)):
-            if df_dates.iloc[row].start <= current_date <= df_dates.iloc[row].end:
-                seasonInProgress = current_date.year
-                seasonCompleted = seasonInProgress - 1
-
-                season_info = {'in_progress':seasonInProgress,
-                               'last_completed':seasonCompleted}
-                return season_info
-                # return seasonInProgress, seasonCompleted
-
-        seasonInProgress = None
-
-        for row in range(len(df_dates)):
-            # if df_dates.iloc[row].start.date().year == current_date.year:
-            if df_dates.iloc[row].start.year == current_date.year:
-                curr_year_row = df_dates.iloc[row]
-                # if current_date < curr_year_row.start.date():
-                if current_date < curr_year_row.start:
-                    seasonCompleted = current_date.year - 1
-                    season_info = {'in_progress':seasonInProgress,
-                                   'last_completed':seasonCompleted}
-                    return season_info
-
-                # elif current_date > curr_year_row.end.date():
-                elif current_date > curr_year_row.end:
-                    seasonCompleted = current_date.year
-                    season_info = {'in_progress':seasonInProgress,
-                                   'last_completed':seasonCompleted}
-                    return season_info
-
-                else:
-                    print("Hmm...didn't work. Here is the dataframe again\n")
-                    return df_dates
-
-    except Exception as e:
-        print(e)
+    from .season_calendar import season_calendar
+    return season_calendar.season_info(date)
 
 def get_hall_of_fame() -> pd.DataFrame:
     """Get Hall of Fame Data"""
-    return pd.read_csv(HALL_OF_FAME_CSV,index_col=False)
+    return _table('hall_of_fame')
 
 def get_broadcasts_df() -> pd.DataFrame:
     """Get Broadcasts data (types, names, ids...)"""
-    return pd.read_csv(BROADCASTS_CSV,index_col=False)
+    return _table('broadcasts')
 
 def get_bbref_data() -> pd.DataFrame:
     """Reference dataframe for all player "Baseball-Reference" (bbref) and 
@@ -170,19 +366,19 @@ def get_bbref_data() -> pd.DataFrame:
     
     """
     
-    return pd.read_csv(BBREF_DATA_CSV,index_col=False,dtype={'mlb_ID':'int32'})
+    return _table('bbref_data')
 
 def get_bbref_hitting_war_df() -> pd.DataFrame:
-    df = pd.read_csv(BBREF_BATTING_DATA_CSV)
+    df = _table('bbref_war_hit')
     return df
 
 def get_bbref_pitching_war_df() -> pd.DataFrame:
-    df = pd.read_csv(BBREF_PITCHING_DATA_CSV)
+    df = _table('bbref_war_pitch')
     return df
 
 def get_leagues_df() -> pd.DataFrame:
     """Get reference dataframe of all leagues and divisions in the MLB"""
-    df = pd.read_csv(LEAGUES_CSV,index_col=False)
+    df = _table('leagues')
     return df
         
 def get_teams_from_register_df(match_columns=False) -> pd.DataFrame:
@@ -211,7 +407,7 @@ def get_pitch_types_df() -> pd.DataFrame:
     
     NOTE: Not to be confused with 'pitch_codes()'
     """
-    df = pd.read_csv(PITCH_TYPES_CSV,index_col=False)
+    df = _table('pitch_types')
     return df
 
 def get_pitch_codes_df() -> pd.DataFrame:
@@ -219,17 +415,17 @@ def get_pitch_codes_df() -> pd.DataFrame:
     
     NOTE: Not to be confused with 'pitch_types()'
     """
-    df = pd.read_csv(PITCH_CODES_CSV,index_col=False)
+    df = _table('pitch_codes')
     return df
   
 def get_event_types_df() -> pd.DataFrame:
     """Event types and their descriptions
     
     """
-    df = pd.read_csv(EVENT_TYPES_CSV,index_col=False)
+    df = _table('event_types')
     return df
   
 def get_coaches():
     """Get a year-by-year dataframe of all coaching staff for each team"""
-    df = pd.read_csv(COACHES_MASTER_CSV,index_col=False)
+    df = _table('coaches')
     return df
\ No newline at end of file
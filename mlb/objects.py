@@ -9,11 +9,9 @@ from dateutil.parser import parse
 from tabulate import tabulate as tab
 
 from . import mlbdata
+from . import refindex
 from . import mlb_dataclasses as dclass
 
-TEAMS = mlbdata.get_teams_df()
-LEAGUES = mlbdata.get_leagues_df()
-
 League = namedtuple('League',['full','short','abbreviation','child_division','parent_league'])
 
 class LeagueData:
@@ -50,12 +48,28 @@ class LeagueData:
     
     parent_id = parent_mlbam
 
-league_ref: dict[Union[int,str],LeagueData] = {}
-for idx,row in LEAGUES.iterrows():
-    mlbam = row['mlbam']
-    
-    league_ref[str(mlbam)] = LeagueData(row)
-    league_ref[int(mlbam)] = league_ref[str(mlbam)]
+def _build_league_ref(df:pd.DataFrame) -> dict[Union[int,str],LeagueData]:
+    ref = {}
+    for idx,row in df.iterrows():
+        mlbam = row['mlbam']
+        
+        ref[str(mlbam)] = LeagueData(row)
+        ref[int(mlbam)] = ref[str(mlbam)]
+    return ref
+
+def _league_ref() -> dict[Union[int,str],LeagueData]:
+    return refindex._index('leagues','league_ref',_build_league_ref)
+
+# TEAMS, LEAGUES and league_ref used to be built at import time; they are now
+# loaded on first access so importing this module doesn't read any tables
+def __getattr__(name):
+    if name == 'TEAMS':
+        return mlbdata.get_teams_df()
+    if name == 'LEAGUES':
+        return mlbdata.get_leagues_df()
+    if name == 'league_ref':
+        return _league_ref()
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
 
 class StandingsWrapper:
     def __new__(cls, records, splits=None):
@@ -994,13 +1008,9 @@ class _teams_data_collection:
         if season is not None:
             df = df[df["season"] == season]
 
-        query = query.lower()
-        found_data = []
-        for idx, row in df.iterrows():
-            if query in row["name_full"].lower():
-                found_data.append(row)
+        df = df[df["name_full"].str.lower().str.contains(query.lower(), regex=False)]
 
-        return pd.DataFrame(data=found_data).reset_index(drop=True)
+        return df.reset_index(drop=True)
 
 
 class _people_data_collection:
@@ -1031,13 +1041,9 @@ class _people_data_collection:
         # if season is not None:
         #     df = df[df['season']==season]
 
-        name = name.lower()
-        found_data = []
-        for idx, row in df.iterrows():
-            if name in row["name_full"].lower():
-                found_data.append(row)
+        df = df[df["name_full"].str.lower().str.contains(name.lower(), regex=False)]
 
-        return pd.DataFrame(data=found_data).reset_index(drop=True)
+        return df.reset_index(drop=True)
 
 
 class MlbTeam:
@@ -1180,29 +1186,24 @@ def get_tz(tz):
 # Dataframe functions
 # ===============================================================
 def add_league_attr(row:pd.Series,attr:str):
-    teams = TEAMS[TEAMS['season']==int(row['season'])]
-    tmrow = teams[teams['mlbam']==row['team_mlbam']].iloc[0]
-    lgrow = LEAGUES[LEAGUES['mlbam']==tmrow['lg_mlbam']].iloc[0]
+    tmrow = refindex.team(row['team_mlbam'],row['season'])
+    lgrow = refindex.league(tmrow['lg_mlbam'])
     return lgrow[attr]
 
 def add_league_short(row:pd.Series):
-    teams = TEAMS[TEAMS['season']==int(row['season'])]
-    tmrow = teams[teams['mlbam']==row['team_mlbam']].iloc[0]
-    return tmrow.lg_abbrv
+    tmrow = refindex.team(row['team_mlbam'],row['season'])
+    return tmrow['lg_abbrv']
 
 def add_division_short(row:pd.Series):
-    teams = TEAMS[TEAMS['season']==int(row['season'])]
-    tmrow = teams[teams['mlbam']==row['team_mlbam']].iloc[0]
+    tmrow = refindex.team(row['team_mlbam'],row['season'])
     div_mlbam: Union[str,int] = tmrow['div_mlbam']
-    return league_ref[div_mlbam].short
+    return _league_ref()[div_mlbam].short
 
 def add_division_mlbam(row:pd.Series):
-    teams = TEAMS[TEAMS['season']==int(row['season'])]
-    tmrow = teams[teams['mlbam']==row['team_mlbam']].iloc[0]
+    tmrow = refindex.team(row['team_mlbam'],row['season'])
     div_mlbam: Union[str,int] = tmrow['div_mlbam']
     return div_mlbam
 
 def add_team_attr(row:pd.DataFrame,attr:str,season=None):
-    teams = TEAMS[TEAMS['season']==int(row['season'])]
-    tmrow = teams[teams['mlbam']==row['team_mlbam']].iloc[0]
+    tmrow = refindex.team(row['team_mlbam'],row['season'])
     return tmrow[attr]
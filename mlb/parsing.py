@@ -2,98 +2,262 @@ import datetime as dt
 from typing import Union, List, Dict
 
 import pytz
+import numpy as np
 import pandas as pd
 
 from . import utils
 from . import constants as c
 from . import mlbdata
-
-TEAMS = mlbdata.get_teams_df()
-LEAGUES = mlbdata.get_leagues_df()
+from . import refindex
+
+def __getattr__(name):
+    # reference tables are loaded on first access rather than at import
+    if name == 'TEAMS':
+        return mlbdata.get_teams_df()
+    if name == 'LEAGUES':
+        return mlbdata.get_leagues_df()
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
 _JSON = Union[Dict,List]
 
-def _parse_player_stats(splits:list[dict],**kwargs) -> pd.DataFrame:
-    data = []
-    for s in splits:
-        season_data = {}
-        season_data['season'] = s.get('season')
-        season_data['player_mlbam'] = s.get('player',{}).get('id')
-        season_data['player_name'] = s.get('player',{}).get('fullName')
-        
-        season_data['team_mlbam'] = s.get('team',{}).get('id')
-        
-        stat = s.get('stat',{})
-        if stat.get('position',{}).get('abbreviation') is not None:
-            stat['position'] = stat['position']['abbreviation']
-        season_data.update(stat)
-        
-        data.append(season_data)
-    
-    df = pd.DataFrame(data).sort_values(by='season',ascending=False)
-    # if kwargs.get('include_team_name') is not False:
-    #     df.insert(4,'team_name',df.apply(lambda row: add_team_attr(row,'name_full'),axis=1))
+# ===============================================================
+# Columnar split parsing
+# ===============================================================
+# Stat splits (`{'season':..., 'player':{...}, 'stat':{...}}`) are walked once
+# into one list per column; the frame is built once at the end and the
+# STATDICT names are looked up once per column rather than per row. A stat key
+# missing from a split is filled with None (NaN)
+
+def _dig(obj:dict,path:tuple,default=None):
+    for key in path:
+        if not isinstance(obj,dict):
+            return default
+        obj = obj.get(key)
+        if obj is None:
+            return default
+    return obj
+
+def _meta_column(splits:list[dict],path:tuple,default) -> list:
+    if len(path) == 1:
+        key = path[0]
+        return [default if s.get(key) is None else s[key] for s in splits]
+    if len(path) == 2:
+        outer, key = path
+        values = []
+        for s in splits:
+            v = s.get(outer)
+            v = v.get(key) if isinstance(v,dict) else None
+            values.append(default if v is None else v)
+        return values
+    return [_dig(s,path,default) for s in splits]
+
+def _split_columns(splits:list[dict],meta:dict) -> dict:
+    """Column lists for `splits`
+
+    Parameters:
+    -----------
+    splits : list[dict]
+        'splits' of a stats response
+
+    meta : dict
+        column name -> (path into the split, default) for the identifying
+        columns, e.g. {'player_mlbam':(('player','id'),None)}. These come
+        first and take precedence over a 'stat' key of the same name
+
+    """
+    columns = {name:_meta_column(splits,path,default) for name,(path,default) in meta.items()}
+
+    # splits of one response almost always share the same stat keys in the
+    # same order, so the values are gathered as row tuples per key layout
+    # and transposed in one go
+    layouts = {}
+    for idx,s in enumerate(splits):
+        stat = s.get('stat') or {}
+        layout = tuple(stat)
+        rows = layouts.get(layout)
+        if rows is None:
+            rows = layouts[layout] = ([],[])
+        rows[0].append(idx)
+        rows[1].append(tuple(stat.values()))
+
+    n = len(splits)
+    stat_columns = {}
+    if len(layouts) == 1:
+        layout, (_, rows) = next(iter(layouts.items()))
+        for k,values in zip(layout,zip(*rows)):
+            stat_columns[k] = list(values)
+    else:
+        for layout,(idxs,rows) in layouts.items():
+            for k,values in zip(layout,zip(*rows)):
+                col = stat_columns.get(k)
+                if col is None:
+                    col = stat_columns[k] = [None] * n
+                for idx,v in zip(idxs,values):
+                    col[idx] = v
+        # keep the first-seen key order
+        order = {}
+        for layout in layouts:
+            order.update(dict.fromkeys(layout))
+        stat_columns = {k:stat_columns[k] for k in order}
+
+    position = stat_columns.get('position')
+    if position is not None:
+        stat_columns['position'] = [v['abbreviation'] if isinstance(v,dict) and v.get('abbreviation') is not None else v for v in position]
+    for k,values in stat_columns.items():
+        if k not in columns:
+            columns[k] = values
+    return columns
+
+def _split_frame(splits:list[dict],meta:dict,keep_original_keys:bool=False) -> pd.DataFrame:
+    columns = _split_columns(splits,meta)
+    if keep_original_keys:
+        labels = list(columns)
+    else:
+        # only the stat keys are renamed. Assigning the labels (rather than
+        # `rename`) keeps duplicate names when two keys map to the same
+        # STATDICT label
+        statdict = c.STATDICT
+        labels = [k if k in meta else statdict.get(k,k) for k in columns]
+    # stat columns are typed straight from the lists (see `coerce_stats`)
+    df = pd.DataFrame(_coerce_lists(columns,labels))
+    df.columns = labels
+    return df
 
-    if kwargs.get('keep_original_keys'):
-        return df
-        
-    return df.rename(columns=c.STATDICT)
+_PLAYER_SPLIT_META = {
+    'season':       (('season',),None),
+    'player_mlbam': (('player','id'),None),
+    'player_name':  (('player','fullName'),None),
+    'team_mlbam':   (('team','id'),None),
+}
+
+_TEAM_SPLIT_META = {
+    'season':       (('season',),None),
+    'team_mlbam':   (('team','id'),None),
+}
+
+_LEADER_SPLIT_META = {
+    'rank':         (('rank',),None),
+    'season':       (('season',),'-'),
+    'position':     (('position','abbreviation'),'-'),
+    'player_mlbam': (('player','id'),''),
+    'player_name':  (('player','fullName'),''),
+    'team_mlbam':   (('team','id'),''),
+    'team_name':    (('team','name'),''),
+    'league_mlbam': (('league','id'),''),
+    'league_name':  (('league','name'),''),
+}
+
+# ===============================================================
+# Stat dtypes
+# ===============================================================
+# Rate stats arrive as strings (".238", "4.51") with placeholders ("-.--",
+# ".---") where they are undefined. Columns named in the stat lists in
+# `constants` (by STATDICT label or by API key) are coerced: integer counts to
+# int32 and everything else (rates, innings, counts with gaps) to float32, with
+# NaN for the placeholders
+
+STAT_COLUMNS = frozenset(
+    c.COLS_HIT + c.COLS_HIT_ADV + c.COLS_PIT + c.COLS_PIT_ADV + c.COLS_FLD + c.COLS_CATCHING
+    + c.BAT_FIELDS + c.BAT_FIELDS_ADV + c.PITCH_FIELDS + c.PITCH_FIELDS_ADV + c.FIELD_FIELDS
+    + c.YBY_BAT_FIELDS + c.YBY_BAT_FIELDS_ADV + c.YBY_PITCH_FIELDS + c.YBY_PITCH_FIELDS_ADV + c.YBY_FIELD_FIELDS
+)
+
+# innings ("1023.1" = 1023 1/3) are written with a tenths digit that float32
+# can't hold exactly at these magnitudes, so they stay float64
+INNINGS_COLUMNS = frozenset(['IP','INNs','Inn','inningsPitched','innings'])
+
+_PLACEHOLDERS = frozenset(['-.--','.---','-.---','*.**','--','-',''])
+
+_INT32 = np.iinfo(np.int32)
+
+def _float_dtype(label) -> str:
+    return 'float64' if label in INNINGS_COLUMNS else 'float32'
+
+def _coerce_values(values:list,float_dtype:str='float32'):
+    """`values` (as parsed from JSON) as an int32/float array, or `None` if
+    they aren't numeric (e.g. fielding 'pos')"""
+    if all(type(v) is int for v in values):
+        arr = np.array(values,dtype=np.int64)
+        if len(arr) == 0 or (arr.min() >= _INT32.min and arr.max() <= _INT32.max):
+            return arr.astype(np.int32)
+        return None
+    cleaned = [np.nan if v is None or (v.__class__ is str and v in _PLACEHOLDERS) else v for v in values]
+    try:
+        return np.array(cleaned,dtype=float_dtype)
+    except (ValueError,TypeError,OverflowError):
+        return None
+
+def _coerce_column(s:pd.Series,float_dtype:str='float32'):
+    dtype = s.dtype
+    if pd.api.types.is_bool_dtype(dtype):
+        return None
+    if pd.api.types.is_integer_dtype(dtype) and isinstance(dtype,np.dtype):
+        if len(s) == 0 or (s.min() >= _INT32.min and s.max() <= _INT32.max):
+            return s.to_numpy(dtype='int32')
+        return None
+    if pd.api.types.is_float_dtype(dtype) and isinstance(dtype,np.dtype):
+        return s.to_numpy(dtype=float_dtype)
+    return _coerce_values([None if v is pd.NA or v != v else v for v in s.tolist()],float_dtype)
+
+def _coerce_lists(columns:dict,labels:list) -> dict:
+    # columns: key -> list of values, labels: the final label of each key
+    for (key,values),label in zip(columns.items(),labels):
+        if label in STAT_COLUMNS:
+            coerced = _coerce_values(values,_float_dtype(label))
+            if coerced is not None:
+                columns[key] = coerced
+    return columns
+
+def coerce_stats(df:pd.DataFrame,columns=None) -> pd.DataFrame:
+    """Coerce the stat columns of `df` to int32/float32 (in place)
+
+    Parameters:
+    -----------
+    df : pandas.DataFrame
+        frame of parsed stat splits
+
+    columns : iterable, optional
+        column labels to coerce. Default: every label in `STAT_COLUMNS`
+
+    """
+    columns = STAT_COLUMNS if columns is None else frozenset(columns)
+    for idx,label in enumerate(df.columns):
+        if label not in columns:
+            continue
+        values = _coerce_column(df.iloc[:,idx],_float_dtype(label))
+        if values is not None:
+            df.isetitem(idx,values)
+    return df
+
+def _parse_player_stats(splits:list[dict],**kwargs) -> pd.DataFrame:
+    df = _split_frame(splits,_PLAYER_SPLIT_META,kwargs.get('keep_original_keys'))
+    return df.sort_values(by='season',ascending=False,kind='stable')
     
 def _parse_team_stats(splits:list[dict],include_lg_short:bool=False,**kwargs) -> pd.DataFrame:
-    data = []
-    
-    for s in splits:
-        season_data = {}
-        season_data['season'] = s.get('season')
-        season_data['team_mlbam'] = s.get('team',{}).get('id')
-        season_data.update(s.get('stat',{}))
-        data.append(season_data)
-    
-    df = pd.DataFrame(data).sort_values(by='season',ascending=False)
-    # if include_lg_short:
-        # df.insert(2,'lg_abbrv',df.apply(lambda row: add_league_short(row),axis=1))
-    # df.insert(2,'lg_mlbam',df.apply(lambda row: add_league_attr(row,'mlbam'),axis=1))
-    # df.insert(2,'team_name',df.apply(lambda row: add_team_attr(row,'name_full'),axis=1))
-    
-    if kwargs.get('keep_original_keys'):
-        return df.reset_index(drop=True)
-        
-    return df.rename(columns=c.STATDICT).reset_index(drop=True)
+    df = _split_frame(splits,_TEAM_SPLIT_META,kwargs.get('keep_original_keys'))
+    return df.sort_values(by='season',ascending=False,kind='stable').reset_index(drop=True)
 
-def _parse_league_stats(splits:list[dict]) -> pd.DataFrame:
-    data = []
+def _parse_leader_stats(splits:list[dict]) -> pd.DataFrame:
+    """Player splits of a `/stats` (league-wide) response, e.g.
+    `/stats?stats=season&group=hitting&playerPool=all&limit=2000`"""
+    return _split_frame(splits,_LEADER_SPLIT_META)
 
-    season_col = []
-    team_mlbam_col = []
-    team_name_col = []
-    team_abbrv_col = []
-    league_mlbam_col = []
-    div_mlbam_col = []
-
-    for tm in splits:
-        season = tm.get("season")
-        team_mlbam = tm.get("team",{}).get("id")
-        team_name = tm.get("team",{}).get("name")
-        
-        season_col.append(season)
-        team_mlbam_col.append(team_mlbam)
-        team_name_col.append(team_name)
-        team_abbrv_col.append(TEAMS[TEAMS['mlbam']==team_mlbam].iloc[0]['mlbID'])
-        league_mlbam_col.append(TEAMS[TEAMS['mlbam']==team_mlbam].iloc[0]['lg_mlbam'])
-        div_mlbam_col.append(TEAMS[TEAMS['mlbam']==team_mlbam].iloc[0]['div_mlbam'])
-
-        tm_stats = tm.get("stat")
-
-        data.append(pd.Series(tm_stats))
-    
-    df = pd.DataFrame(data=data,columns=tm_stats.keys()).rename(columns=c.STATDICT)
-    
-    df.insert(0,"Season",season_col)
-    df.insert(1,"team_mlbam",team_mlbam_col)
-    df.insert(2,"team",team_name_col)
-    df.insert(3,"team_abbrv",team_abbrv_col)
-    df.insert(4,"league_mlbam",league_mlbam_col)
-    df.insert(5,"div_mlbam",div_mlbam_col)
-    
+def _parse_league_stats(splits:list[dict]) -> pd.DataFrame:
+    meta = {'Season':(('season',),None),
+            'team_mlbam':(('team','id'),None),
+            'team':(('team','name'),None)}
+    columns = _split_columns(splits,meta)
+    team_rows = [refindex.team_latest(m) for m in columns['team_mlbam']]
+    statdict = c.STATDICT
+    data = {'Season':columns.pop('Season'),
+            'team_mlbam':columns.pop('team_mlbam'),
+            'team':columns.pop('team'),
+            'team_abbrv':[r['mlbID'] for r in team_rows],
+            'league_mlbam':[r['lg_mlbam'] for r in team_rows],
+            'div_mlbam':[r['div_mlbam'] for r in team_rows]}
+    stat_labels = [statdict.get(k,k) for k in columns]
+    data.update(_coerce_lists(columns,stat_labels))
+    df = pd.DataFrame(data)
+    df.columns = list(data)[:6] + stat_labels
     return df
 
 def _parse_schedule_data(json_response:_JSON,selected_timezone:str=None) -> list[dict]:
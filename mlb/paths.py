@@ -2,6 +2,11 @@ import os
 
 DATA_DIR                = os.path.join(os.path.dirname(__file__),'data/')
 BASEBALL_DB             = os.path.join('sqlite:///' + os.path.dirname(__file__), 'baseball.db')
+CACHE_DIR               = os.environ.get('MLB_CACHE_DIR',os.path.join(os.environ.get('XDG_CACHE_HOME',os.path.expanduser('~/.cache')),'mlbstats'))
+HTTP_CACHE_DB           = os.path.join(CACHE_DIR,'http_cache.db')
+SNAPSHOT_DIR            = os.path.join(os.path.dirname(__file__),'data/snapshots/')
+UPDATE_STATE_JSON       = os.path.join(os.path.dirname(__file__),'data/update_state.json')
+TEAM_SPLITS_DIR         = os.path.join(os.path.dirname(__file__),'baseball/team_splits/')
 
 PEOPLE_CSV              = os.path.join(os.path.dirname(__file__),'data/people.csv')
 BIOS_CSV                = os.path.join(os.path.dirname(__file__),'data/bios.csv')
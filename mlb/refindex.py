@@ -0,0 +1,78 @@
+"""O(1) lookups into the bundled reference tables
+
+Parsers that need a team, person or league row should use these functions
+instead of boolean-masking the full dataframes inside a loop. Each index is
+built from the memoized `mlbdata` table the first time it is used and is
+rebuilt automatically when that table is reloaded.
+
+Rows are returned as plain dictionaries and should be treated as read-only.
+"""
+import threading
+
+from . import mlbdata
+
+_indexes: dict = {}
+_lock = threading.Lock()
+
+def _index(table:str,key:str,builder) -> dict:
+    entry = mlbdata._entry(table)
+    cached = _indexes.get(key)
+    if cached is None or cached[0] is not entry:
+        with _lock:
+            cached = _indexes.get(key)
+            if cached is None or cached[0] is not entry:
+                cached = (entry, builder(entry[1]))
+                _indexes[key] = cached
+    return cached[1]
+
+def _team_season_index(df) -> dict:
+    records = df.to_dict('records')
+    return {(int(r['mlbam']),int(r['season'])):r for r in records}
+
+def _team_latest_index(df) -> dict:
+    latest = df.sort_values('season',kind='stable').drop_duplicates('mlbam',keep='last')
+    return {int(r['mlbam']):r for r in latest.to_dict('records')}
+
+def _column_map(df,key_col,value_col) -> dict:
+    sub = df[[key_col,value_col]].dropna()
+    return dict(zip(sub[key_col].tolist(),sub[value_col].tolist()))
+
+def _league_index(df) -> dict:
+    return {int(r['mlbam']):r for r in df.to_dict('records')}
+
+# ---------------------------------------------------------------
+# Teams
+# ---------------------------------------------------------------
+def team(mlbam:int,season:int) -> dict:
+    """Row of teams.csv for a team in a given season (or `None`)"""
+    return _index('teams','team_season',_team_season_index).get((int(mlbam),int(season)))
+
+def team_latest(mlbam:int) -> dict:
+    """Row of teams.csv for the most recent season of a team (or `None`)"""
+    return _index('teams','team_latest',_team_latest_index).get(int(mlbam))
+
+# ---------------------------------------------------------------
+# People
+# ---------------------------------------------------------------
+def person_bbref(mlbam:int) -> str:
+    """Baseball-Reference ID for an MLBAM person ID (or `None`)"""
+    return _index('people','mlbam_bbref',lambda df: _column_map(df,'mlbam','bbrefID')).get(int(mlbam))
+
+def person_retro(mlbam:int) -> str:
+    """Retrosheet ID for an MLBAM person ID (or `None`)"""
+    return _index('people','mlbam_retro',lambda df: _column_map(df,'mlbam','retroID')).get(int(mlbam))
+
+def person_from_bbref(bbrefID:str) -> int:
+    """MLBAM person ID for a Baseball-Reference ID (or `None`)"""
+    return _index('people','bbref_mlbam',lambda df: _column_map(df,'bbrefID','mlbam')).get(bbrefID)
+
+def person_from_retro(retroID:str) -> int:
+    """MLBAM person ID for a Retrosheet ID (or `None`)"""
+    return _index('people','retro_mlbam',lambda df: _column_map(df,'retroID','mlbam')).get(retroID)
+
+# ---------------------------------------------------------------
+# Leagues & Divisions
+# ---------------------------------------------------------------
+def league(mlbam:int) -> dict:
+    """Row of leagues.csv for a league or division ID (or `None`)"""
+    return _index('leagues','league',_league_index).get(int(mlbam))
@@ -0,0 +1,265 @@
+"""Name search over people, teams and venues
+
+Builds an in-memory index the first time each kind is searched (and again
+whenever its table is reloaded). Names are accent-folded, lower-cased and
+split into tokens; every prefix of every token points at the entries that
+contain it, so a keystroke-by-keystroke query is a handful of set
+intersections. Tokens that don't prefix-match anything fall back to a
+trigram similarity lookup, which catches small typos ("jetter" for "jeter",
+"girardy" for "girardi").
+
+Examples
+--------
+>>> mlb.search('abreu')
+>>> mlb.search('white so', kind='teams')
+>>> mlb.search('wrigley', kind='venues', limit=3)
+"""
+import heapq
+import unicodedata
+from typing import Optional
+
+from . import refindex
+
+KINDS = ('people','teams','venues')
+
+# match quality of a single query token against an entry
+_EXACT = 3
+_PREFIX = 2
+_FUZZY = 1
+
+_FUZZY_MIN_SIMILARITY = 0.4
+
+# short prefixes ("j") match thousands of entries; only this many of them
+# (in best-first order, plus as many exact token matches) are scored
+_MAX_SCORED = 100
+
+def normalize(text) -> str:
+    """Accent-fold, lower-case and strip punctuation from `text`"""
+    if text is None or text != text:
+        return ''
+    text = unicodedata.normalize('NFKD',str(text))
+    text = ''.join(ch for ch in text if not unicodedata.combining(ch))
+    return ''.join(ch if ch.isalnum() else ' ' for ch in text.lower()).strip()
+
+def tokenize(text) -> list:
+    return normalize(text).split()
+
+def _trigrams(token:str) -> set:
+    padded = f'^{token}$'
+    return {padded[i:i+3] for i in range(len(padded) - 2)}
+
+class SearchIndex:
+    """Prefix + trigram index over a list of named entries
+
+    Parameters:
+    -----------
+    entries : list[dict]
+        result rows. Each needs a 'name'
+
+    aliases : list[str], optional
+        extra text to index for each entry (e.g. a player's given name).
+        Matches on alias tokens rank just below matches on the name
+
+    Entries should be passed best-first; ties in score keep that order
+    """
+    def __init__(self,entries:list,aliases:list=None):
+        self.entries = entries
+        self.names = []
+        self.tokens = []
+        self.prefixes: dict = {}
+        self.vocab: dict = {}
+        self.trigrams: dict = {}
+        for idx,entry in enumerate(entries):
+            name_tokens = tokenize(entry['name'])
+            alias_tokens = tokenize(aliases[idx]) if aliases is not None else []
+            self.names.append(' '.join(name_tokens))
+            self.tokens.append((tuple(name_tokens),frozenset(alias_tokens)))
+            for token in set(name_tokens) | set(alias_tokens):
+                self.vocab.setdefault(token,set()).add(idx)
+                for end in range(1,len(token) + 1):
+                    self.prefixes.setdefault(token[:end],set()).add(idx)
+        for token in self.vocab:
+            for gram in _trigrams(token):
+                self.trigrams.setdefault(gram,[]).append(token)
+        # postings are kept as sorted tuples so the best-ranked entries
+        # for a prefix are always at the front
+        self.vocab = {k:tuple(sorted(v)) for k,v in self.vocab.items()}
+        self.prefixes = {k:tuple(sorted(v)) for k,v in self.prefixes.items()}
+
+    def __len__(self):
+        return len(self.entries)
+
+    def _fuzzy(self,token:str) -> tuple:
+        """Entries with a token similar to `token` and the similarity of
+        each matching vocabulary token"""
+        grams = _trigrams(token)
+        counts = {}
+        for gram in grams:
+            for candidate in self.trigrams.get(gram,()):
+                counts[candidate] = counts.get(candidate,0) + 1
+        matched = set()
+        similar = {}
+        for candidate,shared in counts.items():
+            # a padded token of length n has n trigrams
+            similarity = shared / (len(grams) + len(candidate) - shared)
+            if similarity >= _FUZZY_MIN_SIMILARITY:
+                matched.update(self.vocab[candidate])
+                similar[candidate] = similarity
+        return tuple(sorted(matched)), similar
+
+    def _token_score(self,q:str,idx:int,similar:dict=None) -> float:
+        name_tokens, alias_tokens = self.tokens[idx]
+        if similar is not None:
+            best = max((similar.get(t,0) for t in name_tokens),default=0)
+            best = max(best,max((similar.get(t,0) for t in alias_tokens),default=0) - 0.25)
+            return _FUZZY * best
+        if q in name_tokens:
+            return _EXACT
+        if any(t.startswith(q) for t in name_tokens):
+            return _PREFIX
+        if q in alias_tokens:
+            return _EXACT - 0.5
+        if any(t.startswith(q) for t in alias_tokens):
+            return _PREFIX - 0.5
+        return 0
+
+    def search(self,query:str,limit:int=10) -> list:
+        """Best `limit` entries for `query` as `(score, entry)` pairs"""
+        q_tokens = tokenize(query)
+        if len(q_tokens) == 0:
+            return []
+        candidates = None
+        fuzzy = {}
+        # rarest token first keeps the intersections small
+        for q in sorted(q_tokens,key=lambda t: len(self.prefixes.get(t,()))):
+            matched = self.prefixes.get(q)
+            if not matched and len(q) >= 3:
+                matched, fuzzy[q] = self._fuzzy(q)
+            if not matched:
+                return []
+            if candidates is None:
+                if len(matched) > _MAX_SCORED:
+                    matched = matched[:_MAX_SCORED] + self.vocab.get(q,())[:_MAX_SCORED]
+                candidates = set(matched)
+            else:
+                candidates = candidates.intersection(matched)
+            if not candidates:
+                return []
+
+        phrase = ' '.join(q_tokens)
+        def score(idx):
+            s = sum(self._token_score(q,idx,fuzzy.get(q)) for q in q_tokens)
+            name = self.names[idx]
+            if name == phrase:
+                s += 2
+            elif name.startswith(phrase):
+                s += 1
+            elif self.tokens[idx][0][:1] == (q_tokens[0],):
+                s += 0.5
+            return (s,-idx)
+
+        best = heapq.nlargest(limit,candidates,key=score)
+        return [(score(idx)[0],self.entries[idx]) for idx in best]
+
+# ---------------------------------------------------------------
+# Index builders
+# ---------------------------------------------------------------
+def _people_index(df) -> SearchIndex:
+    df = df.sort_values(['year_recent','year_debut'],ascending=False,kind='stable')
+    entries, aliases = [], []
+    for r in df.to_dict('records'):
+        entries.append({
+            'kind':'people',
+            'mlbam':int(r['mlbam']),
+            'name':f"{r['name_first']} {r['name_last']}",
+            'name_given':r['name_given'],
+            'bbrefID':r['bbrefID'],
+            'year_debut':int(r['year_debut']),
+            'year_recent':int(r['year_recent']),
+        })
+        aliases.append(r['name_given'])
+    return SearchIndex(entries,aliases)
+
+def _teams_index(df) -> SearchIndex:
+    # one entry per (team, name) across every season it was used
+    grouped = df.groupby(['mlbam','name_full'],sort=False).agg(
+        franchID=('franchID','last'),
+        first_season=('season','min'),
+        last_season=('season','max'),
+    ).reset_index().sort_values('last_season',ascending=False,kind='stable')
+    entries, aliases = [], []
+    for r in grouped.to_dict('records'):
+        entries.append({
+            'kind':'teams',
+            'mlbam':int(r['mlbam']),
+            'name':r['name_full'],
+            'franchID':r['franchID'],
+            'first_season':int(r['first_season']),
+            'last_season':int(r['last_season']),
+        })
+        aliases.append(r['franchID'])
+    return SearchIndex(entries,aliases)
+
+def _venues_index(df) -> SearchIndex:
+    df = df.sort_values('active',ascending=False,kind='stable')
+    entries, aliases = [], []
+    for r in df.to_dict('records'):
+        entries.append({
+            'kind':'venues',
+            'mlbam':int(r['mlbam']),
+            'name':r['name'],
+            'city':r['city'],
+            'state':r['state'],
+            'active':bool(r['active']),
+        })
+        aliases.append(r['city'])
+    return SearchIndex(entries,aliases)
+
+_BUILDERS = {
+    'people':   ('people',_people_index),
+    'teams':    ('teams',_teams_index),
+    'venues':   ('venues',_venues_index),
+}
+
+def get_index(kind:str) -> SearchIndex:
+    """The (memoized) search index for 'people', 'teams' or 'venues'"""
+    table, builder = _BUILDERS[kind]
+    return refindex._index(table,f'search_{kind}',builder)
+
+def search(query:str,kind:Optional[str]=None,limit:int=10) -> list:
+    """Search people, teams and venues by name
+
+    Parameters:
+    -----------
+    query : str
+        full or partial name(s), e.g. "jose ab", "white sox", "wrigley"
+
+    kind : str, optional
+        one of 'people', 'teams' or 'venues' (or a list of them). Searches
+        all three by default
+
+    limit : int, default 10
+        maximum number of results
+
+    Returns:
+    --------
+    list[dict] : best matches first. Each result has 'kind', 'mlbam',
+    'name' and 'score' keys plus a few kind-specific fields
+
+    """
+    if kind is None or kind == 'all':
+        kinds = KINDS
+    elif isinstance(kind,str):
+        kinds = (kind,)
+    else:
+        kinds = tuple(kind)
+    for k in kinds:
+        if k not in _BUILDERS:
+            raise ValueError(f"kind must be one of {KINDS}, not '{k}'")
+
+    results = []
+    for k in kinds:
+        results.extend(get_index(k).search(query,limit))
+    if len(kinds) > 1:
+        results = sorted(results,key=lambda r: r[0],reverse=True)[:limit]
+    return [dict(entry,score=score) for score,entry in results]
@@ -0,0 +1,198 @@
+"""Season calendar built from seasons.csv
+
+Answers "which season (and which part of it) does this date fall in?" with a
+binary search over sorted arrays of season boundaries instead of scanning the
+seasons table. The calendar is built once and only rebuilt when seasons.csv is
+reloaded; the answer for today's date is cached until the date changes.
+
+Examples
+--------
+>>> from mlb.season_calendar import season_calendar
+>>> season_calendar.season_info('07/04/2021')
+{'in_progress': 2021, 'last_completed': 2020}
+>>> season_calendar.phase('2021-10-10')
+(2021, 'postseason')
+"""
+import bisect
+import datetime as dt
+import threading
+from typing import Optional, Union
+
+import pandas as pd
+
+from . import mlbdata
+
+PHASES = {
+    'spring':       ('springStartDate','springEndDate'),
+    'regular':      ('regularSeasonStartDate','regularSeasonEndDate'),
+    'postseason':   ('postSeasonStartDate','postSeasonEndDate'),
+    'offseason':    ('offSeasonStartDate','offSeasonEndDate'),
+}
+
+DateLike = Union[str,dt.date,dt.datetime,pd.Timestamp]
+
+def to_date(date:DateLike=None) -> dt.date:
+    """Normalize `mm/dd/yyyy`/`yyyy-mm-dd` strings, datetimes and timestamps
+    to a `datetime.date` (default: today)"""
+    if date is None:
+        return dt.date.today()
+    if isinstance(date,dt.datetime):
+        return date.date()
+    if isinstance(date,dt.date):
+        return date
+    date = str(date).strip()
+    for fmt in (r"%m/%d/%Y",r"%Y-%m-%d"):
+        try:
+            return dt.datetime.strptime(date,fmt).date()
+        except ValueError:
+            pass
+    return pd.Timestamp(date).date()
+
+def _dates(s:pd.Series) -> list:
+    return [None if pd.isna(d) else d.date() for d in s]
+
+class _Bounds:
+    # sorted, non-overlapping [start,end] intervals labelled with a value.
+    # Where two intervals overlap the later-starting one wins
+    def __init__(self,intervals:list):
+        intervals = sorted(i for i in intervals if i[0] is not None and i[1] is not None)
+        self.starts = [i[0] for i in intervals]
+        self.ends = [i[1] for i in intervals]
+        self.values = [i[2] for i in intervals]
+
+    def find(self,date:dt.date):
+        idx = bisect.bisect_right(self.starts,date) - 1
+        if idx >= 0 and date <= self.ends[idx]:
+            return self.values[idx]
+        return None
+
+class SeasonCalendar:
+    """Date -> season lookups over the bundled seasons table
+
+    Lookups are O(log n). The underlying table is re-checked for changes
+    when the date rolls over (or right away after `mlbdata.invalidate`/an
+    `updatedb.update_seasons` run) and `refresh()` forces a rebuild
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entry = None
+        self._checked_on: dt.date = None
+        self._today: tuple = None
+
+    def __repr__(self):
+        if self._entry is None:
+            return "<SeasonCalendar (not loaded)>"
+        return f"<SeasonCalendar {self._first}-{self._last}>"
+
+    def _build(self,entry:tuple):
+        df = entry[1]
+        seasons = [int(s) for s in df['season']]
+        starts = _dates(df['seasonStartDate'])
+        ends = _dates(df['seasonEndDate'])
+
+        self._seasons = _Bounds(list(zip(starts,ends,seasons)))
+        self._ends = dict(zip(seasons,ends))
+        # seasons ordered by their end date, for "last completed" lookups
+        completed = sorted((e,s) for e,s in zip(ends,seasons) if e is not None)
+        self._completed_ends = [c[0] for c in completed]
+        self._completed_seasons = [c[1] for c in completed]
+
+        intervals = []
+        for phase,(start_col,end_col) in PHASES.items():
+            for season,start,end in zip(seasons,_dates(df[start_col]),_dates(df[end_col])):
+                intervals.append((start,end,(season,phase)))
+        self._phases = _Bounds(intervals)
+
+        self._first, self._last = min(seasons), max(seasons)
+        self._entry = entry
+        self._today = None
+
+    def _ensure(self):
+        today = dt.date.today()
+        if self._entry is not None and mlbdata._registry.get('seasons') is self._entry and self._checked_on == today:
+            return
+        with self._lock:
+            # `_entry()` stats seasons.csv, so it is only called once a day
+            # or after the registry entry has been dropped
+            entry = mlbdata._entry('seasons')
+            if entry is not self._entry:
+                self._build(entry)
+            if self._checked_on != today:
+                self._today = None
+            self._checked_on = today
+
+    def refresh(self):
+        """Rebuild the calendar from seasons.csv"""
+        mlbdata.invalidate('seasons')
+        with self._lock:
+            self._entry = None
+            self._checked_on = None
+        self._ensure()
+
+    def season_of(self,date:DateLike=None) -> Optional[int]:
+        """Season in progress on `date` (or `None` if it falls between seasons)"""
+        self._ensure()
+        return self._seasons.find(to_date(date))
+
+    def last_completed(self,date:DateLike=None) -> Optional[int]:
+        """Most recent season that ended before `date`"""
+        self._ensure()
+        idx = bisect.bisect_left(self._completed_ends,to_date(date)) - 1
+        return self._completed_seasons[idx] if idx >= 0 else None
+
+    def is_complete(self,season:int,date:DateLike=None) -> bool:
+        """Whether `season` had ended by `date`. Seasons newer than
+        seasons.csv count as complete once their calendar year is over"""
+        self._ensure()
+        date = to_date(date)
+        end = self._ends.get(int(season))
+        if end is None:
+            return int(season) < date.year
+        return end < date
+
+    def phase(self,date:DateLike=None) -> tuple:
+        """`(season, phase)` for `date`, where phase is one of 'spring',
+        'regular', 'postseason' or 'offseason'. Dates that fall in a gap
+        between phases return `(season, None)`"""
+        self._ensure()
+        date = to_date(date)
+        found = self._phases.find(date)
+        if found is None:
+            return (self._seasons.find(date), None)
+        return found
+
+    def season_info(self,date:DateLike=None) -> dict:
+        """Season in progress and most recently completed season on `date`
+
+        Returns:
+        --------
+        dict : {'in_progress': int | None, 'last_completed': int | None}
+        """
+        self._ensure()
+        if date is None:
+            today = self._today
+            if today is not None and today[0] == self._checked_on:
+                return dict(today[1])
+            info = self._season_info(self._checked_on)
+            self._today = (self._checked_on, info)
+            return dict(info)
+        return self._season_info(to_date(date))
+
+    def _season_info(self,date:dt.date) -> dict:
+        in_progress = self._seasons.find(date)
+        if in_progress is not None:
+            last_completed = in_progress - 1
+        else:
+            idx = bisect.bisect_left(self._completed_ends,date) - 1
+            last_completed = self._completed_seasons[idx] if idx >= 0 else None
+        return {'in_progress':in_progress,
+                'last_completed':last_completed}
+
+    def default_season(self,date:DateLike=None) -> int:
+        """The season in progress on `date`, or else the last completed one"""
+        info = self.season_info(date)
+        if info['in_progress'] is None:
+            return info['last_completed']
+        return info['in_progress']
+
+season_calendar = SeasonCalendar()
@@ -0,0 +1,135 @@
+"""Columnar binary snapshots of the bundled reference tables
+
+A snapshot of a table is a directory under `SNAPSHOT_DIR` holding one `.npy`
+file per column plus a `schema.json` describing how to rebuild each column
+and the (mtime, size) of the CSV it was made from. Numeric and datetime
+columns are memory-mapped when loaded, so no text parsing or dtype inference
+happens on a warm start.
+
+A snapshot is only used while its source CSV is unchanged; a missing or stale
+snapshot makes `mlbdata` fall back to the CSV (and write a fresh snapshot).
+"""
+import os
+import json
+import shutil
+
+import numpy as np
+import pandas as pd
+
+from .paths import SNAPSHOT_DIR
+
+SCHEMA_VERSION = 1
+
+def _source_stamp(path) -> list:
+    # a snapshot built from several files is stamped with each of them
+    if isinstance(path,(list,tuple)):
+        return [_source_stamp(p) for p in path]
+    st = os.stat(path)
+    return [st.st_mtime_ns, st.st_size]
+
+def _write_column(folder:str,idx:int,s:pd.Series) -> dict:
+    col = {'name':s.name,'dtype':str(s.dtype)}
+    dtype = s.dtype
+    if isinstance(dtype,pd.CategoricalDtype):
+        col['kind'] = 'category'
+        col['ordered'] = bool(dtype.ordered)
+        np.save(os.path.join(folder,f'{idx}.npy'),s.cat.codes.to_numpy())
+        cats = pd.Series(dtype.categories)
+        col['categories'] = _write_column(folder,f'{idx}_categories',cats)
+    elif isinstance(dtype,np.dtype) and dtype.kind in 'biufcmM':
+        col['kind'] = 'numpy'
+        np.save(os.path.join(folder,f'{idx}.npy'),s.to_numpy())
+    elif isinstance(dtype,pd.api.extensions.ExtensionDtype) and getattr(dtype,'numpy_dtype',None) is not None and dtype.numpy_dtype.kind in 'biuf':
+        # nullable Int/Float/boolean: values plus a mask of missing entries
+        col['kind'] = 'masked'
+        mask = s.isna().to_numpy()
+        np.save(os.path.join(folder,f'{idx}.npy'),s.to_numpy(dtype=dtype.numpy_dtype,na_value=0))
+        np.save(os.path.join(folder,f'{idx}_mask.npy'),mask)
+    else:
+        values = s.to_numpy(dtype=object)
+        mask = s.isna().to_numpy()
+        if all(isinstance(v,str) for v in values[~mask]):
+            col['kind'] = 'str'
+            np.save(os.path.join(folder,f'{idx}.npy'),np.where(mask,'',values).astype(str))
+            np.save(os.path.join(folder,f'{idx}_mask.npy'),mask)
+        else:
+            col['kind'] = 'json'
+            with open(os.path.join(folder,f'{idx}.json'),'w') as f:
+                json.dump([None if m else v for v,m in zip(values.tolist(),mask)],f)
+    return col
+
+def _read_column(folder:str,idx,col:dict) -> pd.Series:
+    kind = col['kind']
+    if kind == 'numpy':
+        # a plain ndarray view keeps the data memory-mapped without leaking
+        # the np.memmap subclass into the frame
+        values = np.load(os.path.join(folder,f'{idx}.npy'),mmap_mode='r').view(np.ndarray)
+        return pd.Series(values,name=col['name'],copy=False)
+    if kind == 'category':
+        codes = np.load(os.path.join(folder,f'{idx}.npy'))
+        cats = _read_column(folder,f'{idx}_categories',col['categories'])
+        values = pd.Categorical.from_codes(codes,categories=cats,ordered=col['ordered'])
+        return pd.Series(values,name=col['name'])
+    if kind == 'masked':
+        values = np.load(os.path.join(folder,f'{idx}.npy'))
+        mask = np.load(os.path.join(folder,f'{idx}_mask.npy'))
+        s = pd.Series(values,name=col['name']).astype(col['dtype'])
+        s[mask] = pd.NA
+        return s
+    if kind == 'str':
+        values = np.load(os.path.join(folder,f'{idx}.npy')).astype(object)
+        mask = np.load(os.path.join(folder,f'{idx}_mask.npy'))
+        values[mask] = np.nan
+        return pd.Series(values,name=col['name'],dtype=col['dtype'])
+    with open(os.path.join(folder,f'{idx}.json')) as f:
+        values = json.load(f)
+    return pd.Series([np.nan if v is None else v for v in values],name=col['name'],dtype=col['dtype'])
+
+def write_snapshot(df:pd.DataFrame,name:str,source_path) -> bool:
+    """Write a snapshot of `df` made from the file at `source_path` (or a
+    list of files)
+
+    Returns False (and leaves any existing snapshot alone) if the snapshot
+    couldn't be written, e.g. because the package directory is read-only
+    """
+    folder = os.path.join(SNAPSHOT_DIR,name)
+    tmp = f'{folder}.tmp-{os.getpid()}'
+    try:
+        shutil.rmtree(tmp,ignore_errors=True)
+        os.makedirs(tmp)
+        schema = {
+            'version':SCHEMA_VERSION,
+            'source':_source_stamp(source_path),
+            'rows':len(df),
+            'columns':[_write_column(tmp,idx,df[col]) for idx,col in enumerate(df.columns)],
+        }
+        with open(os.path.join(tmp,'schema.json'),'w') as f:
+            json.dump(schema,f)
+        old = f'{folder}.old-{os.getpid()}'
+        if os.path.exists(folder):
+            os.replace(folder,old)
+        os.replace(tmp,folder)
+        shutil.rmtree(old,ignore_errors=True)
+        return True
+    except (OSError,TypeError,ValueError):
+        shutil.rmtree(tmp,ignore_errors=True)
+        return False
+
+def read_snapshot(name:str,source_path):
+    """Load a table's snapshot, or `None` if it is missing or older than
+    the file at `source_path`"""
+    folder = os.path.join(SNAPSHOT_DIR,name)
+    try:
+        with open(os.path.join(folder,'schema.json')) as f:
+            schema = json.load(f)
+        if schema.get('version') != SCHEMA_VERSION or schema['source'] != _source_stamp(source_path):
+            return None
+        columns = [_read_column(folder,idx,col) for idx,col in enumerate(schema['columns'])]
+    except (OSError,ValueError,KeyError):
+        return None
+    if len(columns) == 0:
+        return pd.DataFrame(index=pd.RangeIndex(schema['rows']))
+    return pd.concat(columns,axis=1)
+
+def remove_snapshot(name:str):
+    shutil.rmtree(os.path.join(SNAPSHOT_DIR,name),ignore_errors=True)
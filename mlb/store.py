@@ -0,0 +1,320 @@
+"""Embedded SQLite store for the reference tables
+
+The database lives at `paths.BASEBALL_DB` and is shared by every process on
+the machine. It is opened in WAL mode, so any number of readers can query
+it while an `updatedb.update_*` call rewrites a table: each rewrite happens
+in a single transaction and readers see either the old or the new rows,
+never a mix.
+
+A table is (re)loaded from its CSV automatically the first time it is
+queried and whenever the CSV has changed since it was loaded.
+
+Examples
+--------
+>>> from mlb.store import store
+>>> store.query('people').where(mlbam=547989).first()
+>>> (store.query('teams')
+...     .select('season','name_full','venue_name')
+...     .where('season','>=',2010)
+...     .where(franchID='CHW')
+...     .order_by('season',desc=True)
+...     .df())
+>>> store.sql("SELECT season, COUNT(*) AS n FROM coaches GROUP BY season",table='coaches')
+"""
+import os
+import sqlite3
+import threading
+from typing import Union
+
+import numpy as np
+import pandas as pd
+
+from .paths import BASEBALL_DB
+from . import mlbdata
+
+DB_PATH = BASEBALL_DB.replace('sqlite:///','',1)
+
+# table -> indexed columns (a tuple is a composite index)
+INDEXES = {
+    'people':           ['mlbam','bbrefID','retroID',('name_last','name_first')],
+    'teams':            [('mlbam','season'),'season','franchID','bbrefID'],
+    'venues':           ['mlbam','name'],
+    'seasons':          ['season'],
+    'standings':        [('team_mlbam','season'),'season'],
+    'yby_records':      [('tm_mlbam','season'),'season'],
+    'coaches':          ['person_mlbam',('team_mlbam','season'),'season'],
+    'bbref_data':       ['mlbam','bbrefID'],
+    'bbref_war_hit':    ['mlb_ID','player_ID',('year_ID','team_ID')],
+    'bbref_war_pitch':  ['mlb_ID','player_ID',('year_ID','team_ID')],
+}
+
+TABLES = tuple(INDEXES)
+
+_OPERATORS = ('=','!=','<','<=','>','>=','LIKE','NOT LIKE','IN','NOT IN','IS','IS NOT')
+
+def _quote(identifier:str) -> str:
+    return '"' + str(identifier).replace('"','""') + '"'
+
+def _sql_type(dtype) -> str:
+    if pd.api.types.is_bool_dtype(dtype) or pd.api.types.is_integer_dtype(dtype):
+        return 'INTEGER'
+    if pd.api.types.is_float_dtype(dtype):
+        return 'REAL'
+    return 'TEXT'
+
+def _to_sql_value(v):
+    if v is None or v is pd.NA or v is pd.NaT:
+        return None
+    if isinstance(v,float) and v != v:
+        return None
+    if isinstance(v,np.generic):
+        return v.item()
+    if isinstance(v,pd.Timestamp):
+        return v.strftime(r'%Y-%m-%d') if v == v.normalize() else v.isoformat()
+    return v
+
+def _rows(df:pd.DataFrame):
+    for row in df.itertuples(index=False,name=None):
+        yield tuple(_to_sql_value(v) for v in row)
+
+class Query:
+    """Small SELECT builder returned by `Store.query()`
+
+    Each method returns the query itself so calls can be chained. Nothing is
+    executed until `all()`, `first()`, `df()`, `count()` or iteration
+    """
+    def __init__(self,store:'Store',table:str):
+        self._store = store
+        self._table = table
+        self._columns = []
+        self._where = []
+        self._params = []
+        self._order = []
+        self._limit = None
+        self._offset = None
+
+    def __repr__(self):
+        return f"<mlb.store.Query {self.to_sql()[0]!r}>"
+
+    def __iter__(self):
+        return iter(self.all())
+
+    def select(self,*columns):
+        self._columns.extend(columns)
+        return self
+
+    def where(self,column:str=None,op:str='=',value=None,**equals):
+        """Add conditions (joined with AND)
+
+        `where('season','>=',2010)`, `where('mlbam','IN',[145,112])` or
+        `where(mlbam=145,season=2021)`. A value of `None` with '='/'!='
+        becomes IS NULL/IS NOT NULL
+        """
+        if column is not None:
+            self._add(column,op,value)
+        for col,value in equals.items():
+            self._add(col,'=',value)
+        return self
+
+    def _add(self,column,op,value):
+        op = op.upper()
+        if op not in _OPERATORS:
+            raise ValueError(f"unsupported operator '{op}'")
+        if value is None and op in ('=','!='):
+            op = 'IS' if op == '=' else 'IS NOT'
+        if op in ('IN','NOT IN'):
+            values = [_to_sql_value(v) for v in value]
+            if len(values) == 0:
+                self._where.append('0' if op == 'IN' else '1')
+                return
+            self._where.append(f"{_quote(column)} {op} ({','.join('?' * len(values))})")
+            self._params.extend(values)
+        else:
+            self._where.append(f"{_quote(column)} {op} ?")
+            self._params.append(_to_sql_value(value))
+
+    def order_by(self,column:str,desc:bool=False):
+        self._order.append(f"{_quote(column)} {'DESC' if desc else 'ASC'}")
+        return self
+
+    def limit(self,n:int,offset:int=None):
+        self._limit = int(n)
+        if offset is not None:
+            self._offset = int(offset)
+        return self
+
+    def to_sql(self,columns:str=None) -> tuple:
+        if columns is None:
+            columns = ','.join(_quote(c) for c in self._columns) if self._columns else '*'
+        sql = f"SELECT {columns} FROM {_quote(self._table)}"
+        if self._where:
+            sql += " WHERE " + " AND ".join(self._where)
+        if self._order:
+            sql += " ORDER BY " + ",".join(self._order)
+        if self._limit is not None:
+            sql += f" LIMIT {self._limit}"
+            if self._offset is not None:
+                sql += f" OFFSET {self._offset}"
+        return sql, tuple(self._params)
+
+    def all(self) -> list[dict]:
+        return self._store.execute(*self.to_sql(),table=self._table)
+
+    def first(self) -> Union[dict,None]:
+        limit = self._limit
+        self._limit = 1
+        try:
+            rows = self.all()
+        finally:
+            self._limit = limit
+        return rows[0] if rows else None
+
+    def df(self) -> pd.DataFrame:
+        return self._store.sql(*self.to_sql(),table=self._table)
+
+    def count(self) -> int:
+        sql, params = self.to_sql(columns='COUNT(*) AS n')
+        return self._store.execute(sql,params,table=self._table)[0]['n']
+
+class Store:
+    """Connection manager for the SQLite reference store
+
+    Parameters:
+    -----------
+    path : str
+        database file (default: `paths.BASEBALL_DB`)
+
+    Connections are per-thread. Tables are synced from their CSV on first
+    use and whenever the CSV changes
+    """
+    def __init__(self,path:str=DB_PATH):
+        self.path = path
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._synced: dict = {}
+
+    def __repr__(self):
+        return f"<mlb.store.Store {self.path}>"
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local,'conn',None)
+        if conn is None:
+            conn = sqlite3.connect(self.path,timeout=30,isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS _sources (name TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER)")
+            self._local.conn = conn
+        return conn
+
+    def close(self):
+        """Close this thread's connection"""
+        conn = getattr(self._local,'conn',None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    # -----------------------------------------------------------
+    # Loading
+    # -----------------------------------------------------------
+    def replace_table(self,name:str,df:pd.DataFrame,stamp:tuple=None):
+        """Replace every row of table `name` with `df` in one transaction"""
+        conn = self.conn
+        columns = list(df.columns)
+        cols_sql = ','.join(f"{_quote(c)} {_sql_type(df[c].dtype)}" for c in columns)
+        insert = f"INSERT INTO {_quote(name)} VALUES ({','.join('?' * len(columns))})"
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(f"DROP TABLE IF EXISTS {_quote(name)}")
+            conn.execute(f"CREATE TABLE {_quote(name)} ({cols_sql})")
+            conn.executemany(insert,_rows(df))
+            for idx in INDEXES.get(name,()):
+                idx_cols = (idx,) if isinstance(idx,str) else tuple(idx)
+                if not set(idx_cols).issubset(columns):
+                    continue
+                idx_name = f"ix_{name}_{'_'.join(idx_cols)}"
+                conn.execute(f"CREATE INDEX {_quote(idx_name)} ON {_quote(name)} ({','.join(_quote(c) for c in idx_cols)})")
+            if stamp is not None:
+                conn.execute("INSERT OR REPLACE INTO _sources VALUES (?,?,?)",(name,*stamp))
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        self._synced[name] = stamp
+
+    def upsert(self,name:str,df:pd.DataFrame,key:Union[str,list],stamp:tuple=None):
+        """Insert or replace the rows of `df` (matched on `key`, a column or
+        list of columns) in one transaction, leaving the rest of the table
+        alone
+
+        Falls back to reloading the whole table from its CSV if the table
+        doesn't exist yet or its columns differ from `df`'s
+        """
+        conn = self.conn
+        existing = [r[1] for r in conn.execute(f"PRAGMA table_info({_quote(name)})")]
+        if existing != list(df.columns):
+            self.sync(name,force=True)
+            return
+        key = [key] if isinstance(key,str) else list(key)
+        keys = _rows(df[key].drop_duplicates())
+        insert = f"INSERT INTO {_quote(name)} VALUES ({','.join('?' * len(df.columns))})"
+        delete = f"DELETE FROM {_quote(name)} WHERE " + " AND ".join(f"{_quote(k)} = ?" for k in key)
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany(delete,keys)
+            conn.executemany(insert,_rows(df))
+            if stamp is not None:
+                conn.execute("INSERT OR REPLACE INTO _sources VALUES (?,?,?)",(name,*stamp))
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        self._synced[name] = stamp
+
+    def sync(self,name:str,force:bool=False):
+        """Load table `name` from its CSV if it is missing or out of date"""
+        if name not in INDEXES:
+            raise KeyError(f"'{name}' is not a store table. Options: {TABLES}")
+        stamp = mlbdata._file_stamp(mlbdata._TABLES[name][0])
+        if not force and self._synced.get(name) == stamp:
+            return
+        with self._lock:
+            row = self.conn.execute("SELECT mtime_ns, size FROM _sources WHERE name=?",(name,)).fetchone()
+            if force or row is None or tuple(row) != stamp:
+                self.replace_table(name,mlbdata._entry(name)[1],stamp)
+            self._synced[name] = stamp
+
+    def sync_all(self):
+        """Sync every table whose CSV is available"""
+        for name in TABLES:
+            if os.path.exists(mlbdata._TABLES[name][0]):
+                self.sync(name)
+
+    # -----------------------------------------------------------
+    # Querying
+    # -----------------------------------------------------------
+    def query(self,table:str) -> Query:
+        """Start a `Query` against one of `TABLES`"""
+        if table not in INDEXES:
+            raise KeyError(f"'{table}' is not a store table. Options: {TABLES}")
+        return Query(self,table)
+
+    def execute(self,sql:str,params=(),table:str=None) -> list[dict]:
+        """Run raw SQL and return the rows as dictionaries
+
+        If `table` is given it is synced first
+        """
+        if table is not None:
+            self.sync(table)
+        return [dict(r) for r in self.conn.execute(sql,params).fetchall()]
+
+    def sql(self,sql:str,params=(),table:str=None) -> pd.DataFrame:
+        """Run raw SQL and return a dataframe"""
+        if table is not None:
+            self.sync(table)
+        cur = self.conn.execute(sql,params)
+        columns = [d[0] for d in cur.description]
+        return pd.DataFrame([tuple(r) for r in cur.fetchall()],columns=columns)
+
+store = Store()
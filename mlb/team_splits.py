@@ -0,0 +1,255 @@
+"""Query API for the bundled team splits (`mlb/baseball/team_splits/`)
+
+The dataset holds 2021 Baseball-Reference split tables for every team:
+batting and pitching splits (one CSV per team) and per-position fielding
+tables (one JSON file per position and team).
+
+Nothing is read until it is asked for. Loading one team only parses that
+team's file(s). The first cross-team query of a stat group converts the
+whole group to one compact frame ('team'/'Category'/'Split' as
+categoricals, stats as float32 except innings, which stay float64) and writes it as a columnar snapshot; from
+then on every query and team load (in this or any other process) slices the
+memory-mapped snapshot instead of parsing anything.
+
+Examples
+--------
+>>> from mlb import team_splits
+>>> team_splits.load('white-sox','batting')
+>>> team_splits.query('batting',split='vs RHP',columns=['OPS'])
+>>> team_splits.query('pitching',category='month',teams=['cubs',145])
+>>> team_splits.query('fielding',category='ss',columns=['Name','Inn','Fld%'])
+"""
+import os
+import json
+import threading
+from typing import Union
+
+import pandas as pd
+
+from .paths import TEAM_SPLITS_DIR
+from . import mlbdata
+from . import snapshots
+from .parsing import INNINGS_COLUMNS
+
+GROUPS = ('batting','pitching','fielding')
+
+SEASON = 2021
+
+POSITIONS = ('p','c','1b','2b','3b','ss','lf','cf','rf','of')
+
+_cache: dict = {}
+_lock = threading.RLock()
+
+# ---------------------------------------------------------------
+# Teams
+# ---------------------------------------------------------------
+def teams() -> list[str]:
+    """Team slugs in the dataset (e.g. 'white-sox')"""
+    folder = os.path.join(TEAM_SPLITS_DIR,'batting')
+    return sorted(f[:-4] for f in os.listdir(folder) if f.endswith('.csv'))
+
+def _slugs() -> dict:
+    """Every accepted team identifier -> slug"""
+    df = mlbdata.get_teams_df(SEASON)
+    available = set(teams())
+    ref = {}
+    for row in df.to_dict('records'):
+        slug = row['name_club'].lower().replace(' ','-')
+        if slug not in available:
+            continue
+        for key in (slug,row['mlbam'],str(row['mlbam']),row['name_full'].lower(),row['name_club'].lower(),
+                    str(row['franchID']).lower(),str(row['bbrefID']).lower()):
+            ref[key] = slug
+    return ref
+
+def team_slug(team:Union[int,str]) -> str:
+    """Slug for a team given as a slug, mlbam ID, name or abbreviation"""
+    key = team.lower().strip() if isinstance(team,str) else int(team)
+    slug = _slugs().get(key)
+    if slug is None:
+        raise ValueError(f"no team splits for '{team}'")
+    return slug
+
+# ---------------------------------------------------------------
+# Loading
+# ---------------------------------------------------------------
+def _source_files(group:str,slug:str) -> list:
+    if group == 'fielding':
+        return [os.path.join(TEAM_SPLITS_DIR,'fielding',f'{pos}-{slug}.json') for pos in POSITIONS]
+    return [os.path.join(TEAM_SPLITS_DIR,group,f'{slug}.csv')]
+
+def _compact(df:pd.DataFrame,text_cols:list,category_cols:list) -> pd.DataFrame:
+    for col in df.columns:
+        if col in category_cols:
+            df[col] = df[col].astype('category')
+        elif col in INNINGS_COLUMNS:
+            df[col] = pd.to_numeric(df[col],errors='coerce').astype('float64')
+        elif col not in text_cols:
+            df[col] = pd.to_numeric(df[col],errors='coerce').astype('float32')
+    return df
+
+def _parse(group:str,slug:str) -> pd.DataFrame:
+    files = _source_files(group,slug)
+    if group == 'fielding':
+        frames = []
+        for pos,path in zip(POSITIONS,files):
+            with open(path) as f:
+                df = pd.DataFrame(json.load(f))
+            df.insert(0,'Category',pos)
+            frames.append(df.reset_index(drop=True))
+        df = pd.concat(frames,ignore_index=True)
+        return _compact(df,['Name'],['Category'])
+    df = pd.read_csv(files[0],low_memory=False)
+    return _compact(df,[],['Category','Split'])
+
+def _read_snapshot(group:str) -> pd.DataFrame:
+    df = snapshots.read_snapshot(f'team_splits.{group}',_group_files(group))
+    # snapshots written before innings were kept as float64
+    if df is not None and any(df[col].dtype == 'float32' for col in INNINGS_COLUMNS if col in df.columns):
+        return None
+    return df
+
+def _memo(key:str,build):
+    df = _cache.get(key)
+    if df is None:
+        with _lock:
+            df = _cache.get(key)
+            if df is None:
+                df = build()
+                _cache[key] = df
+    return df
+
+def _team_frame(group:str,slug:str) -> pd.DataFrame:
+    # a team is sliced out of the group snapshot when it is already built;
+    # otherwise only that team's file(s) are parsed
+    df = _cache.get(group)
+    if df is None:
+        df = _read_snapshot(group)
+        if df is not None:
+            _cache[group] = df
+    if df is not None:
+        df = df[(df['team'] == slug).to_numpy()].drop(columns=['team','team_mlbam']).reset_index(drop=True)
+        for col in ('Category','Split'):
+            if col in df.columns:
+                df[col] = df[col].cat.remove_unused_categories()
+        return df
+    return _memo(f'{group}/{slug}',lambda: _parse(group,slug))
+
+def _group_files(group:str) -> list:
+    return [f for slug in teams() for f in _source_files(group,slug)]
+
+def _group_frame(group:str) -> pd.DataFrame:
+    def build():
+        name = f'team_splits.{group}'
+        files = _group_files(group)
+        df = _read_snapshot(group)
+        if df is None:
+            mlbams = {slug:int(mlbam) for mlbam,slug in _slugs().items() if isinstance(mlbam,int)}
+            frames = []
+            for slug in teams():
+                df = _cache.pop(f'{group}/{slug}',None)
+                df = _parse(group,slug) if df is None else df.copy()
+                df.insert(0,'team',slug)
+                df.insert(1,'team_mlbam',mlbams.get(slug,0))
+                frames.append(df)
+            df = pd.concat(frames,ignore_index=True)
+            # union of each team's categories
+            for col in ('Category','Split'):
+                if col in df.columns:
+                    df[col] = df[col].astype(str).astype('category')
+            df['team'] = df['team'].astype('category')
+            snapshots.write_snapshot(df,name,files)
+        return df
+    return _memo(group,build)
+
+def _check_group(group:str):
+    if group not in GROUPS:
+        raise ValueError(f"group must be one of {GROUPS}, not '{group}'")
+
+def load(team:Union[int,str],group:str='batting') -> pd.DataFrame:
+    """All splits of one stat group for one team
+
+    Parameters:
+    -----------
+    team : int or str
+        slug ('white-sox'), mlbam ID (145), name ('Chicago White Sox',
+        'White Sox') or abbreviation ('CHW')
+
+    group : str, default 'batting'
+        'batting', 'pitching' or 'fielding'
+
+    """
+    _check_group(group)
+    return _team_frame(group,team_slug(team)).copy()
+
+def query(group:str='batting',split:Union[str,list]=None,category:Union[str,list]=None,
+          columns:list=None,teams:list=None) -> pd.DataFrame:
+    """Rows of a stat group across teams
+
+    Parameters:
+    -----------
+    group : str, default 'batting'
+        'batting', 'pitching' or 'fielding'
+
+    split : str or list, optional
+        value(s) of 'Split' to keep (e.g. 'vs RHP'). Batting/pitching only
+
+    category : str or list, optional
+        value(s) of 'Category' to keep (e.g. 'platoon'; for fielding, the
+        position e.g. 'ss')
+
+    columns : list, optional
+        stat columns to return (the identifying columns are always included)
+
+    teams : list, optional
+        teams to keep (any identifier accepted by `load`). Default: all
+
+    """
+    _check_group(group)
+    df = _group_frame(group)
+    mask = pd.Series(True,index=df.index)
+    if split is not None:
+        if 'Split' not in df.columns:
+            raise ValueError(f"'{group}' has no splits")
+        mask &= df['Split'].isin([split] if isinstance(split,str) else split)
+    if category is not None:
+        mask &= df['Category'].isin([category] if isinstance(category,str) else category)
+    if teams is not None:
+        mask &= df['team'].isin([team_slug(t) for t in teams])
+    if columns is not None:
+        keys = [c for c in ('team','team_mlbam','Category','Split','Name') if c in df.columns]
+        df = df[keys + [c for c in columns if c not in keys]]
+    df = df[mask.to_numpy()].reset_index(drop=True)
+    for col in ('team','Category','Split'):
+        if col in df.columns:
+            df[col] = df[col].cat.remove_unused_categories()
+    return df
+
+def categories(group:str='batting') -> list:
+    """Split categories available in a stat group"""
+    _check_group(group)
+    return list(_group_frame(group)['Category'].cat.categories)
+
+def splits(group:str='batting',category:str=None) -> list:
+    """Split names in a stat group (optionally within one category)"""
+    _check_group(group)
+    df = _group_frame(group)
+    if category is not None:
+        df = df[df['Category'] == category]
+    return sorted(df['Split'].astype(str).unique())
+
+def split_ids(group:str='batting') -> dict:
+    """Baseball-Reference split category names -> split IDs"""
+    path = os.path.join(TEAM_SPLITS_DIR,{'batting':'bat_split_ids.json','pitching':'pitch_split_ids.json'}[group])
+    with open(path) as f:
+        return json.load(f)
+
+def build(groups=GROUPS):
+    """Convert the whole dataset to snapshots ahead of time"""
+    for group in groups:
+        _group_frame(group)
+
+def clear():
+    """Drop the frames held in memory"""
+    with _lock:
+        _cache.clear()
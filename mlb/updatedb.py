@@ -1,4 +1,7 @@
+import io
+import os
 import json
+import datetime as dt
 import requests
 from typing import Union
 
@@ -6,75 +9,268 @@ import pandas as pd
 import numpy as np
 
 from .paths import *
+from . import mlbdata
+from . import store
 from .mlbdata import get_teams_df
 from .constants import COLS_SEASON
+from .season_calendar import season_calendar
 from .async_mlb import fetch
+from .async_mlb.client import client
 from .async_mlb import get_updated_records
 from .async_mlb import fetch_coaching_roster
 from .async_mlb import fetch_standings
 from .async_mlb.coaches import roster_json_to_df
+from .async_mlb.yby_records import COLUMNS as YBY_COLUMNS
 
-def update_people(inplace=True) -> Union[pd.DataFrame,None]:
-    """Update 'people' in the library's CSV files
+def _save(df:pd.DataFrame,name:str,path:str,changed:pd.DataFrame=None,key:str=None):
+    """Write a reference table, rebuild its binary snapshot, drop the stale
+    copy held by `mlbdata` and rewrite its rows in the SQLite store
+
+    The CSV is written to a temporary file and swapped in, so readers never
+    see a half-written table; the store is updated in one transaction. If
+    `changed` (the inserted/modified rows, matched on `key`) is given, only
+    those rows are written to the store
+    """
+    in_store = name in store.TABLES
+    if in_store and changed is not None:
+        # bring the store up to date with the old CSV so only `changed`
+        # needs to be applied
+        store.store.sync(name)
+    tmp = f"{path}.tmp-{os.getpid()}"
+    df.to_csv(tmp,index=False)
+    os.replace(tmp,path)
+    mlbdata.rebuild_snapshot(name)
+    if in_store:
+        if changed is None:
+            store.store.sync(name,force=True)
+        else:
+            store.store.upsert(name,changed,key,stamp=mlbdata._file_stamp(path))
+
+# ---------------------------------------------------------------
+# State kept between incremental updates (HTTP validators, checkpoints)
+# ---------------------------------------------------------------
+def _load_state(section:str) -> dict:
+    try:
+        with open(UPDATE_STATE_JSON) as f:
+            return json.load(f).get(section,{})
+    except (OSError,ValueError):
+        return {}
+
+def _save_state(section:str,value:dict):
+    try:
+        with open(UPDATE_STATE_JSON) as f:
+            state = json.load(f)
+    except (OSError,ValueError):
+        state = {}
+    state[section] = value
+    tmp = f"{UPDATE_STATE_JSON}.tmp-{os.getpid()}"
+    with open(tmp,'w') as f:
+        json.dump(state,f,indent=2)
+    os.replace(tmp,UPDATE_STATE_JSON)
+
+# Conditional GETs go through their own pooled session rather than
+# `client.http`: that session's response cache would answer them from disk
+# without ever sending the validators
+_http = requests.Session()
+
+def _conditional_get(url:str,validators:dict=None) -> requests.Response:
+    """GET `url`, sending the ETag/Last-Modified from a previous response.
+    A 304 response means the resource hasn't changed"""
+    headers = {}
+    if validators:
+        if validators.get('etag'):
+            headers['If-None-Match'] = validators['etag']
+        if validators.get('last_modified'):
+            headers['If-Modified-Since'] = validators['last_modified']
+    resp = _http.get(url,headers=headers,timeout=60)
+    if resp.status_code != 304:
+        resp.raise_for_status()
+    return resp
+
+def _validators(resp:requests.Response) -> dict:
+    return {'etag':resp.headers.get('ETag'),
+            'last_modified':resp.headers.get('Last-Modified')}
+
+def _changed_rows(old:pd.DataFrame,new:pd.DataFrame,key:str) -> pd.DataFrame:
+    """Rows of `new` whose `key` isn't in `old` or whose values differ"""
+    columns = list(new.columns)
+    old = old[columns].drop_duplicates(key,keep='last')
+    old_hash = pd.Series(pd.util.hash_pandas_object(old,index=False).to_numpy(),index=old[key].to_numpy())
+    new_hash = pd.util.hash_pandas_object(new,index=False).to_numpy()
+    matched = old_hash.reindex(new[key].to_numpy()).to_numpy()
+    return new[matched != new_hash]
+
+def _seasons_to_fetch(section:str,current:pd.DataFrame,first:int=1876) -> list:
+    """Seasons that need to be (re)fetched for a per-season table
+
+    A season is fetched if it has never been fetched and is missing from
+    `current`, or if it wasn't complete the last time it was fetched. Without recorded metadata (e.g. the
+    tables bundled with the package), every stored season except the
+    latest is assumed final
+    """
+    meta = _load_state(section).get('seasons',{})
+    stored = set(int(x) for x in current['season'].unique()) if len(current) > 0 else set()
+    latest_stored = max(stored) if stored else None
+    seasons = []
+    for season in range(first,dt.date.today().year + 1):
+        info = meta.get(str(season))
+        if info is not None:
+            # includes seasons the API has no rows for
+            if not info.get('final'):
+                seasons.append(season)
+        elif season not in stored or season == latest_stored:
+            seasons.append(season)
+    return seasons
+
+def _merge_seasons(current:pd.DataFrame,fetched:pd.DataFrame) -> pd.DataFrame:
+    """Replace the rows of every season in `fetched`"""
+    keep = current[~current['season'].isin(fetched['season'].unique())]
+    return pd.concat([keep,fetched],ignore_index=True)
+
+def _record_seasons(section:str,fetched:pd.DataFrame,seasons:list):
+    state = _load_state(section)
+    meta = state.get('seasons',{})
+    now = dt.datetime.now().isoformat(timespec='seconds')
+    counts = fetched['season'].value_counts()
+    for season in seasons:
+        meta[str(season)] = {
+            'fetched_at':now,
+            'final':season_calendar.is_complete(season),
+            'rows':int(counts.get(season,0)),
+        }
+    state['seasons'] = meta
+    _save_state(section,state)
+
+# ---------------------------------------------------------------
+# People (Chadwick Bureau register)
+# ---------------------------------------------------------------
+# The register is published as 16 files split on the first hex digit of
+# each person's key
+REGISTER_URLS = [f"https://raw.githubusercontent.com/chadwickbureau/register/master/data/people-{c}.csv" for c in '0123456789abcdef']
+
+PEOPLE_COLUMNS = ["name_first","name_last","name_given","mlbam","bbrefID","bbrefIDminors","retroID","year_debut","year_recent"]
+
+def _parse_register(df:pd.DataFrame) -> pd.DataFrame:
+    df = df[["key_mlbam","key_retro","key_bbref","key_bbref_minors","mlb_played_first","mlb_played_last","name_first","name_last","name_given"]]
+    df = df.rename(columns={"key_mlbam":"mlbam","key_retro":"retroID","key_bbref_minors":"bbrefIDminors","key_bbref":"bbrefID","mlb_played_first":"year_debut","mlb_played_last":"year_recent"})
+    df = df[df["retroID"].notna() & df["mlbam"].notna()].copy()
+
+    for col in ('mlbam','year_debut','year_recent'):
+        df[col] = pd.to_numeric(df[col],errors='coerce').fillna(0).astype('int32')
+    df = df[df['mlbam'] != 0]
+    for col in ("name_first","name_last","name_given","bbrefID","bbrefIDminors","retroID"):
+        df[col] = df[col].fillna("--").astype(str)
+
+    return df[PEOPLE_COLUMNS].drop_duplicates('mlbam',keep='last')
+
+def update_people(inplace=True,force=False) -> Union[pd.DataFrame,dict,None]:
+    """Update 'people' in the library's CSV files from the Chadwick Bureau
+    register
     
+    Only register files that changed since the last update are downloaded
+    (using their ETag/Last-Modified headers) and only new or changed people
+    are written
+
     Parameters:
     -----------
     inplace : bool default True
         if False, function will simply return the data retrieved from the API 
         without updating the current CSV file
-        
-    """
-    url = "https://raw.githubusercontent.com/chadwickbureau/register/master/data/people.csv"
-    df = pd.read_csv(url,low_memory=False)
+
+    force : bool default False
+        download every register file even if it hasn't changed
     
-    df = df[["key_mlbam","key_retro","key_bbref","key_bbref_minors","mlb_played_first","mlb_played_last","name_first","name_last","name_given"]]
-    df = df.fillna("--")
-    df = df[df["key_retro"]!="--"]
-    df = df.rename(columns={"key_mlbam":"mlbam","key_retro":"retroID","key_bbref_minors":"bbrefIDminors","key_bbref":"bbrefID","mlb_played_first":"year_debut","mlb_played_last":"year_recent","name_first":"name_first","name_last":"name_last","name_given":"name_given"})
-    df = df[df["mlbam"]!="--"]
-
-    columns = ["name_first","name_last","name_given","mlbam","bbrefID","bbrefIDminors","retroID","year_debut","year_recent"]
-    for idx, row in df.iterrows():
-        try:
-            row['mlbam'] = int(row['mlbam'])
-        except:
-            row['mlbam'] = np.nan
-        try:
-            row['year_debut'] = int(row['year_debut'])
-        except:
-            row['year_debut'] = np.nan
-        try:
-            row['year_recent'] = int(row['year_recent'])
-        except:
-            row['year_recent'] = np.nan
-
-    df = df[columns]
-    df[['mlbam','year_debut','year_recent']] = df[['mlbam','year_debut','year_recent']].fillna(0)
-    df = df.astype({'year_debut':'int32','year_recent':'int32','mlbam':'int32'})
-    df.reset_index(drop=True,inplace=True)
+    Returns:
+    --------
+    dict : (if inplace) number of files downloaded/skipped and people 
+    inserted/changed
+
+    """
+    state = _load_state('people')
+    current = mlbdata._raw_table('people')
+    # validators only count if people.csv is still the file they were
+    # recorded against
+    use_validators = inplace and not force and state.get('csv') == list(mlbdata._file_stamp(PEOPLE_CSV))
+    validators = state.get('files',{}) if use_validators else {}
+
+    frames = []
+    new_validators = {}
+    skipped = 0
+    for url in REGISTER_URLS:
+        resp = _conditional_get(url,validators.get(url))
+        if resp.status_code == 304:
+            new_validators[url] = validators[url]
+            skipped += 1
+            continue
+        frames.append(_parse_register(pd.read_csv(io.BytesIO(resp.content),dtype=str,low_memory=False)))
+        new_validators[url] = _validators(resp)
+
+    fetched = pd.concat(frames,ignore_index=True) if frames else current.iloc[0:0]
+    fetched = fetched.drop_duplicates('mlbam',keep='last').reset_index(drop=True)
 
     if inplace is False:
-        return df
+        return fetched
+
+    changed = _changed_rows(current,fetched,'mlbam')
+    if len(changed) > 0:
+        df = current.set_index('mlbam')
+        upd = changed.set_index('mlbam')
+        is_new = ~upd.index.isin(df.index)
+        df.update(upd[~is_new])
+        df = pd.concat([df,upd[is_new]]).reset_index()[PEOPLE_COLUMNS]
+        df = df.astype({'year_debut':'int32','year_recent':'int32','mlbam':'int32'})
+        _save(df,'people',PEOPLE_CSV,changed=changed,key='mlbam')
+        inserted = int(is_new.sum())
     else:
-        df.to_csv(PEOPLE_CSV,index=False)
+        inserted = 0
+
+    _save_state('people',{'csv':list(mlbdata._file_stamp(PEOPLE_CSV)),'files':new_validators})
+
+    return {'downloaded':len(REGISTER_URLS) - skipped,
+            'skipped':skipped,
+            'inserted':inserted,
+            'changed':len(changed) - inserted}
         
-def update_yby_records(inplace=True) -> Union[pd.DataFrame,None]:
+def update_yby_records(inplace=True,seasons=None,full=False) -> Union[pd.DataFrame,dict,None]:
     """Update yby records in the package's 'baseball.db'
     
+    Completed seasons are treated as final: only the season in progress and
+    seasons missing from the stored table are fetched, then merged in
+
     Parameters:
     -----------
     inplace : bool default True
         if False, function will simply return the data retrieved from the API 
         without updating the current CSV file
+
+    seasons : list[int], optional
+        fetch exactly these seasons
+
+    full : bool default False
+        re-fetch every season since 1876
         
     """
-    df = get_updated_records()
+    current = mlbdata._raw_table('yby_records')
+    if set(current.columns) != set(YBY_COLUMNS):
+        # the stored table predates the current layout
+        full = True
+    if full:
+        seasons = list(range(1876,dt.date.today().year + 1))
+    elif seasons is None:
+        seasons = _seasons_to_fetch('yby_records',current)
+    if len(seasons) == 0:
+        return current if inplace is False else {'fetched':[],'rows':0}
+
+    fetched = get_updated_records(seasons=seasons)
+    df = fetched if full else _merge_seasons(current,fetched)
     df = df.sort_values(by=["season","W%"],ascending=[False,False])
     
     if inplace is False:
         return df
     else:
-        df.to_csv(YBY_RECORDS_CSV,index=False)
+        _save(df,'yby_records',YBY_RECORDS_CSV,changed=None if full else fetched,key='season')
+        _record_seasons('yby_records',fetched,seasons)
+        return {'fetched':seasons,'rows':len(fetched)}
 
 def update_hof(inplace=True) -> Union[pd.DataFrame,None]:
     """Update "Hall Of Fame" data in the library's CSV files
@@ -88,7 +284,7 @@ def update_hof(inplace=True) -> Union[pd.DataFrame,None]:
     """
     url = "https://statsapi.mlb.com/api/v1/awards/MLBHOF/recipients?sportId=1&hydrate=results,team"
 
-    response = requests.get(url)
+    response = client.http.get(url)
     recipients = []
     for r in response.json()["awards"]:
         a_date = r["date"]
@@ -109,7 +305,7 @@ def update_hof(inplace=True) -> Union[pd.DataFrame,None]:
     if inplace is False:
         return df
     else:
-        df.to_csv(HALL_OF_FAME_CSV,index=False)
+        _save(df,'hall_of_fame',HALL_OF_FAME_CSV)
 
 def update_seasons(inplace=True) -> Union[pd.DataFrame,None]:
     """Update 'seasons' data in the library's CSV files
@@ -148,7 +344,7 @@ def update_seasons(inplace=True) -> Union[pd.DataFrame,None]:
         
     url = "https://statsapi.mlb.com/api/v1/seasons/all?sportId=1"
     
-    resp = requests.get(url)
+    resp = client.http.get(url)
 
     data = []
     for s in resp.json()["seasons"]:
@@ -163,7 +359,7 @@ def update_seasons(inplace=True) -> Union[pd.DataFrame,None]:
         df : pd.DataFrame = df
         return df
     else:
-        df.to_csv(SEASONS_CSV,index=False)
+        _save(df,'seasons',SEASONS_CSV)
 
 def update_venues(inplace=True) -> Union[pd.DataFrame,None]:
     """Update 'venues' data in the library's CSV files
@@ -179,7 +375,7 @@ def update_venues(inplace=True) -> Union[pd.DataFrame,None]:
     hydrations = "location,social,timezone,fieldInfo,metadata,images,xrefId,video"
     url = base + f"/venues?hydrate={hydrations}"
 
-    resp = requests.get(url)
+    resp = client.http.get(url)
 
     venues = resp.json()["venues"]
 
@@ -287,7 +483,7 @@ def update_venues(inplace=True) -> Union[pd.DataFrame,None]:
     if inplace is False:
         return df
     else:
-        df.to_csv(VENUES_CSV,index=False)
+        _save(df,'venues',VENUES_CSV)
 
 def update_bbref_data(inplace=True) -> Union[pd.DataFrame,None]:
     url = "https://www.baseball-reference.com/data/war_daily_bat.txt"
@@ -305,7 +501,7 @@ def update_bbref_data(inplace=True) -> Union[pd.DataFrame,None]:
     if inplace is False:
         return df.reset_index(drop=True)
     else:
-        df.to_csv(BBREF_DATA_CSV,index=False)
+        _save(df,'bbref_data',BBREF_DATA_CSV)
         
 def update_leagues(inplace=True) -> Union[pd.DataFrame,None]:
     """Update 'leagues' data in the library's CSV files
@@ -325,9 +521,9 @@ def update_leagues(inplace=True) -> Union[pd.DataFrame,None]:
         [0,'-','-','-','-',0,'-']
     ]
 
-    with requests.session() as sesh:
-        divs_resp = sesh.get(divs_url)
-        lgs_resp = sesh.get(lgs_url)
+    sesh = client.http
+    divs_resp = sesh.get(divs_url)
+    lgs_resp = sesh.get(lgs_url)
 
     for lg in lgs_resp.json()["leagues"]:
         data.append([
@@ -356,7 +552,7 @@ def update_leagues(inplace=True) -> Union[pd.DataFrame,None]:
     if inplace is False:
         return df
     else:
-        df.to_csv(LEAGUES_CSV,index=False)
+        _save(df,'leagues',LEAGUES_CSV)
     
 def update_bbref_hitting_war(inplace=True) -> Union[pd.DataFrame,None]:
     url = "https://www.baseball-reference.com/data/war_daily_bat.txt"
@@ -364,7 +560,7 @@ def update_bbref_hitting_war(inplace=True) -> Union[pd.DataFrame,None]:
     if inplace is False:
         return df
     else:
-        df.to_csv(BBREF_BATTING_DATA_CSV,index=False)
+        _save(df,'bbref_war_hit',BBREF_BATTING_DATA_CSV)
 
 def update_bbref_pitching_war(inplace=True) -> Union[pd.DataFrame,None]:
     url = "https://www.baseball-reference.com/data/war_daily_pitch.txt"
@@ -372,7 +568,7 @@ def update_bbref_pitching_war(inplace=True) -> Union[pd.DataFrame,None]:
     if inplace is False:
         return df
     else:
-        df.to_csv(BBREF_PITCHING_DATA_CSV,index=False)
+        _save(df,'bbref_war_pitch',BBREF_PITCHING_DATA_CSV)
 
 def update_pitch_types(inplace=True) -> Union[pd.DataFrame,None]:
     """Update 'pitch_types' in the library's CSV files
@@ -385,7 +581,7 @@ def update_pitch_types(inplace=True) -> Union[pd.DataFrame,None]:
         
     """
     url = 'https://statsapi.mlb.com/api/v1/pitchTypes'
-    resp = requests.get(url)
+    resp = client.http.get(url)
     data = []
     for p in resp.json():
         data.append({'code':p['code'],'description':p['description']})
@@ -396,7 +592,7 @@ def update_pitch_types(inplace=True) -> Union[pd.DataFrame,None]:
     if inplace is not True:
         return df
     
-    df.to_csv(PITCH_TYPES_CSV,index=False)
+    _save(df,'pitch_types',PITCH_TYPES_CSV)
     
 def update_pitch_codes(inplace=True) -> Union[pd.DataFrame,None]:
     """Update 'pitch_codes' in the library's CSV files
@@ -409,7 +605,7 @@ def update_pitch_codes(inplace=True) -> Union[pd.DataFrame,None]:
         
     """
     url = 'https://statsapi.mlb.com/api/v1/pitchCodes'
-    resp = requests.get(url)
+    resp = client.http.get(url)
     data = []
     for p in resp.json():
         data.append({'code':p['code'],'description':p['description']})
@@ -420,7 +616,7 @@ def update_pitch_codes(inplace=True) -> Union[pd.DataFrame,None]:
     if inplace is False:
         return df
     
-    df.to_csv(PITCH_CODES_CSV,index=False)
+    _save(df,'pitch_codes',PITCH_CODES_CSV)
     
 def update_event_types(inplace=True) -> Union[pd.DataFrame,None]:
     """Update 'event_types' in the library's CSV files
@@ -433,7 +629,7 @@ def update_event_types(inplace=True) -> Union[pd.DataFrame,None]:
         
     """
     url = 'https://statsapi.mlb.com/api/v1/eventTypes'
-    resp = requests.get(url)
+    resp = client.http.get(url)
     data = []
     for e in resp.json():
         e_type_data = {'code':e['code'],
@@ -449,34 +645,191 @@ def update_event_types(inplace=True) -> Union[pd.DataFrame,None]:
     if inplace is False:
         return df
     
-    df.to_csv(EVENT_TYPES_CSV,index=False)
+    _save(df,'event_types',EVENT_TYPES_CSV)
 
-def update_standings(inplace=True,**kwargs) -> Union[pd.DataFrame,None]:
+def update_standings(inplace=True,seasons=None,full=False,**kwargs) -> Union[pd.DataFrame,dict,None]:
     """Update the year-by-year standings.
     
+    Completed seasons are treated as final: only the season in progress and
+    seasons missing from the stored table are fetched, then merged in
+
     Parameters:
     -----------
     inplace : bool default True
         if False, function will simply return the data retrieved from the API 
         without updating the current CSV file
+
+    seasons : list[int], optional
+        fetch exactly these seasons
+
+    full : bool default False
+        re-fetch every season since 1876
     """
-    df = fetch_standings(**kwargs)
-    df.sort_values(by=['season','sport_rank'],ascending=[False,True],inplace=True)
-    df.reset_index(drop=True)
+    current = mlbdata._raw_table('standings')
+    if full:
+        seasons = list(range(1876,dt.date.today().year + 1))
+    elif seasons is None:
+        seasons = _seasons_to_fetch('standings',current)
+    if len(seasons) == 0:
+        return current if inplace is False else {'fetched':[],'rows':0}
+
+    fetched = fetch_standings(seasons=seasons,**kwargs)
+    fetched['season'] = fetched['season'].astype(int)
+    df = fetched if full else _merge_seasons(current,fetched)
+    df = df.sort_values(by=['season','sport_rank'],ascending=[False,True])
+    df = df.reset_index(drop=True)
     if inplace:
-        df.to_csv(STANDINGS_CSV,index=False)
-        return None
+        # columns can change as the API adds split records; only upsert when
+        # the stored layout still matches
+        same_layout = list(df.columns) == list(current.columns)
+        _save(df,'standings',STANDINGS_CSV,changed=fetched[list(df.columns)] if same_layout and not full else None,key='season')
+        _record_seasons('standings',fetched,seasons)
+        return {'fetched':seasons,'rows':len(fetched)}
     return df
 
-def update_coaches():
+COACHES_COLUMNS = ['jerseyNumber','job','jobId','title','season','person_mlbam','person_name','team_mlbam','team_name']
+
+def _coach_groups(df:pd.DataFrame) -> dict:
+    """(team_mlbam, season) -> hash of that team-season's coaching staff"""
+    if len(df) == 0:
+        return {}
+    df = df.sort_values(['team_mlbam','season','person_mlbam','jobId'],kind='stable')
+    hashes = pd.util.hash_pandas_object(df[COACHES_COLUMNS].astype(str),index=False)
+    grouped = hashes.groupby([df['team_mlbam'].to_numpy(),df['season'].to_numpy()]).agg(lambda h: hash(tuple(h)))
+    return {(int(t),int(s)):v for (t,s),v in grouped.items()}
+
+# a team-season whose roster fails to fetch this many runs in a row is left
+# out of default runs for COACHES_RETRY_AFTER (it is still fetched when its
+# season is asked for)
+COACHES_MAX_ATTEMPTS = 3
+COACHES_RETRY_AFTER = dt.timedelta(days=7)
+
+def update_coaches(seasons=None,full=False,resume=True,chunk_size=5,write_every=4) -> dict:
     """Update the coaching rosters
     
+    Rosters are fetched a few seasons at a time. The changes are written
+    (CSV, snapshot and store) every `write_every` chunks and at the end,
+    with progress checkpointed in update_state.json. If a run is
+    interrupted, the next call also picks up the team-seasons that weren't
+    written yet. Team-seasons whose roster didn't change are not rewritten
+
+    By default only team-seasons of the season in progress and team-seasons
+    missing from the stored table are fetched. Team-seasons that failed to
+    fetch are retried by the next runs, up to `COACHES_MAX_ATTEMPTS` times
+    (then again once `COACHES_RETRY_AFTER` has passed)
+
     Parameters:
     -----------
-    inplace : bool default True
-        if False, function will simply return the data retrieved from the API 
-        without updating the current CSV file
+    seasons : list[int], optional
+        fetch every team-season of these seasons
+
+    full : bool default False
+        fetch every team-season in teams.csv
+
+    resume : bool default True
+        also fetch the team-seasons left over from an interrupted run
+        (ignored if `seasons`/`full` is given)
+
+    chunk_size : int default 5
+        number of seasons fetched per chunk
+
+    write_every : int default 4
+        number of chunks between writes
+
+    Returns:
+    --------
+    dict : number of team-seasons fetched/written/failed
     """
-    responses = fetch_coaching_roster()
-    df = roster_json_to_df(responses)
-    df.to_csv(COACHES_MASTER_CSV,index=False)
+    state = _load_state('coaches')
+    current = mlbdata._raw_table('coaches')
+    # "team_mlbam-season" -> [failed attempts in a row, time of the last one]
+    attempts = {k:v for k,v in state.get('failed',{}).items() if isinstance(v,list)}
+    now = dt.datetime.now()
+    def gave_up(p):
+        n, last = attempts.get(f'{p[0]}-{p[1]}',(0,None))
+        return n >= COACHES_MAX_ATTEMPTS and now - dt.datetime.fromisoformat(last) < COACHES_RETRY_AFTER
+
+    teams = get_teams_df()
+    all_pairs = list(zip(teams['mlbam'].astype(int),teams['season'].astype(int)))
+    if full:
+        pending = all_pairs
+    elif seasons is not None:
+        seasons = set(int(x) for x in seasons)
+        pending = [p for p in all_pairs if p[1] in seasons]
+    else:
+        stored = set(_coach_groups(current))
+        pending = [p for p in all_pairs if p not in stored or not season_calendar.is_complete(p[1])]
+        if resume:
+            pending += [tuple(p) for p in state.get('pending',[])]
+        pending = [p for p in pending if not gave_up(p)]
+    pending = sorted(set((int(p[0]),int(p[1])) for p in pending),key=lambda p: (-p[1],p[0]))
+
+    summary = {'fetched':0,'written':0,'failed':0}
+    failed = []
+    unwritten = []
+    changed_frames = []
+    chunks = 0
+
+    def flush():
+        nonlocal current
+        if changed_frames:
+            changed = pd.concat(changed_frames,ignore_index=True)
+            # nullable ints keep jersey numbers as "17" rather than "17.0" in the CSV
+            _save(current.astype({'jerseyNumber':'Int64'}),'coaches',COACHES_MASTER_CSV,changed=changed,key=['team_mlbam','season'])
+            changed_frames.clear()
+        unwritten.clear()
+        _save_state('coaches',{'pending':[list(p) for p in pending],
+                               'failed':attempts,
+                               'updated_at':dt.datetime.now().isoformat(timespec='seconds')})
+
+    while pending:
+        chunk_seasons = sorted(set(p[1] for p in pending),reverse=True)[:chunk_size]
+        chunk = [p for p in pending if p[1] in chunk_seasons]
+        rosters, chunk_failed = fetch_coaching_roster(team_seasons=chunk,return_failed=True)
+        chunk_failed = [(int(p[0]),int(p[1])) for p in chunk_failed]
+        failed.extend(chunk_failed)
+        summary['fetched'] += len(rosters)
+        for p in chunk:
+            key = f'{p[0]}-{p[1]}'
+            if p in chunk_failed:
+                attempts[key] = [attempts.get(key,(0,None))[0] + 1,dt.datetime.now().isoformat(timespec='seconds')]
+            else:
+                attempts.pop(key,None)
+
+        if rosters:
+            fetched = roster_json_to_df(rosters).reindex(columns=COACHES_COLUMNS)
+            fetched['jerseyNumber'] = pd.to_numeric(fetched['jerseyNumber'],errors='coerce')
+            fetched = fetched.astype({'season':'int64','person_mlbam':'int64','team_mlbam':'int64'})
+            old_groups = _coach_groups(current)
+            new_groups = _coach_groups(fetched)
+            changed_keys = {k for k,v in new_groups.items() if old_groups.get(k) != v}
+            if changed_keys:
+                key_index = pd.MultiIndex.from_arrays([fetched['team_mlbam'],fetched['season']])
+                changed = fetched[key_index.isin(list(changed_keys))]
+                cur_index = pd.MultiIndex.from_arrays([current['team_mlbam'],current['season']])
+                # changed team-seasons take the place of their old rows; new
+                # ones go at the end
+                first_row = pd.Series(range(len(current)),index=cur_index).groupby(level=[0,1]).min()
+                position = first_row.reindex(key_index[key_index.isin(list(changed_keys))]).fillna(len(current)).to_numpy()
+                keep = ~cur_index.isin(list(changed_keys))
+                order = list(pd.Series(range(len(current)))[keep]) + list(position)
+                current = pd.concat([current[keep],changed],ignore_index=True)
+                current = current.iloc[pd.Series(order).argsort(kind='stable').to_numpy()].reset_index(drop=True)
+                changed_frames.append(changed)
+                summary['written'] += len(changed_keys)
+
+        done = set(chunk)
+        pending = [p for p in pending if p not in done]
+        # fetched but not yet written team-seasons stay in the checkpoint
+        unwritten.extend(p for p in chunk if p not in chunk_failed)
+        chunks += 1
+        if chunks % max(int(write_every),1) == 0:
+            flush()
+        else:
+            _save_state('coaches',{'pending':[list(p) for p in pending + unwritten],
+                                   'failed':attempts,
+                                   'updated_at':dt.datetime.now().isoformat(timespec='seconds')})
+
+    flush()
+    summary['failed'] = len(failed)
+    return summary
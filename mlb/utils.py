@@ -19,6 +19,7 @@ from .constants import (
 )
 
 from .mlbdata import get_season_info
+from .season_calendar import season_calendar
 
 today_date = dt.datetime.today()
 
@@ -57,12 +58,7 @@ def default_season() -> int:
     (Typically either the one that is currently in progress or the last complete season)
 
     """
-    season_info = get_season_info()
-    if season_info["in_progress"] is None:
-        season = season_info["last_completed"]
-    else:
-        season = season_info["in_progress"]
-    return season
+    return season_calendar.default_season()
 
 def compile_codes(*code_lists, output_list=False) -> str:
     all_codes = []